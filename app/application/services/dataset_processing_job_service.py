@@ -0,0 +1,148 @@
+import asyncio
+import logging
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.contracts.services.i_dataset_processing_job_service import IDatasetProcessingJobService
+from app.contracts.services.i_embedding_service import IEmbeddingService
+from app.domain.value_objects.dataset_ingestion_progress import DatasetIngestionProgress
+from app.domain.value_objects.dataset_processing_job import DatasetProcessingJob
+from app.infrastructure.data_access.repository_wrapper import RepositoryWrapper
+
+logger = logging.getLogger(__name__)
+
+
+class DatasetProcessingJobService(IDatasetProcessingJobService):
+    """
+    Runs EmbeddingService over many datasets as background jobs held in memory.
+
+    Each job processes its datasets with its own parallelism, every dataset in its own session,
+    and exposes the progress counters EmbeddingService updates as it downloads, extracts,
+    embeds and upserts. Cancelling a job cancels the running datasets, whose staged chunks are
+    discarded so their previous index stays searchable, and skips the pending ones. Finished
+    jobs are kept for polling until more than retained_jobs have finished.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        service_factory: Callable[[RepositoryWrapper], Awaitable[IEmbeddingService]],
+        default_parallelism: int = 2,
+        max_parallelism: int = 8,
+        retained_jobs: int = 100,
+    ):
+
+        if default_parallelism < 1 or max_parallelism < 1:
+
+            raise ValueError("parallelism must be at least 1")
+
+        self._session_factory = session_factory
+        self._service_factory = service_factory
+        self._default_parallelism = default_parallelism
+        self._max_parallelism = max_parallelism
+        self._retained_jobs = retained_jobs
+        self._jobs: "OrderedDict[str, DatasetProcessingJob]" = OrderedDict()
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def submit(self, dataset_metadata_ids: List[int], parallelism: Optional[int] = None) -> DatasetProcessingJob:
+
+        if not dataset_metadata_ids:
+
+            raise ValueError("At least one datasetMetadataID is required")
+
+        parallelism = min(max(parallelism or self._default_parallelism, 1), self._max_parallelism)
+        job = DatasetProcessingJob(
+            job_id=uuid.uuid4().hex,
+            parallelism=parallelism,
+            datasets=[DatasetIngestionProgress(dataset_metadata_id=i) for i in dict.fromkeys(dataset_metadata_ids)],
+        )
+
+        self._jobs[job.job_id] = job
+        self._tasks[job.job_id] = asyncio.create_task(self._run(job))
+        self._evict_finished()
+        logger.info(f"Queued processing job {job.job_id} for {len(job.datasets)} dataset(s), parallelism {parallelism}")
+
+        return job
+
+    def get(self, job_id: str) -> Optional[DatasetProcessingJob]:
+
+        return self._jobs.get(job_id)
+
+    async def cancel(self, job_id: str) -> Optional[DatasetProcessingJob]:
+
+        job = self._jobs.get(job_id)
+        task = self._tasks.get(job_id)
+
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        return job
+
+    async def close(self) -> None:
+
+        for job_id in list(self._tasks):
+            await self.cancel(job_id)
+
+    def _evict_finished(self) -> None:
+
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+
+        for job_id in finished[: max(len(finished) - self._retained_jobs, 0)]:
+            del self._jobs[job_id]
+
+    async def _run(self, job: DatasetProcessingJob) -> None:
+
+        job.status = DatasetProcessingJob.RUNNING
+        semaphore = asyncio.Semaphore(job.parallelism)
+
+        try:
+            await asyncio.gather(*(self._run_dataset(progress, semaphore) for progress in job.datasets))
+            job.status = DatasetProcessingJob.COMPLETED
+
+        except asyncio.CancelledError:
+            job.status = DatasetProcessingJob.CANCELLED
+            logger.info(f"Processing job {job.job_id} cancelled")
+
+            for progress in job.datasets:
+
+                if not progress.done:
+                    progress.status = DatasetIngestionProgress.CANCELLED
+
+        finally:
+            job.finished_at = datetime.utcnow()
+            self._tasks.pop(job.job_id, None)
+
+    async def _run_dataset(self, progress: DatasetIngestionProgress, semaphore: asyncio.Semaphore) -> None:
+
+        async with semaphore:
+            progress.status = DatasetIngestionProgress.RUNNING
+            progress.started_at = datetime.utcnow()
+
+            try:
+
+                async with self._session_factory() as session:
+                    service = await self._service_factory(RepositoryWrapper(session))
+                    succeeded = await service.process_dataset_heavy_lifting(progress.dataset_metadata_id, progress)
+
+                progress.status = DatasetIngestionProgress.SUCCEEDED if succeeded else DatasetIngestionProgress.FAILED
+
+                if not succeeded:
+                    progress.error = "Dataset not found or not all supporting documents could be processed"
+
+            except asyncio.CancelledError:
+                progress.status = DatasetIngestionProgress.CANCELLED
+
+                raise
+
+            except Exception as e:
+                logger.error(f"Processing dataset {progress.dataset_metadata_id} failed: {e}", exc_info=True)
+                progress.status = DatasetIngestionProgress.FAILED
+                progress.error = str(e)
+
+            finally:
+                progress.finished_at = datetime.utcnow()
@@ -1,14 +1,21 @@
-import io
+import asyncio
 import json
 import logging
 import os
 import zipfile
 from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
+from app.application.services.ingestion_pipeline import IngestionPipeline, StageHandler
+from app.contracts.providers.i_async_document_text_extractor import IAsyncDocumentTextExtractor
 from app.contracts.services.i_embedding_service import IEmbeddingService
 from app.contracts.services.i_semantic_search_service import ISemanticSearchService
+from app.domain.value_objects.dataset_index_version import DatasetIndexVersion
+from app.domain.value_objects.dataset_ingestion_progress import DatasetIngestionProgress
+from app.domain.value_objects.ingestion_chunk import IngestionChunk
 from app.domain.value_objects.metadata_constants import SupportingDocumentConstants
 from app.infrastructure.data_access.repository_wrapper import RepositoryWrapper
+from app.infrastructure.providers.zip_downloader import DownloadedArchive
 
 logger = logging.getLogger(__name__)
 
@@ -20,21 +27,23 @@ class EmbeddingService(IEmbeddingService):
         semantic_search_service: ISemanticSearchService,
         zip_downloader,
         ro_crate_parser,
-        pdf_extractor,
-        word_extractor,
-        rtf_extractor
+        document_extractor: IAsyncDocumentTextExtractor,
+        ingestion_pipeline: Optional[IngestionPipeline] = None
     ):
         self._repo = repository_wrapper
         self._semantic = semantic_search_service
         self._zip_downloader = zip_downloader
         self._ro_crate_parser = ro_crate_parser
-        self._extractors = {
-            ".pdf": pdf_extractor,
-            ".docx": word_extractor,
-            ".rtf": rtf_extractor
-        }
+        self._document_extractor = document_extractor
+        self._pipeline = ingestion_pipeline or IngestionPipeline.for_supporting_documents(
+            extract_concurrency=document_extractor.concurrency
+        )
 
-    async def process_dataset_heavy_lifting(self, dataset_metadata_id: int) -> bool:
+    async def process_dataset_heavy_lifting(
+        self,
+        dataset_metadata_id: int,
+        progress: Optional[DatasetIngestionProgress] = None
+    ) -> bool:
 
         if not dataset_metadata_id:
             
@@ -46,18 +55,67 @@ class EmbeddingService(IEmbeddingService):
             
             return False
 
+        identifier = metadata.file_identifier
+        # New chunks stay hidden until every source of the dataset is indexed, then replace the old version at once
+        dataset_version = DatasetIndexVersion.start(identifier, progress)
+        dataset_version.progress.identifier = identifier
+
+        try:
+            complete = await self._ingest_dataset(dataset_metadata_id, metadata, dataset_version)
+
+        except (Exception, asyncio.CancelledError):
+            await self._discard_dataset_version(dataset_version)
+
+            raise
+
+        if not complete:
+            logger.warning(f"Keeping the previous index of dataset {identifier}: its supporting documents could not be processed")
+            await self._discard_dataset_version(dataset_version)
+
+            return False
+
+        await self._semantic.commit_dataset_version(dataset_version)
+        # A failed archive only keeps its previous chunks; the dataset stays pending so it is retried
+        documents_complete = not dataset_version.failed_archives
+
+        if not documents_complete:
+            logger.warning(
+                f"Committed dataset {identifier} without {len(dataset_version.failed_archives)} failed supporting document zip(s); "
+                f"their previous chunks were kept"
+            )
+
+        queue_item = await self._repo.dataset_supporting_document_queues.get_single(
+            dataset_metadata_id=dataset_metadata_id
+        )
+
+        if queue_item:
+            queue_item.processed_title_for_embedding = True
+            queue_item.processed_abstract_for_embedding = True
+            queue_item.processed_supporting_docs_for_embedding = documents_complete
+            queue_item.last_updated_at = datetime.utcnow()
+            
+            await self._repo.dataset_supporting_document_queues.update(queue_item)
+
+        await self._repo.save_changes()
+        
+        return documents_complete
+
+    async def _ingest_dataset(self, dataset_metadata_id: int, metadata, dataset_version: DatasetIndexVersion) -> bool:
+
         if metadata.title:
             await self._semantic.ingest_text(
                 identifier=metadata.file_identifier,
                 content_type="title",
-                text=metadata.title
+                text=metadata.title,
+                dataset_version=dataset_version
             )
 
         if metadata.description:
             await self._semantic.ingest_text(
                 identifier=metadata.file_identifier,
                 content_type="description",
-                text=metadata.description
+                text=metadata.description,
+                dataset_version=dataset_version
             )
 
         supporting_document_zips = await self._repo.supporting_documents.find_supporting_zips_by_dataset_id(
@@ -66,45 +124,195 @@ class EmbeddingService(IEmbeddingService):
 
         logger.info(f"Processing {len(supporting_document_zips)} supporting document zip(s) for dataset {metadata.file_identifier}")
 
+        download_urls = []
+
         for supporting_document in supporting_document_zips:
             
             if supporting_document.download_url:
-                await self._process_zip_package(supporting_document.download_url, metadata.file_identifier)
+                download_urls.append(supporting_document.download_url)
             else:
                 logger.warning(f"Supporting document {supporting_document.supporting_document_id} has no download URL")
-        
-        queue_item = await self._repo.dataset_supporting_document_queues.get_single(
-            dataset_metadata_id=dataset_metadata_id
-        )
 
-        if queue_item:
-            queue_item.processed_title_for_embedding = True
-            queue_item.processed_abstract_for_embedding = True
-            queue_item.processed_supporting_docs_for_embedding = True
-            queue_item.last_updated_at = datetime.utcnow()
-            
-            await self._repo.dataset_supporting_document_queues.update(queue_item)
+        if not download_urls:
 
-        await self._repo.save_changes()
-        
-        return True
+            return True
+
+        return await self._process_zip_packages(download_urls, metadata.file_identifier, dataset_version)
 
-    async def _process_zip_package(self, download_url: str, identifier: str):
+    async def _discard_dataset_version(self, dataset_version: DatasetIndexVersion):
 
         try:
-            zip_bytes = self._zip_downloader.download(download_url)
-            
-            with zipfile.ZipFile(io.BytesIO(zip_bytes)) as z:
-                ro_crate = self._load_ro_crate(z)
-                
-                supported_files = self._ro_crate_parser.extract_supported_files(ro_crate)
-                logger.info(f"Processing {len(supported_files)} file(s) from zip for identifier: {identifier}")
-                
-                for file_path in supported_files:
-                    await self._extract_and_ingest_file(z, file_path, identifier)
-                    
+            await self._semantic.discard_dataset_version(dataset_version)
+
+        except Exception as ex:
+            # Leftover staged chunks are invisible to searches and get replaced by the next run
+            logger.error(f"Failed discarding staged chunks of dataset {dataset_version.identifier}: {str(ex)}", exc_info=True)
+
+    async def _process_zip_packages(
+        self,
+        download_urls: List[str],
+        identifier: str,
+        dataset_version: Optional[DatasetIndexVersion] = None
+    ) -> bool:
+
+        try:
+            await self._pipeline.run(
+                download_urls,
+                self._supporting_document_stages(identifier, dataset_version),
+                on_discard=self._discard_queued_item
+            )
+
+            return True
+
         except Exception as ex:
-            logger.error(f"Failed processing supporting document zip from {download_url}: {str(ex)}", exc_info=True)
+            logger.error(f"Failed processing supporting document zips of {identifier}: {str(ex)}", exc_info=True)
+
+            return False
+
+    def _supporting_document_stages(
+        self,
+        identifier: str,
+        dataset_version: Optional[DatasetIndexVersion] = None
+    ) -> Dict[str, StageHandler]:
+
+        progress = dataset_version.progress if dataset_version is not None else None
+
+        async def archive_failed(download_url: str, archive_hash: Optional[str], error: Exception) -> None:
+
+            # Outside a re-indexing run there is no previous version to fall back on
+            if dataset_version is None:
+
+                raise error
+
+            logger.error(
+                f"Failed processing supporting document zip {download_url} of {identifier}, keeping its previous chunks: {str(error)}",
+                exc_info=error
+            )
+            await self._semantic.fail_archive(dataset_version, download_url, archive_hash)
+
+        def has_failed(download_url: str) -> bool:
+
+            return dataset_version is not None and download_url in dataset_version.failed_archives
+
+        async def fetch(download_url: str) -> Optional[Tuple[str, DownloadedArchive]]:
+
+            try:
+                archive = await self._zip_downloader.download(download_url)
+
+            except Exception as ex:
+                await archive_failed(download_url, None, ex)
+
+                return None
+
+            if progress is not None and not archive.from_cache:
+                progress.bytes_downloaded += archive.size
+
+            # An archive whose chunks are all indexed already is kept as is, without extracting or embedding it
+            if (
+                dataset_version is not None
+                and archive.content_hash
+                and await self._semantic.retain_archive(dataset_version, archive.content_hash)
+            ):
+                archive.close()
+                logger.info(f"Supporting document zip {download_url} of {identifier} is unchanged, keeping its indexed chunks")
+
+                return None
+
+            return download_url, archive
+
+        async def unzip(fetched: Tuple[str, DownloadedArchive]):
+
+            download_url, archive = fetched
+
+            try:
+
+                with archive, archive.open_zip() as z:
+                    ro_crate = self._load_ro_crate(z)
+                    supported_files = self._ro_crate_parser.extract_supported_files(ro_crate)
+                    logger.info(f"Processing {len(supported_files)} file(s) from zip for identifier: {identifier}")
+                    names = set(z.namelist())
+
+                    for file_path in supported_files:
+                        extension = os.path.splitext(file_path)[1].lower()
+
+                        if has_failed(download_url):
+
+                            return
+
+                        if self._document_extractor.supports(extension) and file_path in names:
+                            file_content = await asyncio.to_thread(z.read, file_path)
+
+                            yield download_url, file_path, extension, file_content, archive.content_hash
+
+            except Exception as ex:
+                await archive_failed(download_url, archive.content_hash, ex)
+
+        async def extract(member: Tuple[str, str, str, bytes, Optional[str]]) -> Optional[Tuple[str, str, List[str], Optional[str]]]:
+
+            download_url, file_path, extension, file_content, archive_hash = member
+
+            if has_failed(download_url):
+
+                return None
+
+            try:
+                segments = await self._document_extractor.extract_segments(extension, file_content)
+
+            except Exception as ex:
+                await archive_failed(download_url, archive_hash, ex)
+
+                return None
+
+            return (download_url, file_path, segments, archive_hash) if segments else None
+
+        async def chunk(document: Tuple[str, str, List[str], Optional[str]]):
+
+            download_url, file_path, segments, archive_hash = document
+            queued = 0
+
+            # Chunks leave a window at a time, so a long document never has all its chunks prepared at once
+            async for pending in self._semantic.iter_document_chunks(
+                identifier=identifier,
+                segments=segments,
+                source_file=file_path,
+                dataset_version=dataset_version,
+                archive_hash=archive_hash,
+                archive_url=download_url
+            ):
+                queued += len(pending)
+
+                for ingestion_chunk in pending:
+                    yield ingestion_chunk
+
+            logger.info(f"Chunked document: {file_path} ({len(segments)} segment(s), {queued} chunk(s) to embed)")
+
+            if progress is not None:
+                progress.files_extracted += 1
+
+        async def embed(chunks: List[IngestionChunk]) -> Tuple[List[IngestionChunk], List[List[float]]]:
+
+            return chunks, await self._semantic.embed_chunks(chunks, dataset_version)
+
+        async def upsert(batch: Tuple[List[IngestionChunk], List[List[float]]]) -> None:
+
+            chunks, embeddings = batch
+            await self._semantic.index_chunks(chunks, embeddings, dataset_version)
+
+        return {
+            IngestionPipeline.FETCH: fetch,
+            IngestionPipeline.UNZIP: unzip,
+            IngestionPipeline.EXTRACT: extract,
+            IngestionPipeline.CHUNK: chunk,
+            IngestionPipeline.EMBED: embed,
+            IngestionPipeline.UPSERT: upsert,
+        }
+
+    @staticmethod
+    def _discard_queued_item(stage_name: str, item) -> None:
+
+        # Archives fetched ahead of a failed run still hold their temporary file
+        if isinstance(item, tuple) and len(item) == 2 and isinstance(item[1], DownloadedArchive):
+            item[1].close()
 
     def _load_ro_crate(self, z: zipfile.ZipFile) -> dict:
 
@@ -113,24 +321,3 @@ class EmbeddingService(IEmbeddingService):
             
         with z.open(SupportingDocumentConstants.RO_CRATE_METADATA_FILE) as f:
             return json.load(f)
-
-    async def _extract_and_ingest_file(self, z: zipfile.ZipFile, file_path: str, identifier: str):
-
-        extension = os.path.splitext(file_path)[1].lower()
-        extractor = self._extractors.get(extension)
-        
-        if not extractor or file_path not in z.namelist():
-            return
-            
-        file_content = z.read(file_path)
-        text = extractor.extract_text(file_content)
-        
-        if text:
-            await self._semantic.ingest_text(
-                identifier=identifier,
-                content_type="document",
-                text=text,
-                source_file=file_path
-            )
-            logger.info(f"Indexed document: {file_path} ({len(text)} chars)")
-
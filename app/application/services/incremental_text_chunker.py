@@ -0,0 +1,92 @@
+from typing import Iterable, Iterator, List
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+
+class IncrementalTextChunker:
+    """
+    Splits a document arriving as segments (PDF pages, DOCX paragraphs) into overlapping chunks like
+    splitting its full text would, without ever holding more than a window of it.
+
+    Segments are joined with newlines into a buffer; once it reaches window_size characters it is
+    split and every chunk but the last is emitted. The last chunk, which already starts with the
+    overlap of the one before it, becomes the start of the next buffer, so chunks keep their overlap
+    across segment and window boundaries.
+    """
+
+    def __init__(self, chunk_size: int = 500, chunk_overlap: int = 50, window_size: int = 8000):
+
+        if window_size < 2 * chunk_size:
+
+            raise ValueError("window_size must hold at least two chunks")
+
+        self._splitter = RecursiveCharacterTextSplitter(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            length_function=len,
+        )
+        self._window_size = window_size
+        self._parts: List[str] = []
+        self._length = 0
+
+    def feed(self, segment: str) -> List[str]:
+        """
+        Summary: Adds the next segment and returns the chunks it completed.
+
+        Args:
+            segment (str): Next piece of the document's text.
+
+        Returns:
+            List[str]: Completed chunks, in document order; empty until a window fills up.
+        """
+
+        if not segment:
+
+            return []
+
+        self._parts.append(segment)
+        self._length += len(segment) + 1
+
+        if self._length < self._window_size:
+
+            return []
+
+        chunks = self._splitter.split_text("\n".join(self._parts))
+
+        if len(chunks) < 2:
+            self._parts = chunks
+            self._length = sum(len(chunk) + 1 for chunk in chunks)
+
+            return []
+
+        self._parts = [chunks[-1]]
+        self._length = len(chunks[-1]) + 1
+
+        return chunks[:-1]
+
+    def finish(self) -> List[str]:
+        """
+        Summary: Returns the chunks of whatever is still buffered and resets the chunker.
+        """
+
+        text = "\n".join(self._parts).strip()
+        self._parts = []
+        self._length = 0
+
+        return self._splitter.split_text(text) if text else []
+
+    def split(self, segments: Iterable[str]) -> Iterator[List[str]]:
+        """
+        Summary: Yields the chunks of a sequence of segments, one list per filled window plus the remainder.
+        """
+
+        for segment in segments:
+            chunks = self.feed(segment)
+
+            if chunks:
+                yield chunks
+
+        chunks = self.finish()
+
+        if chunks:
+            yield chunks
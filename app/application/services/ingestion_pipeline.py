@@ -0,0 +1,326 @@
+import asyncio
+import inspect
+import logging
+import time
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+StageHandler = Callable[[Any], Union[AsyncIterator[Any], Awaitable[Any]]]
+
+_END = object()
+
+
+@dataclass
+class PipelineStage:
+    name: str
+    concurrency: int = 1
+    batch_size: int = 1
+
+
+@dataclass
+class PipelineStageStats:
+    name: str
+    concurrency: int
+    batch_size: int
+    queue_capacity: int
+    queue_depth: int
+    items_in: int
+    items_out: int
+    busy_seconds: float
+    blocked_seconds: float
+
+    @property
+    def items_per_second(self) -> float:
+        """Items produced per second a worker spent in the stage, excluding time blocked on the next queue."""
+
+        return self.items_out / self.busy_seconds if self.busy_seconds else 0.0
+
+
+@dataclass
+class IngestionPipelineStats:
+    runs: int
+    active_runs: int
+    failed_runs: int
+    stages: List[PipelineStageStats]
+
+
+class _StageMetrics:
+
+    def __init__(self):
+
+        self.items_in = 0
+        self.items_out = 0
+        self.busy_seconds = 0.0
+        self.blocked_seconds = 0.0
+        self.queued = 0
+
+
+class _PipelineRun:
+
+    def __init__(self, stages: List[PipelineStage], metrics: List[_StageMetrics], queue_size: int):
+
+        self.stages = stages
+        self.metrics = metrics
+        self.queues = [asyncio.Queue(queue_size) for _ in stages]
+        self.queued = [0] * len(stages)
+        self.remaining_workers = [stage.concurrency for stage in stages]
+
+    async def put(self, index: int, item: Any) -> None:
+
+        if index == len(self.stages):
+
+            return
+
+        await self.queues[index].put(item)
+        self.queued[index] += 1
+        self.metrics[index].queued += 1
+
+    async def close(self, index: int) -> None:
+
+        if index < len(self.stages):
+
+            for _ in range(self.stages[index].concurrency):
+                await self.queues[index].put(_END)
+
+    async def take(self, index: int, batch_size: int) -> Tuple[List[Any], bool]:
+
+        batch: List[Any] = []
+
+        while len(batch) < batch_size:
+            item = await self.queues[index].get()
+
+            if item is _END:
+
+                return batch, True
+
+            self.queued[index] -= 1
+            self.metrics[index].queued -= 1
+            batch.append(item)
+
+        return batch, False
+
+    def drain(self) -> List[Tuple[str, Any]]:
+
+        left = []
+
+        for index, queue in enumerate(self.queues):
+
+            while not queue.empty():
+                item = queue.get_nowait()
+
+                if item is not _END:
+                    left.append((self.stages[index].name, item))
+
+            self.metrics[index].queued -= self.queued[index]
+            self.queued[index] = 0
+
+        return left
+
+
+class IngestionPipeline:
+    """
+    Runs ingestion as a chain of stages joined by bounded queues, so downloading, extraction,
+    embedding and upserting of one dataset overlap instead of taking turns.
+
+    Each stage has its own number of workers and hands items to the next through a queue of
+    queue_size; a full queue blocks the producing stage, so a slow stage throttles the ones
+    before it instead of letting work pile up in memory. Handlers are coroutines, whose result
+    is passed on unless it is None, or async generators, so a stage can fan out (an archive
+    yields its files, a file its chunks); stages with a batch_size receive lists of up to that
+    many items. Stage counters accumulate over all runs and are exposed through stats for tuning.
+    """
+
+    FETCH = "fetch"
+    UNZIP = "unzip"
+    EXTRACT = "extract"
+    CHUNK = "chunk"
+    EMBED = "embed"
+    UPSERT = "upsert"
+
+    def __init__(self, stages: List[PipelineStage], queue_size: int = 8):
+
+        if not stages or queue_size < 1:
+
+            raise ValueError("a pipeline needs at least one stage and a queue_size of at least 1")
+
+        if any(stage.concurrency < 1 or stage.batch_size < 1 for stage in stages):
+
+            raise ValueError("stage concurrency and batch_size must be at least 1")
+
+        self._stages = stages
+        self._queue_size = queue_size
+        self._metrics = [_StageMetrics() for _ in stages]
+        self._runs = 0
+        self._active_runs = 0
+        self._failed_runs = 0
+
+    @classmethod
+    def for_supporting_documents(
+        cls,
+        fetch_concurrency: int = 2,
+        unzip_concurrency: int = 1,
+        extract_concurrency: int = 2,
+        chunk_concurrency: int = 2,
+        embed_concurrency: int = 2,
+        upsert_concurrency: int = 2,
+        embed_batch_size: int = 64,
+        queue_size: int = 8,
+    ) -> "IngestionPipeline":
+
+        return cls(
+            [
+                PipelineStage(cls.FETCH, fetch_concurrency),
+                PipelineStage(cls.UNZIP, unzip_concurrency),
+                PipelineStage(cls.EXTRACT, extract_concurrency),
+                PipelineStage(cls.CHUNK, chunk_concurrency),
+                PipelineStage(cls.EMBED, embed_concurrency, embed_batch_size),
+                PipelineStage(cls.UPSERT, upsert_concurrency),
+            ],
+            queue_size=queue_size,
+        )
+
+    @property
+    def stats(self) -> IngestionPipelineStats:
+
+        return IngestionPipelineStats(
+            runs=self._runs,
+            active_runs=self._active_runs,
+            failed_runs=self._failed_runs,
+            stages=[
+                PipelineStageStats(
+                    name=stage.name,
+                    concurrency=stage.concurrency,
+                    batch_size=stage.batch_size,
+                    queue_capacity=self._queue_size,
+                    queue_depth=metrics.queued,
+                    items_in=metrics.items_in,
+                    items_out=metrics.items_out,
+                    busy_seconds=metrics.busy_seconds,
+                    blocked_seconds=metrics.blocked_seconds,
+                )
+                for stage, metrics in zip(self._stages, self._metrics)
+            ],
+        )
+
+    async def run(
+        self,
+        items: Iterable[Any],
+        handlers: Dict[str, StageHandler],
+        on_discard: Optional[Callable[[str, Any], None]] = None,
+    ) -> None:
+        """
+        Summary: Feeds items through every stage and returns once the last stage has drained.
+
+        Args:
+            items (Iterable[Any]): Inputs of the first stage.
+            handlers (Dict[str, StageHandler]): Coroutine or async generator function per stage name.
+            on_discard (Optional[Callable[[str, Any], None]]): Called with the stage name and item for
+                every item still queued when a run fails, e.g. to close downloaded archives.
+
+        Raises:
+            Exception: The first error raised by a handler; the remaining work is cancelled.
+        """
+
+        missing = [stage.name for stage in self._stages if stage.name not in handlers]
+
+        if missing:
+
+            raise ValueError(f"No handler for pipeline stage(s): {', '.join(missing)}")
+
+        run = _PipelineRun(self._stages, self._metrics, self._queue_size)
+        tasks = [asyncio.create_task(self._feed(run, items))]
+
+        for index, stage in enumerate(self._stages):
+            tasks.extend(
+                asyncio.create_task(self._work(run, index, handlers[stage.name]))
+                for _ in range(stage.concurrency)
+            )
+
+        self._runs += 1
+        self._active_runs += 1
+
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            failed = next((task for task in done if not task.cancelled() and task.exception() is not None), None)
+
+            if failed is not None:
+
+                raise failed.exception()
+
+        except BaseException:
+            self._failed_runs += 1
+
+            raise
+
+        finally:
+
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._active_runs -= 1
+
+            for stage_name, item in run.drain():
+
+                if on_discard is not None:
+                    on_discard(stage_name, item)
+
+    async def _feed(self, run: _PipelineRun, items: Iterable[Any]) -> None:
+
+        for item in items:
+            await run.put(0, item)
+
+        await run.close(0)
+
+    async def _emit(self, run: _PipelineRun, index: int, output: Any) -> float:
+
+        self._metrics[index].items_out += 1
+        started = time.perf_counter()
+        await run.put(index + 1, output)
+
+        # Time spent waiting for room in the next queue is backpressure, not work of this stage
+        return time.perf_counter() - started
+
+    async def _work(self, run: _PipelineRun, index: int, handler: StageHandler) -> None:
+
+        stage = self._stages[index]
+        metrics = self._metrics[index]
+        finished = False
+
+        while not finished:
+            batch, finished = await run.take(index, stage.batch_size)
+
+            if not batch:
+
+                continue
+
+            metrics.items_in += len(batch)
+            started = time.perf_counter()
+            blocked = 0.0
+
+            outputs = handler(batch if stage.batch_size > 1 else batch[0])
+
+            if inspect.isasyncgen(outputs):
+
+                async with aclosing(outputs):
+
+                    async for output in outputs:
+                        blocked += await self._emit(run, index, output)
+
+            else:
+                output = await outputs
+
+                if output is not None:
+                    blocked += await self._emit(run, index, output)
+
+            metrics.busy_seconds += time.perf_counter() - started - blocked
+            metrics.blocked_seconds += blocked
+
+        run.remaining_workers[index] -= 1
+
+        # The last worker of a stage to finish tells the next stage no more items are coming
+        if run.remaining_workers[index] == 0:
+            await run.close(index + 1)
@@ -0,0 +1,38 @@
+from app.application.services.ingestion_pipeline import IngestionPipeline
+from app.contracts.dtos.embedding_dtos import IngestionPipelineStatsResponse, PipelineStageStatsDto
+from app.contracts.services.i_ingestion_pipeline_stats_service import IIngestionPipelineStatsService
+
+
+class IngestionPipelineStatsService(IIngestionPipelineStatsService):
+    """
+    Reads the counters of the ingestion pipeline shared by all dataset ingestions.
+    """
+
+    def __init__(self, pipeline: IngestionPipeline):
+
+        self._pipeline = pipeline
+
+    def get_stats(self) -> IngestionPipelineStatsResponse:
+
+        stats = self._pipeline.stats
+
+        return IngestionPipelineStatsResponse(
+            runs=stats.runs,
+            activeRuns=stats.active_runs,
+            failedRuns=stats.failed_runs,
+            stages=[
+                PipelineStageStatsDto(
+                    name=stage.name,
+                    concurrency=stage.concurrency,
+                    batchSize=stage.batch_size,
+                    queueCapacity=stage.queue_capacity,
+                    queueDepth=stage.queue_depth,
+                    itemsIn=stage.items_in,
+                    itemsOut=stage.items_out,
+                    busySeconds=round(stage.busy_seconds, 3),
+                    blockedSeconds=round(stage.blocked_seconds, 3),
+                    itemsPerSecond=round(stage.items_per_second, 2),
+                )
+                for stage in stats.stages
+            ]
+        )
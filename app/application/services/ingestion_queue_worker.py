@@ -0,0 +1,234 @@
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.contracts.services.i_embedding_service import IEmbeddingService
+from app.domain.entities.ingestion_lease import IngestionLease
+from app.infrastructure.data_access.repository_wrapper import RepositoryWrapper
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IngestionWorkerStats:
+    owner: str
+    claimed: int
+    succeeded: int
+    failed: int
+    recovered: int
+    leases_lost: int
+    in_flight: int
+    concurrency: int
+
+
+class IngestionQueueWorker:
+    """
+    Drains DatasetSupportingDocumentQueue in the background.
+
+    Pending rows are claimed in batches by flagging IsProcessing with one conditional UPDATE and
+    recording a lease (owner + expiry) in IngestionLeases, so any number of worker processes can
+    share the queue. At most `concurrency` datasets run at once and only free slots are claimed,
+    so no lease waits on a semaphore. Leases are renewed every lease_seconds / 3 while datasets
+    run; rows whose lease expired (a crashed worker) are returned to the pool on every poll. A
+    failed dataset keeps its lease for retry_seconds before another attempt.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        service_factory: Callable[[RepositoryWrapper], Awaitable[IEmbeddingService]],
+        concurrency: int = 2,
+        lease_seconds: float = 300.0,
+        poll_interval_seconds: float = 10.0,
+        retry_seconds: float = 900.0,
+        owner: Optional[str] = None,
+    ):
+
+        if concurrency < 1 or lease_seconds <= 0:
+
+            raise ValueError("concurrency must be at least 1 and lease_seconds positive")
+
+        self._session_factory = session_factory
+        self._service_factory = service_factory
+        self._concurrency = concurrency
+        self._lease_seconds = lease_seconds
+        self._poll_interval_seconds = poll_interval_seconds
+        self._retry_seconds = retry_seconds
+        self._owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._in_flight: Dict[int, asyncio.Task] = {}
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._claimed = 0
+        self._succeeded = 0
+        self._failed = 0
+        self._recovered = 0
+        self._leases_lost = 0
+
+    @property
+    def stats(self) -> IngestionWorkerStats:
+
+        return IngestionWorkerStats(
+            owner=self._owner,
+            claimed=self._claimed,
+            succeeded=self._succeeded,
+            failed=self._failed,
+            recovered=self._recovered,
+            leases_lost=self._leases_lost,
+            in_flight=len(self._in_flight),
+            concurrency=self._concurrency,
+        )
+
+    async def initialize(self) -> None:
+        """
+        Summary: Creates the IngestionLeases table if the shared database does not have it yet.
+        """
+
+        async with self._session_factory() as session:
+            await session.run_sync(lambda s: IngestionLease.__table__.create(s.connection(), checkfirst=True))
+            await session.commit()
+
+    def start(self) -> None:
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            self._heartbeat = asyncio.create_task(self._heartbeat_loop())
+
+    async def stop(self) -> None:
+        """
+        Summary: Stops claiming and cancels running datasets; their leases expire and another worker picks them up.
+        """
+
+        tasks = [t for t in (self._task, self._heartbeat, *self._in_flight.values()) if t is not None]
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._heartbeat = None
+        self._in_flight.clear()
+
+    async def run_once(self) -> int:
+        """
+        Summary: Recovers expired leases and claims as many pending rows as there are free slots.
+
+        Returns:
+            int: Number of rows claimed and started.
+        """
+
+        free_slots = self._concurrency - len(self._in_flight)
+
+        async with self._session_factory() as session:
+            queue = RepositoryWrapper(session).dataset_supporting_document_queues
+            recovered = await queue.recover_expired_leases()
+            claimed = await queue.claim_pending_queue_items(self._owner, free_slots, self._lease_seconds) if free_slots > 0 else []
+            await session.commit()
+
+        if recovered:
+            self._recovered += recovered
+            logger.warning(f"Recovered {recovered} queue item(s) whose ingestion lease expired")
+
+        for item in claimed:
+            queue_item_id = item.dataset_supporting_document_queue_id
+            task = asyncio.create_task(self._process(queue_item_id, item.dataset_metadata_id))
+            self._in_flight[queue_item_id] = task
+            task.add_done_callback(lambda _, queue_item_id=queue_item_id: self._finished(queue_item_id))
+
+        self._claimed += len(claimed)
+
+        return len(claimed)
+
+    def _finished(self, queue_item_id: int) -> None:
+
+        self._in_flight.pop(queue_item_id, None)
+        # A freed slot is refilled right away instead of after the poll interval
+        self._wake.set()
+
+    async def _run(self) -> None:
+
+        while True:
+
+            try:
+                claimed = await self.run_once()
+
+                if claimed:
+                    logger.info(f"Ingestion worker {self._owner} claimed {claimed} queue item(s)")
+
+            except asyncio.CancelledError:
+
+                raise
+
+            except Exception as e:
+                logger.warning(f"Ingestion worker poll failed: {e}")
+
+            self._wake.clear()
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), self._poll_interval_seconds)
+
+            except asyncio.TimeoutError:
+                pass
+
+    async def _process(self, queue_item_id: int, dataset_metadata_id: int) -> None:
+
+        try:
+            async with self._session_factory() as session:
+                service = await self._service_factory(RepositoryWrapper(session))
+                succeeded = await service.process_dataset_heavy_lifting(dataset_metadata_id)
+
+        except asyncio.CancelledError:
+
+            raise
+
+        except Exception as e:
+            logger.error(f"Ingestion of dataset {dataset_metadata_id} failed: {e}", exc_info=True)
+            succeeded = False
+
+        async with self._session_factory() as session:
+            queue = RepositoryWrapper(session).dataset_supporting_document_queues
+
+            if succeeded:
+                self._succeeded += 1
+                held = await queue.release_queue_item(self._owner, queue_item_id)
+            else:
+                # Keeping the lease until it expires backs off the retry instead of reclaiming it on the next poll
+                self._failed += 1
+                held = await queue.renew_leases(self._owner, [queue_item_id], self._retry_seconds) == 1
+
+            await session.commit()
+
+        if not held:
+            self._leases_lost += 1
+            logger.warning(f"Lease on queue item {queue_item_id} was recovered by another worker before it finished")
+
+    async def _heartbeat_loop(self) -> None:
+
+        while True:
+            await asyncio.sleep(self._lease_seconds / 3)
+
+            queue_item_ids = list(self._in_flight)
+
+            if not queue_item_ids:
+
+                continue
+
+            try:
+
+                async with self._session_factory() as session:
+                    renewed = await RepositoryWrapper(session).dataset_supporting_document_queues.renew_leases(
+                        self._owner, queue_item_ids, self._lease_seconds
+                    )
+                    await session.commit()
+
+                if renewed < len(queue_item_ids):
+                    logger.warning(f"Only {renewed} of {len(queue_item_ids)} ingestion lease(s) could be renewed")
+
+            except Exception as e:
+                logger.warning(f"Ingestion lease heartbeat failed: {e}")
@@ -0,0 +1,98 @@
+from typing import TYPE_CHECKING, Optional
+
+from app.contracts.dtos.search_dtos import (
+    DatasetMetadataCacheStatsDto,
+    EmbeddingBatcherStatsDto,
+    EmbeddingCacheStatsDto,
+    EmbeddingDiskCacheStatsDto,
+    SearchResultCacheStatsDto,
+    SearchStatsResponse,
+)
+from app.contracts.services.i_search_stats_service import ISearchStatsService
+
+if TYPE_CHECKING:
+    from app.infrastructure.caching.dataset_metadata_cache import DatasetMetadataCache
+    from app.infrastructure.caching.embedding_disk_cache import EmbeddingDiskCache
+    from app.infrastructure.caching.search_result_cache import SearchResultCache
+    from app.infrastructure.providers.batching_embedding_provider import BatchingEmbeddingProvider
+    from app.infrastructure.providers.cached_embedding_provider import CachedEmbeddingProvider
+
+
+class SearchStatsService(ISearchStatsService):
+    """
+    Reads the counters of the process-wide caches and the embedding batcher behind search.
+    """
+
+    def __init__(
+        self,
+        embedding_cache: "CachedEmbeddingProvider",
+        embedding_batcher: "BatchingEmbeddingProvider",
+        result_cache: "SearchResultCache",
+        metadata_cache: "DatasetMetadataCache",
+        embedding_disk_cache: Optional["EmbeddingDiskCache"] = None
+    ):
+
+        self._embedding_cache = embedding_cache
+        self._embedding_batcher = embedding_batcher
+        self._result_cache = result_cache
+        self._metadata_cache = metadata_cache
+        self._embedding_disk_cache = embedding_disk_cache
+
+    def get_stats(self) -> SearchStatsResponse:
+
+        stats = self._embedding_cache.stats
+        batcher_stats = self._embedding_batcher.stats
+        disk_stats = self._embedding_disk_cache.stats if self._embedding_disk_cache is not None else None
+        result_stats = self._result_cache.stats
+        metadata_stats = self._metadata_cache.stats
+
+        return SearchStatsResponse(
+            embedding_cache=EmbeddingCacheStatsDto(
+                hits=stats.hits,
+                misses=stats.misses,
+                evictions=stats.evictions,
+                size=stats.size,
+                max_size=stats.max_size,
+                ttl_seconds=stats.ttl_seconds,
+                hit_ratio=stats.hit_ratio
+            ),
+            embedding_batcher=EmbeddingBatcherStatsDto(
+                requests=batcher_stats.requests,
+                batches=batcher_stats.batches,
+                rejected=batcher_stats.rejected,
+                queue_depth=batcher_stats.queue_depth,
+                largest_batch=batcher_stats.largest_batch,
+                average_batch_size=batcher_stats.average_batch_size,
+                max_batch_size=batcher_stats.max_batch_size,
+                max_wait_ms=batcher_stats.max_wait_ms,
+                max_queue_depth=batcher_stats.max_queue_depth
+            ),
+            embedding_disk_cache=EmbeddingDiskCacheStatsDto(
+                hits=disk_stats.hits,
+                misses=disk_stats.misses,
+                writes=disk_stats.writes,
+                evictions=disk_stats.evictions,
+                size=disk_stats.size,
+                max_entries=disk_stats.max_entries,
+                hit_ratio=disk_stats.hit_ratio
+            ) if disk_stats is not None else None,
+            result_cache=SearchResultCacheStatsDto(
+                hits=result_stats.hits,
+                misses=result_stats.misses,
+                invalidations=result_stats.invalidations,
+                size=result_stats.size,
+                max_size=result_stats.max_size,
+                ttl_seconds=result_stats.ttl_seconds,
+                hit_ratio=result_stats.hit_ratio
+            ),
+            metadata_cache=DatasetMetadataCacheStatsDto(
+                size=metadata_stats.size,
+                hits=metadata_stats.hits,
+                misses=metadata_stats.misses,
+                refreshes=metadata_stats.refreshes,
+                refresh_failures=metadata_stats.refresh_failures,
+                watermark=metadata_stats.watermark,
+                last_refreshed_at=metadata_stats.last_refreshed_at,
+                staleness_seconds=metadata_stats.staleness_seconds
+            )
+        )
@@ -0,0 +1,56 @@
+from typing import Dict, Iterable, Protocol
+
+from app.domain.value_objects.dataset_summary import DatasetSummary
+
+
+class IDatasetMetadataCache(Protocol):
+    """
+    Interface for in-memory maps of dataset identifier -> display metadata used on the search path.
+    """
+
+    def get_many(self, identifiers: Iterable[str]) -> Dict[str, DatasetSummary]:
+        """
+        Looks up the summaries of several datasets without touching the database.
+
+        Args:
+            identifiers (Iterable[str]): Dataset file identifiers.
+
+        Returns:
+            Dict[str, DatasetSummary]: Summaries of the identifiers present in the cache.
+        """
+        ...
+
+    async def load_missing(self, identifiers: Iterable[str]) -> Dict[str, DatasetSummary]:
+        """
+        Reads the summaries of datasets the cache has not seen yet (e.g. ingested by another process
+        since the last refresh) from the database and adds them to the cache.
+
+        Args:
+            identifiers (Iterable[str]): Dataset file identifiers missing from the cache.
+
+        Returns:
+            Dict[str, DatasetSummary]: Summaries of the identifiers found in the database.
+        """
+        ...
+
+    def note_title(self, identifier: str, title: str) -> None:
+        """
+        Records a title seen during ingestion ahead of the next refresh.
+
+        Args:
+            identifier (str): Dataset file identifier.
+            title (str): The dataset title.
+        """
+        ...
+
+    async def refresh(self, full: bool = False) -> int:
+        """
+        Loads rows created or updated since the last refresh.
+
+        Args:
+            full (bool): Reload every row, dropping datasets that no longer exist.
+
+        Returns:
+            int: Number of rows loaded.
+        """
+        ...
@@ -0,0 +1,83 @@
+from typing import Hashable, List, Optional, Protocol
+
+from app.domain.value_objects.search_result import SearchResult
+
+
+class ISearchResultCache(Protocol):
+    """
+    Interface for caches holding fully grouped and sorted semantic search results.
+    """
+
+    def make_key(
+        self,
+        query_text: str,
+        min_score: float,
+        content_types: Optional[List[str]] = None,
+        file_extensions: Optional[List[str]] = None,
+        mode: str = "vector",
+        rerank: bool = False
+    ) -> Hashable:
+        """
+        Builds the cache key for a search.
+
+        Args:
+            query_text (str): The raw query text.
+            min_score (float): The effective similarity threshold.
+            content_types (Optional[List[str]]): Content type filter applied to the search.
+            file_extensions (Optional[List[str]]): Source file extension filter applied to the search.
+            mode (str): Retrieval mode of the search ('vector' or 'hybrid').
+            rerank (bool): Whether the results were re-ranked.
+
+        Returns:
+            Hashable: The cache key.
+        """
+        ...
+
+    def get(self, key: Hashable) -> Optional[List[SearchResult]]:
+        """
+        Retrieves the grouped results for a key.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            Optional[List[SearchResult]]: The cached results, or None on a miss.
+        """
+        ...
+
+    def put(
+        self,
+        key: Hashable,
+        results: List[SearchResult],
+        query_embedding: List[float]
+    ) -> None:
+        """
+        Stores the grouped results for a key.
+
+        Args:
+            key (Hashable): The cache key.
+            results (List[SearchResult]): Grouped results sorted by descending score.
+            query_embedding (List[float]): The query vector, used to detect new matches on ingest.
+        """
+        ...
+
+    def invalidate_identifier(
+        self,
+        identifier: str,
+        content_type: Optional[str] = None,
+        embeddings: Optional[List[List[float]]] = None,
+        file_extension: Optional[str] = None
+    ) -> int:
+        """
+        Drops entries affected by a change to an identifier.
+
+        Args:
+            identifier (str): The dataset identifier that was ingested or deleted.
+            content_type (Optional[str]): Content type of the ingested text, if any.
+            embeddings (Optional[List[List[float]]]): Newly indexed vectors, if any.
+            file_extension (Optional[str]): Source file extension of the ingested text, if any.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        ...
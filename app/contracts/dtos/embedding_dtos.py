@@ -1,3 +1,6 @@
+from datetime import datetime
+from typing import List, Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -16,3 +19,54 @@ class IngestMetadataRequest(BaseModel):
 class ProcessDatasetRequest(BaseModel):
     datasetMetadataID: int
 
+
+
+class ProcessDatasetsJobRequest(BaseModel):
+    datasetMetadataIDs: List[int] = Field(..., min_length=1, max_length=1000)
+    parallelism: Optional[int] = Field(default=None, ge=1) # Datasets processed at once; capped by PROCESSING_JOB_MAX_PARALLELISM
+
+
+class DatasetProgressDto(BaseModel):
+    datasetMetadataID: int
+    identifier: Optional[str] = None
+    status: str # pending, running, succeeded, failed or cancelled
+    bytesDownloaded: int
+    filesExtracted: int
+    chunksEmbedded: int
+    chunksUnchanged: int # already indexed, not embedded again
+    pointsUpserted: int
+    archivesFailed: int = 0 # supporting-document zips that could not be processed; their previous chunks were kept
+    error: Optional[str] = None
+    startedAt: Optional[datetime] = None
+    finishedAt: Optional[datetime] = None
+
+
+class ProcessingJobResponse(BaseModel):
+    jobId: str
+    status: str # queued, running, completed or cancelled
+    parallelism: int
+    createdAt: datetime
+    finishedAt: Optional[datetime] = None
+    succeeded: int
+    failed: int
+    datasets: List[DatasetProgressDto]
+
+
+class PipelineStageStatsDto(BaseModel):
+    name: str
+    concurrency: int
+    batchSize: int
+    queueCapacity: int
+    queueDepth: int # items waiting for this stage across running ingestions
+    itemsIn: int
+    itemsOut: int
+    busySeconds: float
+    blockedSeconds: float # time spent waiting for room in the next stage's queue
+    itemsPerSecond: float # per busy worker
+
+
+class IngestionPipelineStatsResponse(BaseModel):
+    runs: int
+    activeRuns: int
+    failedRuns: int
+    stages: List[PipelineStageStatsDto]
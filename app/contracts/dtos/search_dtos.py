@@ -1,4 +1,5 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -17,14 +18,36 @@ class SearchResponse(BaseModel):
     total_count: int
     limit: int
     offset: int
+    timings: Optional[Dict[str, float]] = None # Per-stage latency in milliseconds
+    next_cursor: Optional[str] = None # Pass back as "cursor" to fetch the next page; None when exhausted
+
+
+class SearchStreamHeader(BaseModel):
+    query: str
+    total_count: int
+    limit: int
+    offset: int
+    timings: Optional[Dict[str, float]] = None # Retrieval latency before the first result in milliseconds
 
 
 class SearchRequest(BaseModel):
     query: str = Field(..., min_length=1)
     content_types: Optional[List[str]] = None
+    file_extensions: Optional[List[str]] = None # e.g. [".pdf", "docx"]; applies to supporting-document chunks
     limit: int = Field(default=10, ge=1, le=100)
     offset: int = Field(default=0, ge=0)
     min_score: Optional[float] = Field(default=None, ge=0.0, le=1.0) # Optional threshold tuning per request
+    mode: Literal["vector", "hybrid"] = "vector" # "hybrid" fuses vector and exact-term (FTS5) rankings
+    rerank: bool = False # Re-score the top candidates with a cross-encoder, within a time budget
+    cursor: Optional[str] = None # "" starts cursor paging over the whole catalogue; offset is then ignored
+
+
+class BatchSearchRequest(BaseModel):
+    requests: List[SearchRequest] = Field(..., min_length=1, max_length=50)
+
+
+class BatchSearchResponse(BaseModel):
+    responses: List[SearchResponse]
 
 
 class DeleteEmbeddingsRequest(BaseModel):
@@ -34,3 +57,64 @@ class DeleteEmbeddingsRequest(BaseModel):
 class DeleteEmbeddingsResponse(BaseModel):
     success: bool
     message: str
+
+
+class EmbeddingCacheStatsDto(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+    ttl_seconds: Optional[float] = None
+    hit_ratio: float
+
+
+class EmbeddingBatcherStatsDto(BaseModel):
+    requests: int
+    batches: int
+    rejected: int
+    queue_depth: int
+    largest_batch: int
+    average_batch_size: float
+    max_batch_size: int
+    max_wait_ms: float
+    max_queue_depth: int
+
+
+class EmbeddingDiskCacheStatsDto(BaseModel):
+    hits: int
+    misses: int
+    writes: int
+    evictions: int
+    size: int
+    max_entries: int
+    hit_ratio: float
+
+
+class SearchResultCacheStatsDto(BaseModel):
+    hits: int
+    misses: int
+    invalidations: int
+    size: int
+    max_size: int
+    ttl_seconds: Optional[float] = None
+    hit_ratio: float
+
+
+class DatasetMetadataCacheStatsDto(BaseModel):
+    size: int
+    hits: int
+    misses: int
+    refreshes: int
+    refresh_failures: int
+    watermark: Optional[str] = None
+    last_refreshed_at: Optional[datetime] = None
+    staleness_seconds: Optional[float] = None
+
+
+class SearchStatsResponse(BaseModel):
+    embedding_cache: EmbeddingCacheStatsDto
+    embedding_batcher: EmbeddingBatcherStatsDto
+    embedding_disk_cache: Optional[EmbeddingDiskCacheStatsDto] = None
+    result_cache: SearchResultCacheStatsDto
+    metadata_cache: DatasetMetadataCacheStatsDto
@@ -0,0 +1,53 @@
+from typing import List, Protocol
+
+
+class IAsyncDocumentTextExtractor(Protocol):
+    """
+    Interface for extracting text from documents of several formats without blocking the event loop.
+    """
+
+    @property
+    def concurrency(self) -> int:
+        """
+        Number of documents extracted at once; callers use it to bound how many files they read ahead.
+        """
+        ...
+
+    def supports(self, extension: str) -> bool:
+        """
+        Returns whether documents with the given lower-case extension (e.g. ".pdf") can be extracted.
+        """
+        ...
+
+    async def extract_text(self, extension: str, file_content: bytes) -> str:
+        """
+        Extracts plain text from the provided file content.
+
+        Args:
+            extension (str): Lower-case file extension selecting the extractor.
+            file_content (bytes): The raw binary content of the file.
+
+        Returns:
+            str: The extracted text.
+
+        Raises:
+            DocumentExtractionException: If extraction fails or exceeds its time limit.
+        """
+        ...
+
+    async def extract_segments(self, extension: str, file_content: bytes) -> List[str]:
+        """
+        Extracts the text of the document as segments (pages, paragraphs) in reading order, for
+        callers that chunk documents incrementally.
+
+        Args:
+            extension (str): Lower-case file extension selecting the extractor.
+            file_content (bytes): The raw binary content of the file.
+
+        Returns:
+            List[str]: Non-empty text segments; joined with newlines they give extract_text.
+
+        Raises:
+            DocumentExtractionException: If extraction fails or exceeds its time limit.
+        """
+        ...
@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Iterator, Protocol
 
 
 class IDocumentTextExtractor(Protocol):
@@ -18,3 +18,15 @@ class IDocumentTextExtractor(Protocol):
         """
         ...
 
+    def iter_segments(self, file_content: bytes) -> Iterator[str]:
+        """
+        Yields the text of the document piece by piece (pages, paragraphs) in reading order,
+        so callers can chunk it without building the whole text.
+
+        Args:
+            file_content (bytes): The raw binary content of the file.
+
+        Returns:
+            Iterator[str]: Non-empty text segments; joined with newlines they give extract_text.
+        """
+        ...
@@ -0,0 +1,20 @@
+from typing import Protocol
+
+
+class IRerankerProvider(Protocol):
+    """
+    Interface for models that re-score (query, passage) pairs jointly, e.g. cross-encoders.
+    """
+
+    async def score(self, query: str, passages: list[str]) -> list[float]:
+        """
+        Scores how relevant each passage is to the query.
+
+        Args:
+            query (str): The search query.
+            passages (list[str]): Candidate passages, in any order.
+
+        Returns:
+            list[float]: One relevance score per passage, higher is better.
+        """
+        ...
@@ -18,3 +18,54 @@ class IDatasetSupportingDocumentQueueRepository(IBaseRepository[DatasetSupportin
         """
         ...
 
+
+    async def claim_pending_queue_items(self, owner: str, limit: int, lease_seconds: float) -> List[DatasetSupportingDocumentQueue]:
+        """
+        Flags up to limit pending, unclaimed items as processing and leases them to a worker.
+
+        Args:
+            owner (str): Unique name of the claiming worker.
+            limit (int): Maximum number of items to claim.
+            lease_seconds (float): Time after which the claim expires unless renewed.
+
+        Returns:
+            List[DatasetSupportingDocumentQueue]: The items claimed by this call.
+        """
+        ...
+
+    async def renew_leases(self, owner: str, queue_item_ids: List[int], lease_seconds: float) -> int:
+        """
+        Extends the leases a worker still holds.
+
+        Args:
+            owner (str): Unique name of the worker.
+            queue_item_ids (List[int]): Items the worker is processing.
+            lease_seconds (float): New lease duration from now.
+
+        Returns:
+            int: Number of leases renewed; fewer than requested means some were recovered by another worker.
+        """
+        ...
+
+    async def release_queue_item(self, owner: str, queue_item_id: int) -> bool:
+        """
+        Clears the processing flag and lease of an item, if the worker still holds it.
+
+        Args:
+            owner (str): Unique name of the worker.
+            queue_item_id (int): The processed item.
+
+        Returns:
+            bool: True if the worker still held the lease.
+        """
+        ...
+
+    async def recover_expired_leases(self) -> int:
+        """
+        Returns items whose lease expired to the pending pool. Items flagged without a lease are being
+        processed elsewhere (the .NET ETL, a synchronous process-dataset run) and are left alone.
+
+        Returns:
+            int: Number of items recovered.
+        """
+        ...
@@ -0,0 +1,68 @@
+from typing import List, Optional, Protocol
+
+from app.domain.value_objects.search_result import SearchResult
+
+
+class ILexicalIndexRepository(Protocol):
+    """
+    Interface for full-text indexes used alongside the vector store for exact term matching.
+    """
+
+    async def index_texts(
+        self,
+        identifier: str,
+        content_type: str,
+        texts: List[str],
+        start_index: int = 0,
+        file_extension: Optional[str] = None,
+        source_file: Optional[str] = None
+    ) -> bool:
+        """
+        Indexes (or replaces) consecutive text chunks of one source file of a dataset.
+        Indexing from start_index 0 first removes the chunks previously indexed for that source file.
+
+        Args:
+            identifier (str): Unique identifier for the document/dataset.
+            content_type (str): Type of content (e.g., 'title', 'document').
+            texts (List[str]): The chunk texts, in chunk order.
+            start_index (int): Chunk index of the first text.
+            file_extension (Optional[str]): Extension of the source file, if any.
+            source_file (Optional[str]): Name of the source file, so documents of one dataset are kept apart.
+
+        Returns:
+            bool: True if indexing was successful.
+        """
+        ...
+
+    async def search(
+        self,
+        query_text: str,
+        limit: int = 10,
+        content_types: Optional[List[str]] = None,
+        file_extensions: Optional[List[str]] = None
+    ) -> List[SearchResult]:
+        """
+        Searches chunks matching the query terms, best match first.
+
+        Args:
+            query_text (str): The raw query text.
+            limit (int): Maximum number of chunks to return.
+            content_types (Optional[List[str]]): Only match chunks of these content types.
+            file_extensions (Optional[List[str]]): Only match chunks from source files with these extensions.
+
+        Returns:
+            List[SearchResult]: Matching chunks ranked by lexical relevance.
+        """
+        ...
+
+    async def delete(self, identifier: str) -> bool:
+        """
+        Deletes all indexed chunks of an identifier.
+
+        Args:
+            identifier (str): The identifier to remove.
+
+        Returns:
+            bool: True if deletion was successful.
+        """
+        ...
@@ -8,12 +8,28 @@ class IVectorStoreRepository(Protocol):
     Interface for vector store repositories responsible for indexing and searching embeddings.
     """
 
+    async def initialize(self) -> None:
+        """
+        Prepares the store for use (connection, collection or files) ahead of the first request.
+        Implementations also initialize lazily, so calling this is an optimization.
+        """
+        ...
+
+    async def close(self) -> None:
+        """
+        Releases connections and file handles held by the store.
+        """
+        ...
+
     async def search_similar(
         self, 
         query_embedding: List[float], 
         limit: int = 10, 
         offset: int = 0,
-        min_score: float = 0.0
+        min_score: float = 0.0,
+        content_types: Optional[List[str]] = None,
+        file_extensions: Optional[List[str]] = None,
+        identifiers: Optional[List[str]] = None
     ) -> List[SearchResult]:
         """
         Searches for vectors similar to the query embedding.
@@ -23,12 +39,45 @@ class IVectorStoreRepository(Protocol):
             limit (int): Maximum number of results to return.
             offset (int): Number of results to skip.
             min_score (float): Minimum similarity score threshold.
+            content_types (Optional[List[str]]): Only match chunks of these content types.
+            file_extensions (Optional[List[str]]): Only match chunks from source files with these extensions.
+            identifiers (Optional[List[str]]): Only match chunks of these datasets.
 
         Returns:
             List[SearchResult]: A list of matching search results.
         """
         ...
 
+    async def search_grouped(
+        self,
+        query_embedding: List[float],
+        group_by: str = "identifier",
+        limit: int = 10,
+        min_score: float = 0.0,
+        content_types: Optional[List[str]] = None,
+        file_extensions: Optional[List[str]] = None,
+        identifiers: Optional[List[str]] = None
+    ) -> List[SearchResult]:
+        """
+        Searches for the best-scoring vector of each group, ranked by that score.
+
+        Args:
+            query_embedding (List[float]): The vector representation of the query.
+            group_by (str): Payload field to group hits by.
+            limit (int): Maximum number of groups to return.
+            min_score (float): Minimum similarity score threshold.
+            content_types (Optional[List[str]]): Only match chunks of these content types.
+            file_extensions (Optional[List[str]]): Only match chunks from source files with these extensions.
+            identifiers (Optional[List[str]]): Only match chunks of these datasets.
+
+        Returns:
+            List[SearchResult]: One result per group, best first.
+
+        Raises:
+            NotImplementedError: If the backend cannot group server-side.
+        """
+        ...
+
     async def index_embedding(
         self, 
         identifier: str, 
@@ -73,6 +122,104 @@ class IVectorStoreRepository(Protocol):
         """
         ...
 
+    async def find_indexed_chunks(self, identifier: str, content_type: str, payloads: List[dict]) -> List[bool]:
+        """
+        Checks which chunks are already stored, so unchanged content is not embedded again.
+
+        Args:
+            identifier (str): Unique identifier for the document/dataset.
+            content_type (str): Type of content.
+            payloads (List[dict]): Payloads of the chunks, as they would be indexed.
+
+        Returns:
+            List[bool]: True for each chunk whose point already exists, in payload order.
+        """
+        ...
+
+    async def count_archive_chunks(self, identifier: str, archive_hash: str) -> int:
+        """
+        Counts the searchable chunks of a dataset that were extracted from a supporting-document archive.
+
+        Args:
+            identifier (str): Unique identifier for the document/dataset.
+            archive_hash (str): SHA-256 of the archive the chunks came from.
+
+        Returns:
+            int: Number of chunks; staged chunks are not counted.
+        """
+        ...
+
+    async def find_archive_hash(self, identifier: str, archive_url: str) -> Optional[str]:
+        """
+        Looks up which archive the searchable chunks downloaded from a supporting-document URL came from.
+
+        Args:
+            identifier (str): Unique identifier for the document/dataset.
+            archive_url (str): Download URL of the archive.
+
+        Returns:
+            Optional[str]: SHA-256 of that archive, or None if no searchable chunk came from the URL.
+        """
+        ...
+
+    async def delete_stale_chunks(self, identifier: str, content_type: str, kept_content_hashes: List[str]) -> bool:
+        """
+        Deletes the searchable chunks of an identifier and content type whose text was replaced, for
+        content written outside a dataset version (e.g. a changed title). Staged chunks are kept.
+
+        Args:
+            identifier (str): Unique identifier for the document/dataset.
+            content_type (str): Type of content.
+            kept_content_hashes (List[str]): SHA-256 of the texts that are current.
+
+        Returns:
+            bool: True if deletion was successful.
+        """
+        ...
+
+    async def commit_dataset_version(
+        self,
+        identifier: str,
+        dataset_version: str,
+        retained_payloads: List[dict],
+        retained_archives: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Makes a dataset version the one searches see: retags the retained (unchanged) chunks with
+        the version, publishes the chunks staged under it and deletes every chunk of older versions.
+        Backends that cannot switch in one step must delete the old version before publishing the
+        new one, so a search running during the commit never sees chunks of two versions.
+
+        Args:
+            identifier (str): Unique identifier for the document/dataset.
+            dataset_version (str): Version being committed.
+            retained_payloads (List[dict]): Current payloads of the chunks kept from earlier versions.
+            retained_archives (Optional[List[str]]): Hashes of unchanged archives whose chunks are all kept.
+
+        Returns:
+            bool: True if the commit was successful.
+        """
+        ...
+
+    async def discard_dataset_version(
+        self,
+        identifier: str,
+        dataset_version: str,
+        archive_hashes: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Deletes the chunks staged under a dataset version that will not be committed.
+
+        Args:
+            identifier (str): Unique identifier for the document/dataset.
+            dataset_version (str): Version to discard.
+            archive_hashes (Optional[List[str]]): Only discard the chunks extracted from these archives.
+
+        Returns:
+            bool: True if the staged chunks were deleted.
+        """
+        ...
+
     async def delete_embeddings(self, identifier: str) -> bool:
         """
         Deletes all embeddings associated with an identifier.
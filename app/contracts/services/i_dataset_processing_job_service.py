@@ -0,0 +1,46 @@
+from typing import List, Optional, Protocol
+
+from app.domain.value_objects.dataset_processing_job import DatasetProcessingJob
+
+
+class IDatasetProcessingJobService(Protocol):
+    """
+    Interface for running dataset processing in the background as cancellable jobs.
+    """
+
+    def submit(self, dataset_metadata_ids: List[int], parallelism: Optional[int] = None) -> DatasetProcessingJob:
+        """
+        Starts processing datasets in the background.
+
+        Args:
+            dataset_metadata_ids (List[int]): Datasets to process; duplicates are processed once.
+            parallelism (Optional[int]): Datasets processed at once; defaults to the service setting.
+
+        Returns:
+            DatasetProcessingJob: The queued job.
+        """
+        ...
+
+    def get(self, job_id: str) -> Optional[DatasetProcessingJob]:
+        """
+        Looks up a job.
+
+        Args:
+            job_id (str): The job identifier.
+
+        Returns:
+            Optional[DatasetProcessingJob]: The job, or None if it is unknown or was evicted.
+        """
+        ...
+
+    async def cancel(self, job_id: str) -> Optional[DatasetProcessingJob]:
+        """
+        Cancels a job: pending datasets are skipped and running ones are stopped, keeping their previous index.
+
+        Args:
+            job_id (str): The job identifier.
+
+        Returns:
+            Optional[DatasetProcessingJob]: The job, or None if it is unknown.
+        """
+        ...
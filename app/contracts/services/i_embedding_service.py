@@ -1,4 +1,6 @@
-from typing import List, Protocol
+from typing import List, Optional, Protocol
+
+from app.domain.value_objects.dataset_ingestion_progress import DatasetIngestionProgress
 
 
 class IEmbeddingService(Protocol):
@@ -6,12 +8,17 @@ class IEmbeddingService(Protocol):
     Interface for the embedding service responsible for processing dataset metadata and generating vector representations.
     """
 
-    async def process_dataset_heavy_lifting(self, dataset_metadata_id: int) -> bool:
+    async def process_dataset_heavy_lifting(
+        self,
+        dataset_metadata_id: int,
+        progress: Optional[DatasetIngestionProgress] = None
+    ) -> bool:
         """
         Processes a dataset by metadata ID, generating embeddings for its title, abstract, and supporting documents.
 
         Args:
             dataset_metadata_id (int): The unique identifier of the dataset metadata to process.
+            progress (Optional[DatasetIngestionProgress]): Counters to update while the dataset is processed.
 
         Returns:
             bool: True if processing was successful.
@@ -0,0 +1,18 @@
+from typing import Protocol
+
+from app.contracts.dtos.embedding_dtos import IngestionPipelineStatsResponse
+
+
+class IIngestionPipelineStatsService(Protocol):
+    """
+    Interface for reporting runtime counters of the supporting-document ingestion pipeline.
+    """
+
+    def get_stats(self) -> IngestionPipelineStatsResponse:
+        """
+        Collects the run counters and the per-stage throughput, queue depth and busy/blocked time.
+
+        Returns:
+            IngestionPipelineStatsResponse: A snapshot of the counters.
+        """
+        ...
@@ -0,0 +1,19 @@
+from typing import Protocol
+
+from app.contracts.dtos.search_dtos import SearchStatsResponse
+
+
+class ISearchStatsService(Protocol):
+    """
+    Interface for reporting runtime counters of the search path.
+    """
+
+    def get_stats(self) -> SearchStatsResponse:
+        """
+        Collects the current counters of the query-embedding cache, embedding batcher, persistent
+        embedding cache, grouped result cache and dataset metadata cache.
+
+        Returns:
+            SearchStatsResponse: A snapshot of the counters.
+        """
+        ...
@@ -1,6 +1,8 @@
-from typing import List, Protocol, Optional
+from typing import AsyncIterator, Iterable, List, Protocol, Optional, Tuple
 
-from app.contracts.dtos.search_dtos import SearchResponse
+from app.contracts.dtos.search_dtos import SearchResponse, SearchResultItem, SearchStreamHeader
+from app.domain.value_objects.dataset_index_version import DatasetIndexVersion
+from app.domain.value_objects.ingestion_chunk import IngestionChunk
 from app.domain.value_objects.search_result import SearchQuery
 
 
@@ -21,6 +23,33 @@ class ISemanticSearchService(Protocol):
         """
         ...
 
+    async def open_semantic_stream(
+        self,
+        query: SearchQuery
+    ) -> Tuple[SearchStreamHeader, AsyncIterator[SearchResultItem]]:
+        """
+        Runs retrieval for a query and returns the header plus an iterator that resolves results lazily.
+
+        Args:
+            query (SearchQuery): The search query parameters.
+
+        Returns:
+            Tuple[SearchStreamHeader, AsyncIterator[SearchResultItem]]: The page header and its results, in rank order.
+        """
+        ...
+
+    async def perform_semantic_context_batch(self, queries: List[SearchQuery]) -> List[SearchResponse]:
+        """
+        Performs several semantic searches with one encode pass and one vector store round trip.
+
+        Args:
+            queries (List[SearchQuery]): The search queries, each with its own filters and pagination.
+
+        Returns:
+            List[SearchResponse]: One response per query, in request order.
+        """
+        ...
+
     async def delete_embeddings(self, identifier: str) -> bool:
         """
         Deletes all vector embeddings associated with a specific identifier.
@@ -38,18 +67,164 @@ class ISemanticSearchService(Protocol):
         identifier: str, 
         content_type: str, 
         text: str, 
-        source_file: Optional[str] = None
+        source_file: Optional[str] = None,
+        dataset_version: Optional[DatasetIndexVersion] = None
     ) -> bool:
         """
         Ingests text into the semantic search system, splitting into chunks if necessary.
+        Chunks whose content is already indexed are not embedded again.
 
         Args:
             identifier (str): Unique identifier for the source.
             content_type (str): Type of content being ingested.
             text (str): The raw text content.
             source_file (Optional[str]): The path to the source file if applicable.
+            dataset_version (Optional[DatasetIndexVersion]): Re-indexing run the text belongs to; its new
+                chunks stay hidden until the run is committed. Without one, chunks are searchable immediately.
 
         Returns:
             bool: True if ingestion was successful.
         """
         ...
+
+    async def prepare_chunks(
+        self,
+        identifier: str,
+        content_type: str,
+        text: str,
+        source_file: Optional[str] = None,
+        dataset_version: Optional[DatasetIndexVersion] = None,
+        archive_hash: Optional[str] = None
+    ) -> List[IngestionChunk]:
+        """
+        Splits text into chunks, records the ones already indexed with the run and updates the lexical index.
+        First stage of ingest_text, for callers that embed and index chunks of many texts in shared batches.
+
+        Args:
+            identifier (str): Unique identifier for the source.
+            content_type (str): Type of content being ingested.
+            text (str): The raw text content.
+            source_file (Optional[str]): The path to the source file if applicable.
+            dataset_version (Optional[DatasetIndexVersion]): Re-indexing run the text belongs to.
+            archive_hash (Optional[str]): SHA-256 of the archive the text was extracted from, recorded
+                on the chunks so a later run can keep them when the archive is unchanged.
+
+        Returns:
+            List[IngestionChunk]: The chunks that still need embedding.
+        """
+        ...
+
+    def iter_document_chunks(
+        self,
+        identifier: str,
+        segments: Iterable[str],
+        source_file: Optional[str] = None,
+        dataset_version: Optional[DatasetIndexVersion] = None,
+        archive_hash: Optional[str] = None,
+        archive_url: Optional[str] = None
+    ) -> AsyncIterator[List[IngestionChunk]]:
+        """
+        Incremental form of prepare_chunks for documents: chunks the segments (pages, paragraphs) of one
+        document a window at a time, so memory is bounded by the window rather than the document.
+
+        Args:
+            identifier (str): Unique identifier for the source.
+            segments (Iterable[str]): The document's text, in order.
+            source_file (Optional[str]): The path to the source file if applicable.
+            dataset_version (Optional[DatasetIndexVersion]): Re-indexing run the document belongs to.
+            archive_hash (Optional[str]): SHA-256 of the archive the document was extracted from.
+            archive_url (Optional[str]): Download URL of that archive.
+
+        Returns:
+            AsyncIterator[List[IngestionChunk]]: Per window, the chunks that still need embedding.
+        """
+        ...
+
+    async def embed_chunks(
+        self,
+        chunks: List[IngestionChunk],
+        dataset_version: Optional[DatasetIndexVersion] = None
+    ) -> List[List[float]]:
+        """
+        Embeds prepared chunks.
+
+        Args:
+            chunks (List[IngestionChunk]): Chunks returned by prepare_chunks.
+            dataset_version (Optional[DatasetIndexVersion]): Re-indexing run whose progress is updated.
+
+        Returns:
+            List[List[float]]: One embedding per chunk.
+        """
+        ...
+
+    async def index_chunks(
+        self,
+        chunks: List[IngestionChunk],
+        embeddings: List[List[float]],
+        dataset_version: Optional[DatasetIndexVersion] = None
+    ) -> None:
+        """
+        Upserts embedded chunks into the vector store; chunks may belong to different sources.
+
+        Args:
+            chunks (List[IngestionChunk]): Chunks returned by prepare_chunks.
+            embeddings (List[List[float]]): Their embeddings, in the same order.
+            dataset_version (Optional[DatasetIndexVersion]): Re-indexing run the chunks belong to; without
+                one, they are searchable immediately.
+        """
+        ...
+
+    async def retain_archive(self, dataset_version: DatasetIndexVersion, archive_hash: str) -> bool:
+        """
+        Keeps every indexed chunk of an unchanged supporting-document archive in a re-indexing run,
+        so the archive does not need to be extracted and embedded again.
+
+        Args:
+            dataset_version (DatasetIndexVersion): The run.
+            archive_hash (str): SHA-256 of the archive.
+
+        Returns:
+            bool: False if no searchable chunk of the archive exists and it must be processed.
+        """
+        ...
+
+    async def fail_archive(
+        self,
+        dataset_version: DatasetIndexVersion,
+        archive_url: str,
+        archive_hash: Optional[str] = None
+    ) -> None:
+        """
+        Records a supporting-document archive that could not be processed in a re-indexing run. On
+        commit the chunks staged from it are dropped and those of its previous download are kept.
+
+        Args:
+            dataset_version (DatasetIndexVersion): The run.
+            archive_url (str): Download URL of the archive.
+            archive_hash (Optional[str]): SHA-256 of the failed download, if it was downloaded.
+        """
+        ...
+
+    async def commit_dataset_version(self, dataset_version: DatasetIndexVersion) -> bool:
+        """
+        Switches searches over to a re-indexing run and deletes the chunks of older versions.
+
+        Args:
+            dataset_version (DatasetIndexVersion): The completed run.
+
+        Returns:
+            bool: True if the commit was successful.
+        """
+        ...
+
+    async def discard_dataset_version(self, dataset_version: DatasetIndexVersion) -> bool:
+        """
+        Drops the chunks staged by a failed re-indexing run, leaving the previous version searchable.
+
+        Args:
+            dataset_version (DatasetIndexVersion): The abandoned run.
+
+        Returns:
+            bool: True if the staged chunks were deleted.
+        """
+        ...
@@ -1,5 +1,18 @@
-from app.contracts.dtos.embedding_dtos import IndexEmbeddingResponse, IngestMetadataRequest, ProcessDatasetRequest
+from app.contracts.dtos.embedding_dtos import (
+    DatasetProgressDto,
+    IndexEmbeddingResponse,
+    IngestionPipelineStatsResponse,
+    IngestMetadataRequest,
+    ProcessDatasetRequest,
+    ProcessDatasetsJobRequest,
+    ProcessingJobResponse,
+)
+from app.contracts.services.i_dataset_processing_job_service import IDatasetProcessingJobService
 from app.contracts.services.i_embedding_service import IEmbeddingService
+from app.contracts.services.i_ingestion_pipeline_stats_service import IIngestionPipelineStatsService
+from app.domain.exceptions.ingestion_exception import IngestionJobNotFoundException
+from app.domain.value_objects.dataset_ingestion_progress import DatasetIngestionProgress
+from app.domain.value_objects.dataset_processing_job import DatasetProcessingJob
 
 
 class EmbeddingController:
@@ -29,3 +42,67 @@ class EmbeddingController:
             success=success,
             message="Dataset processed successfully" if success else "Failed to process dataset"
         )
+
+    async def submit_processing_job(
+        self,
+        request: ProcessDatasetsJobRequest,
+        job_service: IDatasetProcessingJobService
+    ) -> ProcessingJobResponse:
+
+        job = job_service.submit(request.datasetMetadataIDs, request.parallelism)
+
+        return self._to_job_response(job)
+
+    async def get_processing_job(self, job_id: str, job_service: IDatasetProcessingJobService) -> ProcessingJobResponse:
+
+        job = job_service.get(job_id)
+
+        if job is None:
+
+            raise IngestionJobNotFoundException(job_id)
+
+        return self._to_job_response(job)
+
+    async def cancel_processing_job(self, job_id: str, job_service: IDatasetProcessingJobService) -> ProcessingJobResponse:
+
+        job = await job_service.cancel(job_id)
+
+        if job is None:
+
+            raise IngestionJobNotFoundException(job_id)
+
+        return self._to_job_response(job)
+
+    async def get_pipeline_stats(self, stats_service: IIngestionPipelineStatsService) -> IngestionPipelineStatsResponse:
+
+        return stats_service.get_stats()
+
+    @staticmethod
+    def _to_job_response(job: DatasetProcessingJob) -> ProcessingJobResponse:
+
+        return ProcessingJobResponse(
+            jobId=job.job_id,
+            status=job.status,
+            parallelism=job.parallelism,
+            createdAt=job.created_at,
+            finishedAt=job.finished_at,
+            succeeded=sum(d.status == DatasetIngestionProgress.SUCCEEDED for d in job.datasets),
+            failed=sum(d.status == DatasetIngestionProgress.FAILED for d in job.datasets),
+            datasets=[
+                DatasetProgressDto(
+                    datasetMetadataID=d.dataset_metadata_id,
+                    identifier=d.identifier,
+                    status=d.status,
+                    bytesDownloaded=d.bytes_downloaded,
+                    filesExtracted=d.files_extracted,
+                    chunksEmbedded=d.chunks_embedded,
+                    chunksUnchanged=d.chunks_unchanged,
+                    pointsUpserted=d.points_upserted,
+                    archivesFailed=d.archives_failed,
+                    error=d.error,
+                    startedAt=d.started_at,
+                    finishedAt=d.finished_at,
+                )
+                for d in job.datasets
+            ]
+        )
@@ -1,4 +1,18 @@
-from app.contracts.dtos.search_dtos import SearchRequest, SearchResponse, DeleteEmbeddingsRequest, DeleteEmbeddingsResponse
+from typing import AsyncIterator, Literal
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.contracts.dtos.search_dtos import (
+    BatchSearchRequest,
+    BatchSearchResponse,
+    DeleteEmbeddingsRequest,
+    DeleteEmbeddingsResponse,
+    SearchRequest,
+    SearchResponse,
+    SearchStatsResponse,
+)
+from app.contracts.services.i_search_stats_service import ISearchStatsService
 from app.contracts.services.i_semantic_search_service import ISemanticSearchService
 from app.domain.value_objects.search_result import SearchQuery
 
@@ -14,16 +28,71 @@ class SearchController:
         service: ISemanticSearchService
     ) -> SearchResponse:
 
-        query = SearchQuery(
+        return await service.perform_semantic_context(self._to_query(request))
+
+    async def semantic_search_stream(
+        self,
+        request: SearchRequest,
+        service: ISemanticSearchService,
+        stream_format: Literal["ndjson", "sse"] = "ndjson"
+    ) -> StreamingResponse:
+
+        # Retrieval runs before the response starts, so search errors still map to error statuses
+        header, items = await service.open_semantic_stream(self._to_query(request))
+
+        if stream_format == "sse":
+
+            return StreamingResponse(
+                self._to_sse(header, items),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+            )
+
+        return StreamingResponse(self._to_ndjson(header, items), media_type="application/x-ndjson")
+
+    @staticmethod
+    async def _to_ndjson(header: BaseModel, items: AsyncIterator[BaseModel]) -> AsyncIterator[str]:
+
+        yield header.model_dump_json() + "\n"
+
+        async for item in items:
+            yield item.model_dump_json() + "\n"
+
+    @staticmethod
+    async def _to_sse(header: BaseModel, items: AsyncIterator[BaseModel]) -> AsyncIterator[str]:
+
+        yield f"event: header\ndata: {header.model_dump_json()}\n\n"
+
+        async for item in items:
+            yield f"event: result\ndata: {item.model_dump_json()}\n\n"
+
+        yield "event: end\ndata: {}\n\n"
+
+    async def semantic_search_batch(
+        self,
+        request: BatchSearchRequest,
+        service: ISemanticSearchService
+    ) -> BatchSearchResponse:
+
+        responses = await service.perform_semantic_context_batch([self._to_query(r) for r in request.requests])
+
+        return BatchSearchResponse(responses=responses)
+
+    @staticmethod
+    def _to_query(request: SearchRequest) -> SearchQuery:
+
+        return SearchQuery(
             query_text=request.query,
             content_types=request.content_types,
+            file_extensions=request.file_extensions,
             limit=request.limit,
             offset=request.offset,
-            min_score=request.min_score # Propagating threshold to domain
+            min_score=request.min_score, # Propagating threshold to domain
+            mode=request.mode,
+            rerank=request.rerank,
+            cursor=request.cursor
         )
 
-        return await service.perform_semantic_context(query)
-
     async def delete_embeddings(
         self,
         request: DeleteEmbeddingsRequest,
@@ -36,3 +105,7 @@ class SearchController:
             success=success,
             message="Embeddings deleted successfully" if success else "Failed to delete embeddings"
         )
+
+    async def get_stats(self, stats_service: ISearchStatsService) -> SearchStatsResponse:
+
+        return stats_service.get_stats()
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+
+from app.infrastructure.data_access.session import Base
+
+
+class IngestionLease(Base):
+    """
+    Claim of a DatasetSupportingDocumentQueue row by an ingestion worker. The row's IsProcessing flag is
+    set while a lease exists; a lease past ExpiresAt belongs to a worker that stopped heartbeating.
+    """
+
+    __tablename__ = "IngestionLeases"
+
+    dataset_supporting_document_queue_id = Column(
+        "DatasetSupportingDocumentQueueID",
+        Integer,
+        ForeignKey("DatasetSupportingDocumentQueues.DatasetSupportingDocumentQueueID"),
+        primary_key=True,
+    )
+    owner = Column("Owner", String, nullable=False)
+    claimed_at = Column("ClaimedAt", DateTime, nullable=False)
+    expires_at = Column("ExpiresAt", DateTime, nullable=False, index=True)
@@ -11,5 +11,8 @@ class AppErrorCode(IntEnum):
     VECTOR_STORE_ERROR = 201
     EMBEDDING_ERROR = 202
     VALIDATION_ERROR = 203
+    INGESTION_JOB_NOT_FOUND = 300
+    ARCHIVE_DOWNLOAD_ERROR = 301
+    DOCUMENT_EXTRACTION_ERROR = 302
     InternalServerError = 500
     UnAuthorized = 401
@@ -0,0 +1,29 @@
+from app.domain.exceptions.app_error_code import AppErrorCode
+from app.domain.exceptions.api_exception import ApiException
+
+
+class IngestionJobNotFoundException(ApiException):
+    """
+    Raised when a dataset processing job is unknown or no longer retained.
+    """
+
+    def __init__(self, job_id: str):
+        super().__init__(f"Processing job '{job_id}' not found", 404, AppErrorCode.INGESTION_JOB_NOT_FOUND)
+
+
+class ArchiveDownloadException(ApiException):
+    """
+    Raised when a supporting-document archive cannot be downloaded or exceeds the size limit.
+    """
+
+    def __init__(self, message: str, status_code: int = 502):
+        super().__init__(message, status_code, AppErrorCode.ARCHIVE_DOWNLOAD_ERROR)
+
+
+class DocumentExtractionException(ApiException):
+    """
+    Raised when text cannot be extracted from a supporting document or extraction exceeds its time limit.
+    """
+
+    def __init__(self, message: str, status_code: int = 422):
+        super().__init__(message, status_code, AppErrorCode.DOCUMENT_EXTRACTION_ERROR)
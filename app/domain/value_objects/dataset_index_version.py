@@ -0,0 +1,37 @@
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from app.domain.value_objects.dataset_ingestion_progress import DatasetIngestionProgress
+
+
+@dataclass
+class DatasetIndexVersion:
+    """
+    One re-indexing run of a dataset. Chunks written during the run carry the version and stay
+    hidden from searches until the run is committed; chunks whose content is already indexed are
+    only retagged on commit, as are all chunks of retained (unchanged) archives. Embeddings of
+    the staged chunks are kept by (content type, file extension) so the commit can drop cached
+    searches they would now appear in. A supporting-document archive that fails is recorded by
+    URL with the hash of the download, if any: its staged chunks are dropped on commit and the
+    chunks of its previous download are retained instead. Chunk counters are kept on the run's
+    progress.
+    """
+
+    identifier: str
+    version: str
+    retained_payloads: List[dict] = field(default_factory=list)
+    retained_archives: List[str] = field(default_factory=list)
+    failed_archives: Dict[str, Optional[str]] = field(default_factory=dict)
+    staged_embeddings: Dict[Tuple[str, Optional[str]], List[List[float]]] = field(default_factory=dict)
+    progress: DatasetIngestionProgress = field(default_factory=DatasetIngestionProgress)
+
+    @classmethod
+    def start(cls, identifier: str, progress: Optional[DatasetIngestionProgress] = None) -> "DatasetIndexVersion":
+
+        return cls(
+            identifier=identifier,
+            version=f"{datetime.utcnow():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}",
+            progress=progress or DatasetIngestionProgress(),
+        )
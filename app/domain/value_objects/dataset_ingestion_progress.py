@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class DatasetIngestionProgress:
+    """
+    Live counters of one dataset going through EmbeddingService, updated as the work happens.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    dataset_metadata_id: Optional[int] = None
+    identifier: Optional[str] = None
+    status: str = PENDING
+    bytes_downloaded: int = 0
+    files_extracted: int = 0
+    chunks_embedded: int = 0
+    chunks_unchanged: int = 0
+    points_upserted: int = 0
+    archives_failed: int = 0
+    error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def done(self) -> bool:
+
+        return self.status in (self.SUCCEEDED, self.FAILED, self.CANCELLED)
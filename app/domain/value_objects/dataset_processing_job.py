@@ -0,0 +1,29 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from app.domain.value_objects.dataset_ingestion_progress import DatasetIngestionProgress
+
+
+@dataclass
+class DatasetProcessingJob:
+    """
+    A batch of datasets processed in the background, with the live progress of each.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+    job_id: str
+    parallelism: int
+    datasets: List[DatasetIngestionProgress]
+    status: str = QUEUED
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+
+    @property
+    def done(self) -> bool:
+
+        return self.status in (self.COMPLETED, self.CANCELLED)
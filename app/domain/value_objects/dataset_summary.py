@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class DatasetSummary:
+    file_identifier: str
+    title: Optional[str] = None
+    publication_date: Optional[datetime] = None
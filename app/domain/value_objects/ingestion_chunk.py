@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class IngestionChunk:
+    """
+    A chunk of ingested text waiting to be embedded, with the payload its point is indexed under.
+    """
+
+    identifier: str
+    content_type: str
+    text: str
+    payload: dict
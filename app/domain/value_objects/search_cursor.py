@@ -0,0 +1,67 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from app.domain.value_objects.search_result import SearchResult
+
+
+@dataclass(frozen=True)
+class SearchCursor:
+    """
+    Position in the score-ordered chunk stream of one query.
+
+    Every dataset whose best chunk scores above last_score, or exactly last_score and is
+    listed in tied_identifiers, has already been returned; scanning resumes at chunk_offset.
+    """
+    fingerprint: str
+    chunk_offset: int = 0
+    emitted: int = 0
+    last_score: Optional[float] = None
+    tied_identifiers: List[str] = field(default_factory=list)
+
+    def advance(self, page: List[SearchResult], chunk_offset: int) -> "SearchCursor":
+
+        if not page:
+
+            return SearchCursor(self.fingerprint, chunk_offset, self.emitted, self.last_score, list(self.tied_identifiers))
+
+        last_score = page[-1].score
+        tied = [r.identifier for r in page if r.score == last_score]
+
+        if last_score == self.last_score:
+            tied = list(self.tied_identifiers) + tied
+
+        return SearchCursor(self.fingerprint, chunk_offset, self.emitted + len(page), last_score, tied)
+
+    def encode(self) -> str:
+
+        payload = {
+            "fp": self.fingerprint,
+            "co": self.chunk_offset,
+            "n": self.emitted,
+            "ls": self.last_score,
+            "tie": self.tied_identifiers,
+        }
+
+        return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "SearchCursor":
+
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+            return cls(
+                fingerprint=str(payload["fp"]),
+                chunk_offset=int(payload["co"]),
+                emitted=int(payload["n"]),
+                last_score=float(payload["ls"]) if payload["ls"] is not None else None,
+                tied_identifiers=[str(i) for i in payload["tie"]],
+            )
+
+        except (binascii.Error, ValueError, TypeError, KeyError) as e:
+
+            raise ValueError("Malformed search cursor") from e
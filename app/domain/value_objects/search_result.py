@@ -17,6 +17,10 @@ class SearchResult:
 class SearchQuery:
     query_text: str
     content_types: Optional[List[str]] = field(default_factory=list)
+    file_extensions: Optional[List[str]] = field(default_factory=list)
     limit: int = 10
     offset: int = 0
     min_score: Optional[float] = None
+    mode: str = "vector"
+    rerank: bool = False
+    cursor: Optional[str] = None
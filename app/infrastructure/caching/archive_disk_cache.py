@@ -0,0 +1,256 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import IO, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ArchiveCacheEntry:
+    url: str
+    path: str
+    size: int
+    content_hash: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+@dataclass
+class ArchiveDiskCacheStats:
+    revalidated: int
+    stores: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+
+class ArchiveDiskCache:
+    """
+    Keeps downloaded supporting-document archives on disk with the validators they were served
+    with (ETag, Last-Modified) and their SHA-256, so a re-download can be a conditional request
+    answered by 304 Not Modified.
+
+    Every entry is a `<sha256 of url>.zip` file plus a `.json` sidecar; both are written to a
+    temporary name and renamed into place, so several worker processes can share the directory.
+    The sidecar's modification time is the last use: beyond max_bytes, least recently used
+    archives are deleted. Readers keep an archive open by file descriptor, so an eviction or a
+    newer download never pulls the file from under an ingestion in progress.
+    """
+
+    PARTIAL_SUFFIX = ".part"
+    # Partial downloads older than this were left behind by a crashed process
+    STALE_PARTIAL_SECONDS = 3600
+
+    def __init__(self, directory: str, max_bytes: int = 2 * 2**30):
+
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._revalidated = 0
+        self._stores = 0
+        self._evictions = 0
+        os.makedirs(directory, exist_ok=True)
+        self._remove_stale_partials()
+
+    @property
+    def stats(self) -> ArchiveDiskCacheStats:
+
+        entries = self._entries()
+
+        return ArchiveDiskCacheStats(
+            revalidated=self._revalidated,
+            stores=self._stores,
+            evictions=self._evictions,
+            entries=len(entries),
+            size_bytes=sum(entry.size for _, entry in entries),
+            max_bytes=self._max_bytes,
+        )
+
+    def _key(self, url: str) -> str:
+
+        return os.path.join(self._directory, hashlib.sha256(url.encode("utf-8")).hexdigest())
+
+    def lookup(self, url: str) -> Optional[ArchiveCacheEntry]:
+        """
+        Summary: Returns the cached archive of a URL, if its file is still complete.
+
+        Args:
+            url (str): Archive URL.
+
+        Returns:
+            Optional[ArchiveCacheEntry]: The entry, or None on a miss.
+        """
+
+        entry = self._read_entry(self._key(url) + ".json")
+
+        if entry is None or entry.url != url:
+
+            return None
+
+        try:
+
+            if os.path.getsize(entry.path) != entry.size:
+
+                return None
+
+        except OSError:
+
+            return None
+
+        return entry
+
+    def open(self, entry: ArchiveCacheEntry) -> IO[bytes]:
+        """
+        Summary: Opens a cached archive after the server confirmed it is current, marking it as recently used.
+        """
+
+        file = open(entry.path, "rb")
+        self._revalidated += 1
+        self._touch(self._key(entry.url) + ".json")
+
+        return file
+
+    def create_partial(self) -> IO[bytes]:
+        """
+        Summary: Creates the file a new download is streamed into before store() moves it into the cache.
+        """
+
+        return tempfile.NamedTemporaryFile(dir=self._directory, suffix=self.PARTIAL_SUFFIX, delete=False)
+
+    def discard_partial(self, partial: IO[bytes]) -> None:
+
+        partial.close()
+
+        try:
+            os.remove(partial.name)
+
+        except OSError:
+            pass
+
+    def store(
+        self,
+        url: str,
+        partial: IO[bytes],
+        size: int,
+        content_hash: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> ArchiveCacheEntry:
+        """
+        Summary: Moves a completed download into the cache and evicts least recently used archives beyond the budget.
+
+        Args:
+            url (str): Archive URL.
+            partial (IO[bytes]): File from create_partial; it stays open and now refers to the cached archive.
+            size (int): Archive size in bytes.
+            content_hash (str): SHA-256 of the archive.
+            etag (Optional[str]): ETag response header.
+            last_modified (Optional[str]): Last-Modified response header.
+
+        Returns:
+            ArchiveCacheEntry: The stored entry.
+        """
+
+        key = self._key(url)
+        partial.flush()
+        entry = ArchiveCacheEntry(url, key + ".zip", size, content_hash, etag, last_modified)
+        os.replace(partial.name, entry.path)
+
+        sidecar = key + ".json" + self.PARTIAL_SUFFIX
+        with open(sidecar, "w", encoding="utf-8") as f:
+            json.dump(asdict(entry), f)
+        os.replace(sidecar, key + ".json")
+        self._touch(key + ".json")
+
+        self._stores += 1
+        self._evict(keep=entry.path)
+
+        return entry
+
+    def _entries(self) -> List[Tuple[float, ArchiveCacheEntry]]:
+
+        entries = []
+
+        for sidecar in glob.glob(os.path.join(self._directory, "*.json")):
+            entry = self._read_entry(sidecar)
+
+            if entry is not None:
+
+                try:
+                    entries.append((os.path.getmtime(sidecar), entry))
+
+                except OSError:
+                    pass
+
+        return entries
+
+    def _evict(self, keep: str) -> None:
+
+        entries = sorted(self._entries(), key=lambda e: e[0])
+        total = sum(entry.size for _, entry in entries)
+
+        for _, entry in entries:
+
+            if total <= self._max_bytes:
+
+                break
+
+            if entry.path == keep:
+
+                continue
+
+            # Sidecar first, so a concurrent lookup never finds an entry whose archive is gone
+            for path in (os.path.splitext(entry.path)[0] + ".json", entry.path):
+
+                try:
+                    os.remove(path)
+
+                except OSError:
+                    pass
+
+            total -= entry.size
+            self._evictions += 1
+            logger.info(f"Evicted cached archive of {entry.url} ({entry.size} bytes)")
+
+    @staticmethod
+    def _read_entry(sidecar: str) -> Optional[ArchiveCacheEntry]:
+
+        try:
+            with open(sidecar, encoding="utf-8") as f:
+                return ArchiveCacheEntry(**json.load(f))
+
+        except (OSError, ValueError, TypeError):
+
+            return None
+
+    @staticmethod
+    def _touch(path: str) -> None:
+
+        # An explicit time: the kernel stamps writes with a coarse clock, which would tie recent uses
+        now = time.time()
+
+        try:
+            os.utime(path, (now, now))
+
+        except OSError:
+            pass
+
+    def _remove_stale_partials(self) -> None:
+
+        cutoff = time.time() - self.STALE_PARTIAL_SECONDS
+
+        for path in glob.glob(os.path.join(self._directory, "*" + self.PARTIAL_SUFFIX)):
+
+            try:
+
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+
+            except OSError:
+                pass
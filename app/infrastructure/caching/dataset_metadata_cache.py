@@ -0,0 +1,210 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Optional
+
+from sqlalchemy import String, func, select, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.contracts.caching.i_dataset_metadata_cache import IDatasetMetadataCache
+from app.domain.entities.dataset_metadata import DatasetMetadata
+from app.domain.value_objects.dataset_summary import DatasetSummary
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DatasetMetadataCacheStats:
+    size: int
+    hits: int
+    misses: int
+    refreshes: int
+    refresh_failures: int
+    watermark: Optional[str]
+    last_refreshed_at: Optional[datetime]
+    staleness_seconds: Optional[float]
+
+
+class DatasetMetadataCache(IDatasetMetadataCache):
+    """
+    In-memory file_identifier -> DatasetSummary map so search responses need no SQL round trip.
+    Only the summary columns are loaded. Incremental refreshes select rows whose
+    coalesce(UpdatedAt, CreatedAt) is at or after the highest value already seen; the value is
+    compared as stored text so it works with whatever timestamp format the ETL service writes.
+    A periodic full reload drops datasets deleted from the shared database.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        refresh_interval_seconds: float = 60.0,
+        full_refresh_interval_seconds: float = 3600.0,
+    ):
+
+        self._session_factory = session_factory
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._full_refresh_interval_seconds = full_refresh_interval_seconds
+        self._entries: Dict[str, DatasetSummary] = {}
+        self._watermark: Optional[str] = None
+        self._last_refreshed_at: Optional[float] = None
+        self._last_full_refresh: Optional[float] = None
+        self._hits = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._refresh_failures = 0
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def stats(self) -> DatasetMetadataCacheStats:
+
+        return DatasetMetadataCacheStats(
+            size=len(self._entries),
+            hits=self._hits,
+            misses=self._misses,
+            refreshes=self._refreshes,
+            refresh_failures=self._refresh_failures,
+            watermark=self._watermark,
+            last_refreshed_at=(
+                datetime.fromtimestamp(self._last_refreshed_at, tz=timezone.utc)
+                if self._last_refreshed_at is not None
+                else None
+            ),
+            staleness_seconds=(
+                round(time.time() - self._last_refreshed_at, 3)
+                if self._last_refreshed_at is not None
+                else None
+            ),
+        )
+
+    def get_many(self, identifiers: Iterable[str]) -> Dict[str, DatasetSummary]:
+
+        found: Dict[str, DatasetSummary] = {}
+
+        for identifier in identifiers:
+            summary = self._entries.get(identifier)
+
+            if summary is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                found[identifier] = summary
+
+        return found
+
+    async def load_missing(self, identifiers: Iterable[str]) -> Dict[str, DatasetSummary]:
+
+        identifiers = list(identifiers)
+
+        if not identifiers:
+
+            return {}
+
+        stmt = select(
+            DatasetMetadata.file_identifier,
+            DatasetMetadata.title,
+            DatasetMetadata.publication_date,
+        ).where(DatasetMetadata.file_identifier.in_(identifiers))
+
+        async with self._session_factory() as session:
+            rows = (await session.execute(stmt)).all()
+
+        found = {
+            file_identifier: DatasetSummary(file_identifier=file_identifier, title=title, publication_date=publication_date)
+            for file_identifier, title, publication_date in rows
+        }
+        # Merged into whichever map is current; a full refresh running meanwhile loads them too
+        self._entries.update(found)
+
+        return found
+
+    def note_title(self, identifier: str, title: str) -> None:
+
+        existing = self._entries.get(identifier)
+        self._entries[identifier] = (
+            replace(existing, title=title) if existing else DatasetSummary(file_identifier=identifier, title=title)
+        )
+
+    async def refresh(self, full: bool = False) -> int:
+
+        async with self._lock:
+            full = (
+                full
+                or self._watermark is None
+                or time.monotonic() - self._last_full_refresh >= self._full_refresh_interval_seconds
+            )
+            changed_at = type_coerce(func.coalesce(DatasetMetadata.updated_at, DatasetMetadata.created_at), String)
+            stmt = select(
+                DatasetMetadata.file_identifier,
+                DatasetMetadata.title,
+                DatasetMetadata.publication_date,
+                changed_at,
+            )
+
+            if not full:
+                stmt = stmt.where(changed_at >= self._watermark)
+
+            try:
+                async with self._session_factory() as session:
+                    rows = (await session.execute(stmt)).all()
+
+            except Exception:
+                self._refresh_failures += 1
+
+                raise
+
+            # Full reloads build a new map and swap it in, so readers never see a partial catalogue
+            entries = {} if full else self._entries
+            watermark = None if full else self._watermark
+
+            for file_identifier, title, publication_date, row_changed_at in rows:
+                entries[file_identifier] = DatasetSummary(
+                    file_identifier=file_identifier,
+                    title=title,
+                    publication_date=publication_date,
+                )
+
+                if row_changed_at is not None and (watermark is None or row_changed_at > watermark):
+                    watermark = row_changed_at
+
+            self._entries = entries
+            self._watermark = watermark if watermark is not None else self._watermark or ""
+            self._last_refreshed_at = time.time()
+            self._refreshes += 1
+
+            if full:
+                self._last_full_refresh = time.monotonic()
+
+            return len(rows)
+
+    def start(self) -> None:
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+
+        if self._task is not None:
+            self._task.cancel()
+
+            try:
+                await self._task
+
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
+
+    async def _refresh_loop(self) -> None:
+
+        while True:
+            await asyncio.sleep(self._refresh_interval_seconds)
+
+            try:
+                loaded = await self.refresh()
+                logger.debug(f"Dataset metadata cache refreshed: {loaded} row(s) loaded")
+
+            except Exception as e:
+                logger.warning(f"Dataset metadata cache refresh failed, serving stale titles: {e}")
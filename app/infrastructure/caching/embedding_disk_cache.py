@@ -0,0 +1,243 @@
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import aiosqlite
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EmbeddingDiskCacheStats:
+    hits: int
+    misses: int
+    writes: int
+    evictions: int
+    size: int
+    max_entries: int
+
+    @property
+    def hit_ratio(self) -> float:
+
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+
+class EmbeddingDiskCache:
+    """
+    Persistent embedding cache in a local SQLite database, keyed by (model id, sha256 of the text).
+    Vectors are stored as raw float16 (or float32) blobs, so a 384-d MiniLM vector takes 768 bytes.
+    The cache is bounded by max_bytes: once it holds more entries than fit, the least recently
+    used tenth is evicted. Model ids map to small integers so switching models (or quantized
+    variants) never returns vectors from another embedding space.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS embedding_models (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE)",
+        """
+        CREATE TABLE IF NOT EXISTS embeddings (
+            model_id INTEGER NOT NULL,
+            text_sha256 BLOB NOT NULL,
+            vector BLOB NOT NULL,
+            last_used INTEGER NOT NULL,
+            PRIMARY KEY (model_id, text_sha256)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)",
+    )
+
+    # Rough per-row SQLite overhead on top of the vector blob: key, timestamp, B-tree and index entries
+    ROW_OVERHEAD_BYTES = 96
+    QUERY_CHUNK = 500
+
+    def __init__(
+        self,
+        db_path: str,
+        model_id: str,
+        dimension: int = 384,
+        max_bytes: int = 512 * 2**20,
+        dtype: str = "float16",
+    ):
+
+        if dtype not in ("float16", "float32"):
+
+            raise ValueError("dtype must be 'float16' or 'float32'")
+
+        self._db_path = db_path
+        self._model_name = model_id
+        self._dimension = dimension
+        self._dtype = np.dtype(dtype)
+        self._max_entries = max(1, max_bytes // (dimension * self._dtype.itemsize + self.ROW_OVERHEAD_BYTES))
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._model_key = 0
+        self._size = 0
+        self._lock = asyncio.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> EmbeddingDiskCacheStats:
+
+        return EmbeddingDiskCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            writes=self._writes,
+            evictions=self._evictions,
+            size=self._size,
+            max_entries=self._max_entries,
+        )
+
+    @staticmethod
+    def digest(text: str) -> bytes:
+
+        return hashlib.sha256(text.encode("utf-8")).digest()
+
+    async def _ensure_connection(self) -> aiosqlite.Connection:
+
+        if self._conn is not None:
+
+            return self._conn
+
+        async with self._lock:
+
+            if self._conn is None:
+
+                if self._db_path != ":memory:":
+                    os.makedirs(os.path.dirname(os.path.abspath(self._db_path)), exist_ok=True)
+
+                conn = await aiosqlite.connect(self._db_path)
+                await conn.execute("PRAGMA journal_mode=WAL")
+                await conn.execute("PRAGMA synchronous=NORMAL")
+
+                for statement in self._SCHEMA:
+                    await conn.execute(statement)
+
+                await conn.execute("INSERT OR IGNORE INTO embedding_models (name) VALUES (?)", (self._model_name,))
+
+                async with conn.execute("SELECT id FROM embedding_models WHERE name = ?", (self._model_name,)) as cursor:
+                    self._model_key = (await cursor.fetchone())[0]
+
+                async with conn.execute("SELECT COUNT(*) FROM embeddings") as cursor:
+                    self._size = (await cursor.fetchone())[0]
+
+                await conn.commit()
+                self._conn = conn
+
+        return self._conn
+
+    async def get_many(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Summary: Looks up cached embeddings and marks the hits as recently used.
+
+        Args:
+            texts (List[str]): Texts to look up.
+
+        Returns:
+            List[Optional[List[float]]]: One embedding per text, None where it is not cached.
+        """
+
+        conn = await self._ensure_connection()
+        digests = [self.digest(t) for t in texts]
+        unique = list(dict.fromkeys(digests))
+        found: Dict[bytes, List[float]] = {}
+
+        for start in range(0, len(unique), self.QUERY_CHUNK):
+            chunk = unique[start : start + self.QUERY_CHUNK]
+
+            async with conn.execute(
+                f"SELECT text_sha256, vector FROM embeddings WHERE model_id = ? AND text_sha256 IN ({', '.join('?' * len(chunk))})",
+                [self._model_key, *chunk],
+            ) as cursor:
+
+                for digest, blob in await cursor.fetchall():
+                    vector = np.frombuffer(blob, dtype=self._dtype)
+
+                    # Rows written with another dtype or dimension are treated as misses and overwritten
+                    if vector.shape[0] == self._dimension:
+                        found[digest] = vector.astype(np.float32).tolist()
+
+        if found:
+
+            async with self._lock:
+                await conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE model_id = ? AND text_sha256 = ?",
+                    [(int(time.time()), self._model_key, digest) for digest in found],
+                )
+                await conn.commit()
+
+        results = [found.get(d) for d in digests]
+        self._hits += sum(r is not None for r in results)
+        self._misses += sum(r is None for r in results)
+
+        return results
+
+    async def put_many(self, texts: List[str], embeddings: List[List[float]]) -> None:
+        """
+        Summary: Stores embeddings for texts, evicting least recently used entries beyond the size bound.
+
+        Args:
+            texts (List[str]): Embedded texts.
+            embeddings (List[List[float]]): Their embeddings, in the same order.
+        """
+
+        if not texts:
+
+            return
+
+        conn = await self._ensure_connection()
+        now = int(time.time())
+        rows = {
+            self.digest(text): np.asarray(embedding, dtype=self._dtype).tobytes()
+            for text, embedding in zip(texts, embeddings)
+        }
+
+        async with self._lock:
+            before = conn.total_changes
+            await conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (model_id, text_sha256, vector, last_used) VALUES (?, ?, ?, ?)",
+                [(self._model_key, digest, blob, now) for digest, blob in rows.items()],
+            )
+            inserted = conn.total_changes - before
+
+            if inserted < len(rows):
+                # Rows that already existed (another process got there first, or a stale dtype) are refreshed
+                await conn.executemany(
+                    "UPDATE embeddings SET vector = ?, last_used = ? WHERE model_id = ? AND text_sha256 = ?",
+                    [(blob, now, self._model_key, digest) for digest, blob in rows.items()],
+                )
+
+            self._size += inserted
+            self._writes += len(rows)
+
+            if self._size > self._max_entries:
+                await self._evict(conn)
+
+            await conn.commit()
+
+    async def _evict(self, conn: aiosqlite.Connection) -> None:
+
+        # Evict down to 90% of the bound so the next writes do not trigger another pass right away
+        excess = self._size - int(self._max_entries * 0.9)
+        cursor = await conn.execute(
+            "DELETE FROM embeddings WHERE (model_id, text_sha256) IN "
+            "(SELECT model_id, text_sha256 FROM embeddings ORDER BY last_used LIMIT ?)",
+            (excess,),
+        )
+        self._size -= cursor.rowcount
+        self._evictions += cursor.rowcount
+        await cursor.close()
+        logger.info(f"Evicted {cursor.rowcount} least recently used embedding(s) from the disk cache")
+
+    async def close(self) -> None:
+
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
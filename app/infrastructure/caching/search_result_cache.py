@@ -0,0 +1,198 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.contracts.caching.i_search_result_cache import ISearchResultCache
+from app.domain.value_objects.search_result import SearchResult
+
+
+@dataclass
+class SearchResultCacheStats:
+    hits: int
+    misses: int
+    invalidations: int
+    size: int
+    max_size: int
+    ttl_seconds: Optional[float]
+
+    @property
+    def hit_ratio(self) -> float:
+
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _CacheEntry:
+    created_at: float
+    results: List[SearchResult]
+    identifiers: Set[str]
+    query_vector: np.ndarray
+    min_score: float
+    content_types: Tuple[str, ...]
+    file_extensions: Tuple[str, ...]
+    mode: str
+
+
+class SearchResultCache(ISearchResultCache):
+    """
+    Bounded LRU/TTL cache of grouped search results keyed by (query, min_score, filters, mode, rerank).
+    An entry is dropped when an identifier it contains is ingested or deleted, or when newly
+    ingested vectors would clear the entry's threshold for its query. The TTL bounds staleness
+    for writes made outside this process.
+    """
+
+    def __init__(self, max_size: int = 256, ttl_seconds: Optional[float] = 300.0):
+
+        if max_size < 1:
+
+            raise ValueError("max_size must be at least 1")
+
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @property
+    def stats(self) -> SearchResultCacheStats:
+
+        return SearchResultCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            invalidations=self._invalidations,
+            size=len(self._entries),
+            max_size=self._max_size,
+            ttl_seconds=self._ttl_seconds,
+        )
+
+    def make_key(
+        self,
+        query_text: str,
+        min_score: float,
+        content_types: Optional[List[str]] = None,
+        file_extensions: Optional[List[str]] = None,
+        mode: str = "vector",
+        rerank: bool = False
+    ) -> Hashable:
+
+        return (
+            " ".join(query_text.lower().split()),
+            round(float(min_score), 6),
+            tuple(sorted({c.lower() for c in content_types or []})),
+            tuple(sorted({e.lower() for e in file_extensions or []})),
+            mode.lower(),
+            bool(rerank),
+        )
+
+    def get(self, key: Hashable) -> Optional[List[SearchResult]]:
+
+        entry = self._entries.get(key)
+
+        if entry is not None and self._is_expired(entry):
+            del self._entries[key]
+            entry = None
+
+        if entry is None:
+            self._misses += 1
+
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+
+        return entry.results
+
+    def put(
+        self,
+        key: Hashable,
+        results: List[SearchResult],
+        query_embedding: List[float]
+    ) -> None:
+
+        self._entries[key] = _CacheEntry(
+            created_at=time.monotonic(),
+            results=list(results),
+            identifiers={r.identifier for r in results},
+            query_vector=self._normalize(np.asarray(query_embedding, dtype=np.float32)),
+            min_score=key[1],
+            content_types=key[2],
+            file_extensions=key[3],
+            mode=key[4],
+        )
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate_identifier(
+        self,
+        identifier: str,
+        content_type: Optional[str] = None,
+        embeddings: Optional[List[List[float]]] = None,
+        file_extension: Optional[str] = None
+    ) -> int:
+
+        vectors = None
+
+        if embeddings:
+            vectors = self._normalize(np.asarray(embeddings, dtype=np.float32))
+
+        stale = [
+            key for key, entry in self._entries.items()
+            if identifier in entry.identifiers or self._would_match(entry, content_type, file_extension, vectors)
+        ]
+
+        for key in stale:
+            del self._entries[key]
+
+        self._invalidations += len(stale)
+
+        return len(stale)
+
+    def clear(self) -> None:
+
+        self._entries.clear()
+
+    def _would_match(
+        self,
+        entry: _CacheEntry,
+        content_type: Optional[str],
+        file_extension: Optional[str],
+        vectors: Optional[np.ndarray]
+    ) -> bool:
+
+        if vectors is None:
+
+            return False
+
+        if entry.content_types and (content_type or "").lower() not in entry.content_types:
+
+            return False
+
+        if entry.file_extensions and (file_extension or "").lower() not in entry.file_extensions:
+
+            return False
+
+        # Hybrid results also depend on term matches, which vector similarity cannot predict
+        if entry.mode != "vector":
+
+            return True
+
+        return float(np.max(vectors @ entry.query_vector)) >= entry.min_score
+
+    def _is_expired(self, entry: _CacheEntry) -> bool:
+
+        return self._ttl_seconds is not None and time.monotonic() - entry.created_at > self._ttl_seconds
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+
+        return vectors / np.where(norms == 0, 1.0, norms)
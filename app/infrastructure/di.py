@@ -1,36 +1,194 @@
 import os
-from functools import lru_cache
+from functools import lru_cache, partial
 from fastapi import Depends
-from sentence_transformers import SentenceTransformer
+from typing import TYPE_CHECKING, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.application.services.dataset_processing_job_service import DatasetProcessingJobService
 from app.application.services.discovery_agent_service import DiscoveryAgentService
 from app.application.services.embedding_service import EmbeddingService
+from app.application.services.ingestion_pipeline import IngestionPipeline
+from app.application.services.ingestion_pipeline_stats_service import IngestionPipelineStatsService
+from app.application.services.ingestion_queue_worker import IngestionQueueWorker
+from app.application.services.search_stats_service import SearchStatsService
 from app.application.services.semantic_search_service import SemanticSearchService
 from app.contracts.providers.i_embedding_provider import IEmbeddingProvider
 from app.contracts.providers.i_llm_provider import ILLMProvider
+from app.contracts.providers.i_reranker_provider import IRerankerProvider
+from app.contracts.repositories.i_vector_store_repository import IVectorStoreRepository
 from app.contracts.services.i_discovery_agent_service import IDiscoveryAgentService
 from app.contracts.services.i_embedding_service import IEmbeddingService
+from app.contracts.services.i_ingestion_pipeline_stats_service import IIngestionPipelineStatsService
+from app.contracts.services.i_search_stats_service import ISearchStatsService
 from app.contracts.services.i_semantic_search_service import ISemanticSearchService
+from app.infrastructure.caching.archive_disk_cache import ArchiveDiskCache
+from app.infrastructure.caching.dataset_metadata_cache import DatasetMetadataCache
+from app.infrastructure.caching.embedding_disk_cache import EmbeddingDiskCache
+from app.infrastructure.caching.search_result_cache import SearchResultCache
 from app.infrastructure.data_access.repository_wrapper import RepositoryWrapper
-from app.infrastructure.data_access.session import AsyncSessionLocal
+from app.infrastructure.data_access.session import DB_PATH, AsyncSessionLocal
 from app.infrastructure.parsers.rocrate_parser import ROCrateParser
+from app.infrastructure.providers.batching_embedding_provider import BatchingEmbeddingProvider
+from app.infrastructure.providers.cached_embedding_provider import CachedEmbeddingProvider
+from app.infrastructure.providers.disk_cached_embedding_provider import DiskCachedEmbeddingProvider
+from app.infrastructure.providers.cross_encoder_reranker_provider import CrossEncoderRerankerProvider, load_cross_encoder
+from app.infrastructure.providers.onnx_embedding_provider import OnnxEmbeddingProvider, OnnxSentenceEncoder, load_onnx_encoder
+from app.infrastructure.providers.process_pool_document_extractor import ProcessPoolDocumentExtractor
+from app.infrastructure.providers.process_pool_embedding_provider import ProcessPoolEmbeddingProvider
 from app.infrastructure.providers.pdf_document_extractor import PdfDocumentExtractor
 from app.infrastructure.providers.rtf_document_extractor import RtfDocumentExtractor
 from app.infrastructure.providers.sentence_transformer_embedding_provider import SentenceTransformerEmbeddingProvider
 from app.infrastructure.providers.word_document_extractor import WordDocumentExtractor
 from app.infrastructure.providers.zip_downloader import ZipDownloader
+from app.infrastructure.repositories.numpy_vector_store_repository import NumpyVectorStoreRepository
+from app.infrastructure.repositories.qdrant_collection_profile import QdrantCollectionProfile
 from app.infrastructure.repositories.qdrant_vectore_store_repository import QdrantVectorStoreRepository
+from app.infrastructure.repositories.sqlite_fts_lexical_index_repository import SqliteFtsLexicalIndexRepository
 from app.infrastructure.factories.llm_provider_factory import LLMProviderFactory
 
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
 
 @lru_cache()
-def get_embedding_model() -> SentenceTransformer:
+def get_embedding_model() -> "SentenceTransformer":
     """
     Returns the singleton instance of the sentence transformer model.
+    Imported lazily so the ONNX backend never loads PyTorch for embeddings.
     """
 
-    return SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(EMBEDDING_MODEL_NAME)
+
+
+@lru_cache()
+def get_model_embedding_provider() -> IEmbeddingProvider:
+    """
+    Returns the provider that runs the embedding model, shared by search and ingestion.
+    EMBEDDING_BACKEND is "torch" (sentence-transformers) or "onnx" (the export in ONNX_MODEL_PATH, int8 with ONNX_QUANTIZED=true).
+    With EMBEDDING_WORKERS > 0 the model runs in that many worker processes (EMBEDDING_WORKER_THREADS threads each);
+    otherwise it runs in this process.
+    """
+
+    backend = os.getenv("EMBEDDING_BACKEND", "torch").lower()
+    onnx_model_path = os.getenv("ONNX_MODEL_PATH", "models/all-MiniLM-L6-v2-onnx")
+    onnx_quantized = os.getenv("ONNX_QUANTIZED", "false").lower() in ("1", "true", "yes")
+    workers = int(os.getenv("EMBEDDING_WORKERS", "0"))
+
+    if backend not in ("torch", "onnx"):
+
+        raise ValueError(f"Unknown EMBEDDING_BACKEND '{backend}', expected 'torch' or 'onnx'")
+
+    if workers > 0:
+
+        if backend == "onnx":
+
+            return ProcessPoolEmbeddingProvider(
+                onnx_model_path,
+                dimension=384,
+                workers=workers,
+                threads_per_worker=int(os.getenv("EMBEDDING_WORKER_THREADS", "1")),
+                model_loader=partial(load_onnx_encoder, quantized=onnx_quantized)
+            )
+
+        return ProcessPoolEmbeddingProvider(
+            EMBEDDING_MODEL_NAME,
+            dimension=384,
+            workers=workers,
+            threads_per_worker=int(os.getenv("EMBEDDING_WORKER_THREADS", "1"))
+        )
+
+    if backend == "onnx":
+
+        return OnnxEmbeddingProvider(OnnxSentenceEncoder.from_directory(onnx_model_path, quantized=onnx_quantized))
+
+    return SentenceTransformerEmbeddingProvider(get_embedding_model())
+
+
+@lru_cache()
+def get_embedding_batcher() -> BatchingEmbeddingProvider:
+    """
+    Returns the process-wide micro-batcher that merges concurrent query encodes into one model call.
+    Tuned with EMBEDDING_BATCH_MAX_SIZE, EMBEDDING_BATCH_MAX_WAIT_MS and EMBEDDING_BATCH_MAX_QUEUE.
+    """
+
+    return BatchingEmbeddingProvider(
+        get_model_embedding_provider(),
+        max_batch_size=int(os.getenv("EMBEDDING_BATCH_MAX_SIZE", "32")),
+        max_wait_ms=float(os.getenv("EMBEDDING_BATCH_MAX_WAIT_MS", "5")),
+        max_queue_depth=int(os.getenv("EMBEDDING_BATCH_MAX_QUEUE", "1024"))
+    )
+
+
+def get_embedding_model_id() -> str:
+    """
+    Returns the id of the embedding space produced by the configured backend, e.g. "sentence-transformers/all-MiniLM-L6-v2:onnx-int8".
+    """
+
+    backend = os.getenv("EMBEDDING_BACKEND", "torch").lower()
+
+    if backend == "onnx" and os.getenv("ONNX_QUANTIZED", "false").lower() in ("1", "true", "yes"):
+        backend = "onnx-int8"
+
+    return f"{EMBEDDING_MODEL_NAME}:{backend}"
+
+
+@lru_cache()
+def get_embedding_disk_cache() -> Optional[EmbeddingDiskCache]:
+    """
+    Returns the persistent ingestion embedding cache, or None when EMBEDDING_DISK_CACHE_MAX_MB is 0.
+    The database file is read from EMBEDDING_DISK_CACHE_PATH and defaults to embedding_cache.db next to the ETL database.
+    """
+
+    max_mb = float(os.getenv("EMBEDDING_DISK_CACHE_MAX_MB", "512"))
+
+    if max_mb <= 0:
+
+        return None
+
+    return EmbeddingDiskCache(
+        db_path=os.getenv("EMBEDDING_DISK_CACHE_PATH", os.path.join(os.path.dirname(DB_PATH), "embedding_cache.db")),
+        model_id=get_embedding_model_id(),
+        dimension=384,
+        max_bytes=int(max_mb * 2**20)
+    )
+
+
+@lru_cache()
+def get_query_embedding_cache() -> CachedEmbeddingProvider:
+    """
+    Returns the process-wide query embedding cache in front of the persistent ingestion cache and the embedding batcher.
+    Size and TTL are read from EMBEDDING_CACHE_SIZE and EMBEDDING_CACHE_TTL_SECONDS.
+    """
+
+    disk_cache = get_embedding_disk_cache()
+    inner = get_embedding_batcher()
+
+    return CachedEmbeddingProvider(
+        DiskCachedEmbeddingProvider(inner, disk_cache) if disk_cache is not None else inner,
+        max_size=int(os.getenv("EMBEDDING_CACHE_SIZE", "1024")),
+        ttl_seconds=float(os.getenv("EMBEDDING_CACHE_TTL_SECONDS", "3600"))
+    )
+
+
+@lru_cache()
+def get_reranker_provider() -> Optional[IRerankerProvider]:
+    """
+    Returns the singleton cross-encoder reranker, or None unless RERANK_MODEL names a model
+    (e.g. cross-encoder/ms-marco-MiniLM-L-6-v2). The model is loaded on the first re-ranked search.
+    """
+
+    model_name = os.getenv("RERANK_MODEL", "")
+
+    if not model_name:
+
+        return None
+
+    return CrossEncoderRerankerProvider(partial(load_cross_encoder, model_name))
 
 
 def get_embedding_provider() -> IEmbeddingProvider:
@@ -38,7 +196,7 @@ def get_embedding_provider() -> IEmbeddingProvider:
     Returns the implementation of the embedding provider.
     """
 
-    return SentenceTransformerEmbeddingProvider(get_embedding_model())
+    return get_query_embedding_cache()
 
 
 def get_llm_provider() -> ILLMProvider:
@@ -50,15 +208,125 @@ def get_llm_provider() -> ILLMProvider:
     return LLMProviderFactory.create()
 
 
-def get_vector_store_repository() -> QdrantVectorStoreRepository:
+@lru_cache()
+def get_numpy_vector_store_repository() -> NumpyVectorStoreRepository:
+    """
+    Returns the process-wide embedded vector store.
+    Files live in NUMPY_VECTOR_STORE_PATH (default: vector_store/ next to the ETL database); VECTOR_STORE_DTYPE is float32 or float16.
+    """
+
+    return NumpyVectorStoreRepository(
+        data_dir=os.getenv("NUMPY_VECTOR_STORE_PATH", os.path.join(os.path.dirname(DB_PATH), "vector_store")),
+        vector_size=384,
+        dtype=os.getenv("VECTOR_STORE_DTYPE", "float32")
+    )
+
+
+def get_vector_store_repository() -> IVectorStoreRepository:
+    """
+    Returns the implementation of the vector store repository selected by VECTOR_STORE_BACKEND ("qdrant" or "numpy").
+    """
+
+    if os.getenv("VECTOR_STORE_BACKEND", "qdrant").lower() == "numpy":
+
+        return get_numpy_vector_store_repository()
+
+    return get_qdrant_vector_store_repository()
+
+
+def _optional_env(name: str, cast):
+
+    value = os.getenv(name, "")
+
+    return cast(value) if value else None
+
+
+def get_qdrant_collection_profile(name: Optional[str] = None) -> QdrantCollectionProfile:
     """
-    Returns the implementation of the vector store repository.
+    Returns the Qdrant collection profile named by QDRANT_COLLECTION_PROFILE ("float", "int8" or "binary"),
+    with QDRANT_HNSW_M, QDRANT_HNSW_EF_CONSTRUCT, QDRANT_HNSW_EF, QDRANT_SEARCH_OVERSAMPLING and QDRANT_SEARCH_RESCORE overrides.
+    """
+
+    rescore = _optional_env("QDRANT_SEARCH_RESCORE", str)
+
+    return QdrantCollectionProfile.named(
+        name or os.getenv("QDRANT_COLLECTION_PROFILE", "float"),
+        hnsw_m=_optional_env("QDRANT_HNSW_M", int),
+        hnsw_ef_construct=_optional_env("QDRANT_HNSW_EF_CONSTRUCT", int),
+        hnsw_ef=_optional_env("QDRANT_HNSW_EF", int),
+        oversampling=_optional_env("QDRANT_SEARCH_OVERSAMPLING", float),
+        rescore=None if rescore is None else rescore.lower() in ("1", "true", "yes")
+    )
+
+
+@lru_cache()
+def get_qdrant_vector_store_repository(profile: Optional[QdrantCollectionProfile] = None) -> QdrantVectorStoreRepository:
+    """
+    Returns the process-wide Qdrant vector store repository, sharing one client and one collection bootstrap.
+    QDRANT_URL, QDRANT_PREFER_GRPC, QDRANT_GRPC_PORT and QDRANT_POOL_SIZE configure the transport.
     """
 
     return QdrantVectorStoreRepository(
-        url="http://localhost:6333",
+        url=os.getenv("QDRANT_URL", "http://localhost:6333"),
         collection_name="embeddings",
-        vector_size=384
+        vector_size=384,
+        profile=profile or get_qdrant_collection_profile(),
+        prefer_grpc=os.getenv("QDRANT_PREFER_GRPC", "false").lower() in ("1", "true", "yes"),
+        grpc_port=int(os.getenv("QDRANT_GRPC_PORT", "6334")),
+        pool_size=_optional_env("QDRANT_POOL_SIZE", int)
+    )
+
+
+@lru_cache()
+def get_search_result_cache() -> SearchResultCache:
+    """
+    Returns the process-wide cache of grouped search results.
+    Size and TTL are read from SEARCH_RESULT_CACHE_SIZE and SEARCH_RESULT_CACHE_TTL_SECONDS.
+    """
+
+    return SearchResultCache(
+        max_size=int(os.getenv("SEARCH_RESULT_CACHE_SIZE", "256")),
+        ttl_seconds=float(os.getenv("SEARCH_RESULT_CACHE_TTL_SECONDS", "300"))
+    )
+
+
+@lru_cache()
+def get_dataset_metadata_cache() -> DatasetMetadataCache:
+    """
+    Returns the process-wide dataset title map used to build search responses.
+    Refresh cadence is read from METADATA_CACHE_REFRESH_SECONDS and METADATA_CACHE_FULL_REFRESH_SECONDS.
+    """
+
+    return DatasetMetadataCache(
+        session_factory=AsyncSessionLocal,
+        refresh_interval_seconds=float(os.getenv("METADATA_CACHE_REFRESH_SECONDS", "60")),
+        full_refresh_interval_seconds=float(os.getenv("METADATA_CACHE_FULL_REFRESH_SECONDS", "3600"))
+    )
+
+
+def get_search_stats_service() -> ISearchStatsService:
+    """
+    Returns the service reporting counters of the search-path caches and the embedding batcher.
+    """
+
+    return SearchStatsService(
+        embedding_cache=get_query_embedding_cache(),
+        embedding_batcher=get_embedding_batcher(),
+        result_cache=get_search_result_cache(),
+        metadata_cache=get_dataset_metadata_cache(),
+        embedding_disk_cache=get_embedding_disk_cache()
+    )
+
+
+@lru_cache()
+def get_lexical_index_repository() -> SqliteFtsLexicalIndexRepository:
+    """
+    Returns the process-wide SQLite FTS5 lexical index used by hybrid search.
+    The database file is read from LEXICAL_INDEX_PATH and defaults to lexical_index.db next to the ETL database.
+    """
+
+    return SqliteFtsLexicalIndexRepository(
+        db_path=os.getenv("LEXICAL_INDEX_PATH", os.path.join(os.path.dirname(DB_PATH), "lexical_index.db"))
     )
 
 
@@ -88,7 +356,13 @@ def get_semantic_search_service(uow: RepositoryWrapper = Depends(get_repository_
     return SemanticSearchService(
         embedding_provider=get_embedding_provider(),
         vector_store_repository=get_vector_store_repository(),
-        repository_wrapper=uow
+        repository_wrapper=uow,
+        result_cache=get_search_result_cache(),
+        lexical_index=get_lexical_index_repository(),
+        reranker=get_reranker_provider(),
+        rerank_window=int(os.getenv("RERANK_WINDOW", "30")),
+        rerank_budget_seconds=float(os.getenv("RERANK_BUDGET_MS", "300")) / 1000,
+        metadata_cache=get_dataset_metadata_cache()
     )
 
 
@@ -103,12 +377,39 @@ def get_discovery_agent_service(uow: RepositoryWrapper = Depends(get_repository_
     )
 
 
+@lru_cache()
+def get_archive_cache() -> Optional[ArchiveDiskCache]:
+    """
+    Returns the on-disk cache of supporting-document archives, or None when ARCHIVE_CACHE_MAX_MB is 0.
+    The directory is read from ARCHIVE_CACHE_DIR and defaults to archive_cache next to the ETL database.
+    """
+
+    max_mb = float(os.getenv("ARCHIVE_CACHE_MAX_MB", "2048"))
+
+    if max_mb <= 0:
+
+        return None
+
+    return ArchiveDiskCache(
+        directory=os.getenv("ARCHIVE_CACHE_DIR", os.path.join(os.path.dirname(DB_PATH), "archive_cache")),
+        max_bytes=int(max_mb * 2**20)
+    )
+
+
+@lru_cache()
 def get_zip_downloader() -> ZipDownloader:
     """
-    Returns the zip downloader.
+    Returns the zip downloader, sharing one pooled HTTP client and the archive cache across datasets.
     """
 
-    return ZipDownloader()
+    return ZipDownloader(
+        connect_timeout_seconds=float(os.getenv("ARCHIVE_DOWNLOAD_CONNECT_TIMEOUT_SECONDS", "10")),
+        read_timeout_seconds=float(os.getenv("ARCHIVE_DOWNLOAD_READ_TIMEOUT_SECONDS", "60")),
+        max_bytes=int(os.getenv("ARCHIVE_MAX_MB", "4096")) * 2**20,
+        spool_max_bytes=int(os.getenv("ARCHIVE_SPOOL_MAX_MB", "16")) * 2**20,
+        temp_dir=os.getenv("ARCHIVE_TEMP_DIR") or None,
+        cache=get_archive_cache()
+    )
 
 
 def get_rocrate_parser() -> ROCrateParser:
@@ -143,6 +444,50 @@ def get_rtf_extractor() -> RtfDocumentExtractor:
     return RtfDocumentExtractor()
 
 
+@lru_cache()
+def get_document_extractor() -> ProcessPoolDocumentExtractor:
+    """
+    Returns the PDF/DOCX/RTF extractor running in DOCUMENT_EXTRACTION_WORKERS worker processes,
+    shared by every ingestion so the pool bounds extraction across datasets.
+    """
+
+    return ProcessPoolDocumentExtractor(
+        {
+            ".pdf": get_pdf_extractor(),
+            ".docx": get_word_extractor(),
+            ".rtf": get_rtf_extractor()
+        },
+        workers=int(os.getenv("DOCUMENT_EXTRACTION_WORKERS", "2")),
+        timeout_seconds=float(os.getenv("DOCUMENT_EXTRACTION_TIMEOUT_SECONDS", "120"))
+    )
+
+
+@lru_cache()
+def get_ingestion_pipeline() -> IngestionPipeline:
+    """
+    Returns the staged supporting-document pipeline shared by all ingestions, so its stage statistics cover every run.
+    """
+
+    return IngestionPipeline.for_supporting_documents(
+        fetch_concurrency=int(os.getenv("INGESTION_FETCH_CONCURRENCY", "2")),
+        unzip_concurrency=int(os.getenv("INGESTION_UNZIP_CONCURRENCY", "1")),
+        extract_concurrency=int(os.getenv("INGESTION_EXTRACT_CONCURRENCY", str(get_document_extractor().concurrency))),
+        chunk_concurrency=int(os.getenv("INGESTION_CHUNK_CONCURRENCY", "2")),
+        embed_concurrency=int(os.getenv("INGESTION_EMBED_CONCURRENCY", "2")),
+        upsert_concurrency=int(os.getenv("INGESTION_UPSERT_CONCURRENCY", "2")),
+        embed_batch_size=int(os.getenv("INGESTION_EMBED_BATCH_SIZE", "64")),
+        queue_size=int(os.getenv("INGESTION_QUEUE_SIZE", "8"))
+    )
+
+
+def get_ingestion_pipeline_stats_service() -> IIngestionPipelineStatsService:
+    """
+    Returns the service reporting stage counters of the shared ingestion pipeline.
+    """
+
+    return IngestionPipelineStatsService(get_ingestion_pipeline())
+
+
 async def get_embedding_service(uow: RepositoryWrapper = Depends(get_repository_wrapper)) -> IEmbeddingService:
     """
     Returns the embedding ingestion service.
@@ -153,7 +498,39 @@ async def get_embedding_service(uow: RepositoryWrapper = Depends(get_repository_
         semantic_search_service=get_semantic_search_service(uow),
         zip_downloader=get_zip_downloader(),
         ro_crate_parser=get_rocrate_parser(),
-        pdf_extractor=get_pdf_extractor(),
-        word_extractor=get_word_extractor(),
-        rtf_extractor=get_rtf_extractor()
+        document_extractor=get_document_extractor(),
+        ingestion_pipeline=get_ingestion_pipeline()
+    )
+
+
+@lru_cache()
+def get_ingestion_queue_worker() -> IngestionQueueWorker:
+    """
+    Returns the background worker draining DatasetSupportingDocumentQueue.
+    Tuned with INGESTION_WORKER_CONCURRENCY, INGESTION_LEASE_SECONDS, INGESTION_POLL_SECONDS and INGESTION_RETRY_SECONDS.
+    """
+
+    return IngestionQueueWorker(
+        session_factory=AsyncSessionLocal,
+        service_factory=get_embedding_service,
+        concurrency=int(os.getenv("INGESTION_WORKER_CONCURRENCY", "2")),
+        lease_seconds=float(os.getenv("INGESTION_LEASE_SECONDS", "300")),
+        poll_interval_seconds=float(os.getenv("INGESTION_POLL_SECONDS", "10")),
+        retry_seconds=float(os.getenv("INGESTION_RETRY_SECONDS", "900"))
+    )
+
+
+@lru_cache()
+def get_dataset_processing_job_service() -> DatasetProcessingJobService:
+    """
+    Returns the process-wide registry of background dataset processing jobs.
+    Parallelism defaults to PROCESSING_JOB_PARALLELISM and is capped at PROCESSING_JOB_MAX_PARALLELISM.
+    """
+
+    return DatasetProcessingJobService(
+        session_factory=AsyncSessionLocal,
+        service_factory=get_embedding_service,
+        default_parallelism=int(os.getenv("PROCESSING_JOB_PARALLELISM", "2")),
+        max_parallelism=int(os.getenv("PROCESSING_JOB_MAX_PARALLELISM", "8")),
+        retained_jobs=int(os.getenv("PROCESSING_JOB_RETAINED", "100"))
     )
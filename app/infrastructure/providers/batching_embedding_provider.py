@@ -0,0 +1,188 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from app.contracts.providers.i_embedding_provider import IEmbeddingProvider
+from app.domain.exceptions.search_exception import EmbeddingGenerationException
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EmbeddingBatcherStats:
+    requests: int
+    batches: int
+    rejected: int
+    queue_depth: int
+    largest_batch: int
+    max_batch_size: int
+    max_wait_ms: float
+    max_queue_depth: int
+
+    @property
+    def average_batch_size(self) -> float:
+
+        return self.requests / self.batches if self.batches else 0.0
+
+
+class BatchingEmbeddingProvider(IEmbeddingProvider):
+    """
+    Coalesces concurrent single-text embedding requests into batched encode calls.
+
+    One worker task takes the first queued text, keeps collecting for up to max_wait_ms or
+    until max_batch_size texts are waiting, and encodes them with one generate_embeddings
+    call on the inner provider. Requests arriving while a batch is encoding form the next
+    batch, so under load the model sees few large calls instead of many competing small ones.
+    Batch calls from ingestion bypass the queue.
+    """
+
+    def __init__(
+        self,
+        inner: IEmbeddingProvider,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        max_queue_depth: int = 1024,
+    ):
+
+        if max_batch_size < 1 or max_queue_depth < 1:
+
+            raise ValueError("max_batch_size and max_queue_depth must be at least 1")
+
+        self._inner = inner
+        self._max_batch_size = max_batch_size
+        self._max_wait = max(max_wait_ms, 0.0) / 1000
+        self._max_queue_depth = max_queue_depth
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._requests = 0
+        self._batches = 0
+        self._rejected = 0
+        self._largest_batch = 0
+
+    @property
+    def stats(self) -> EmbeddingBatcherStats:
+
+        return EmbeddingBatcherStats(
+            requests=self._requests,
+            batches=self._batches,
+            rejected=self._rejected,
+            queue_depth=self._queue.qsize() if self._queue is not None else 0,
+            largest_batch=self._largest_batch,
+            max_batch_size=self._max_batch_size,
+            max_wait_ms=self._max_wait * 1000,
+            max_queue_depth=self._max_queue_depth,
+        )
+
+    async def generate_embedding(self, text: str) -> List[float]:
+
+        queue = self._ensure_worker()
+
+        if queue.qsize() >= self._max_queue_depth:
+            self._rejected += 1
+
+            raise EmbeddingGenerationException("Embedding queue is full, retry shortly", status_code=503)
+
+        future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((text, future))
+
+        return await future
+
+    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+
+        return await self._inner.generate_embeddings(texts)
+
+    async def close(self) -> None:
+
+        if self._worker is not None:
+            self._worker.cancel()
+
+            try:
+                await self._worker
+
+            except asyncio.CancelledError:
+                pass
+
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+        self._worker = None
+        self._queue = None
+
+    def _ensure_worker(self) -> asyncio.Queue:
+
+        loop = asyncio.get_running_loop()
+
+        # A worker bound to a closed event loop (tests, reloads) is replaced along with its queue
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+
+        return self._queue
+
+    async def _collect(self, queue: asyncio.Queue) -> List[Tuple[str, asyncio.Future]]:
+
+        batch = [await queue.get()]
+        deadline = asyncio.get_running_loop().time() + self._max_wait
+
+        while len(batch) < self._max_batch_size:
+
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+
+                continue
+
+            remaining = deadline - asyncio.get_running_loop().time()
+
+            if remaining <= 0:
+
+                break
+
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+
+            except asyncio.TimeoutError:
+
+                break
+
+        # Callers that gave up (timeouts, disconnects) are not encoded
+        return [(text, future) for text, future in batch if not future.done()]
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+
+        while True:
+            batch = await self._collect(queue)
+
+            if not batch:
+
+                continue
+
+            self._requests += len(batch)
+            self._batches += 1
+            self._largest_batch = max(self._largest_batch, len(batch))
+
+            try:
+                embeddings = await self._inner.generate_embeddings([text for text, _ in batch])
+
+            except asyncio.CancelledError:
+
+                for _, future in batch:
+                    future.cancel()
+
+                raise
+
+            except Exception as e:
+                logger.error(f"Batched embedding of {len(batch)} text(s) failed", exc_info=True)
+
+                for _, future in batch:
+
+                    if not future.done():
+                        future.set_exception(e)
+
+                continue
+
+            for (_, future), embedding in zip(batch, embeddings):
+
+                if not future.done():
+                    future.set_result(embedding)
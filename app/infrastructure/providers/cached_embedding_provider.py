@@ -0,0 +1,134 @@
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from app.contracts.providers.i_embedding_provider import IEmbeddingProvider
+
+
+@dataclass
+class EmbeddingCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+    ttl_seconds: Optional[float]
+
+    @property
+    def hit_ratio(self) -> float:
+
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+
+class CachedEmbeddingProvider(IEmbeddingProvider):
+    """
+    Bounded LRU/TTL cache of normalized query text -> embedding in front of another provider.
+    Single-text lookups are cached; batch calls read cached vectors but never populate the
+    cache, so document chunks from ingestion cannot evict hot search queries.
+    """
+
+    _WHITESPACE = re.compile(r"\s+")
+
+    def __init__(
+        self,
+        inner: IEmbeddingProvider,
+        max_size: int = 1024,
+        ttl_seconds: Optional[float] = 3600.0,
+    ):
+
+        if max_size < 1:
+
+            raise ValueError("max_size must be at least 1")
+
+        self._inner = inner
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self._entries: "OrderedDict[str, Tuple[float, List[float]]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @classmethod
+    def normalize(cls, text: str) -> str:
+
+        return cls._WHITESPACE.sub(" ", text).strip().lower()
+
+    @property
+    def stats(self) -> EmbeddingCacheStats:
+
+        return EmbeddingCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._entries),
+            max_size=self._max_size,
+            ttl_seconds=self._ttl_seconds,
+        )
+
+    def clear(self) -> None:
+
+        self._entries.clear()
+
+    async def generate_embedding(self, text: str) -> List[float]:
+
+        key = self.normalize(text)
+        cached = self._get(key)
+
+        if cached is not None:
+
+            return cached
+
+        embedding = await self._inner.generate_embedding(text)
+
+        if embedding:
+            self._put(key, embedding)
+
+        return embedding
+
+    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+
+        results: List[Optional[List[float]]] = [self._get(self.normalize(t), count=False) for t in texts]
+        missing = [i for i, r in enumerate(results) if r is None]
+
+        if missing:
+            embeddings = await self._inner.generate_embeddings([texts[i] for i in missing])
+
+            for i, embedding in zip(missing, embeddings):
+                results[i] = embedding
+
+        return results
+
+    def _get(self, key: str, count: bool = True) -> Optional[List[float]]:
+
+        entry = self._entries.get(key)
+
+        if entry is not None and self._ttl_seconds is not None and time.monotonic() - entry[0] > self._ttl_seconds:
+            del self._entries[key]
+            entry = None
+
+        if entry is None:
+
+            if count:
+                self._misses += 1
+
+            return None
+
+        self._entries.move_to_end(key)
+
+        if count:
+            self._hits += 1
+
+        return entry[1]
+
+    def _put(self, key: str, embedding: List[float]) -> None:
+
+        self._entries[key] = (time.monotonic(), embedding)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
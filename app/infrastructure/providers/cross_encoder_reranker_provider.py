@@ -0,0 +1,89 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+from app.contracts.providers.i_reranker_provider import IRerankerProvider
+
+if TYPE_CHECKING:
+    from sentence_transformers import CrossEncoder
+
+logger = logging.getLogger(__name__)
+
+
+def load_cross_encoder(model_name: str) -> "CrossEncoder":
+
+    from sentence_transformers import CrossEncoder
+
+    return CrossEncoder(model_name, device="cpu")
+
+
+class CrossEncoderRerankerProvider(IRerankerProvider):
+    """
+    Scores (query, passage) pairs with a sentence-transformers cross-encoder on CPU.
+    Pairs are predicted in small batches, each in a worker thread, so a caller that cancels
+    (e.g. on a time budget) stops the remaining work after the batch in flight.
+
+    The model is loaded by model_loader on the first request that asks for re-ranking, so
+    searches that never do are not held up by (or fail on) sentence-transformers and the model
+    download. The load keeps running if that first caller gives up on its budget; if it fails,
+    the failure is logged once and every later call raises, so callers keep retrieval order.
+    """
+
+    def __init__(self, model_loader: Callable[[], "CrossEncoder"], batch_size: int = 16):
+        self._model_loader = model_loader
+        self._batch_size = batch_size
+        self._model: Optional["CrossEncoder"] = None
+        self._loading: Optional[asyncio.Future] = None
+        self._load_error: Optional[Exception] = None
+
+    async def _get_model(self) -> "CrossEncoder":
+
+        if self._model is not None:
+
+            return self._model
+
+        if self._load_error is not None:
+
+            raise RuntimeError(f"Reranker model is unavailable: {self._load_error}")
+
+        if self._loading is None:
+            self._loading = asyncio.ensure_future(asyncio.to_thread(self._model_loader))
+
+        try:
+            # Shielded: a caller timing out must not cancel the load for the ones after it
+            self._model = await asyncio.shield(self._loading)
+
+        except asyncio.CancelledError:
+
+            raise
+
+        except Exception as e:
+
+            if self._load_error is None:
+                logger.error(f"Could not load the reranker model; re-ranking is disabled: {e}", exc_info=True)
+                self._load_error = e
+
+            raise RuntimeError(f"Reranker model is unavailable: {e}") from e
+
+        return self._model
+
+    async def score(self, query: str, passages: List[str]) -> List[float]:
+
+        model = await self._get_model()
+        scores: List[float] = []
+
+        for i in range(0, len(passages), self._batch_size):
+            pairs = [[query, passage] for passage in passages[i : i + self._batch_size]]
+
+            def _predict() -> List[float]:
+
+                return model.predict(
+                    pairs,
+                    batch_size=self._batch_size,
+                    convert_to_numpy=True,
+                    show_progress_bar=False
+                ).tolist()
+
+            scores.extend(await asyncio.to_thread(_predict))
+
+        return scores
@@ -0,0 +1,53 @@
+import logging
+from typing import List, Optional
+
+from app.contracts.providers.i_embedding_provider import IEmbeddingProvider
+from app.infrastructure.caching.embedding_disk_cache import EmbeddingDiskCache
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCachedEmbeddingProvider(IEmbeddingProvider):
+    """
+    Serves ingestion batches from the persistent embedding cache and only encodes texts it has
+    never seen, so reprocessing a dataset whose documents did not change costs lookups, not model
+    time. Single-text calls (search queries) pass straight through and never touch the disk.
+    A failing cache degrades to encoding everything rather than failing ingestion.
+    """
+
+    def __init__(self, inner: IEmbeddingProvider, cache: EmbeddingDiskCache):
+
+        self._inner = inner
+        self._cache = cache
+
+    async def generate_embedding(self, text: str) -> List[float]:
+
+        return await self._inner.generate_embedding(text)
+
+    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+
+        if not texts:
+
+            return []
+
+        try:
+            results: List[Optional[List[float]]] = await self._cache.get_many(texts)
+
+        except Exception:
+            logger.warning("Embedding disk cache lookup failed, encoding the whole batch", exc_info=True)
+            results = [None] * len(texts)
+
+        missing = list(dict.fromkeys(t for t, r in zip(texts, results) if r is None))
+
+        if missing:
+            embeddings = await self._inner.generate_embeddings(missing)
+            computed = dict(zip(missing, embeddings))
+            results = [r if r is not None else computed[t] for t, r in zip(texts, results)]
+
+            try:
+                await self._cache.put_many(missing, embeddings)
+
+            except Exception:
+                logger.warning("Embedding disk cache write failed", exc_info=True)
+
+        return results
@@ -0,0 +1,103 @@
+import asyncio
+import os
+from typing import Any, List
+
+import numpy as np
+
+from app.contracts.providers.i_embedding_provider import IEmbeddingProvider
+
+ONNX_MODEL_FILE = "model.onnx"
+ONNX_QUANTIZED_MODEL_FILE = "model.int8.onnx"
+TOKENIZER_FILE = "tokenizer.json"
+
+
+class OnnxSentenceEncoder:
+    """
+    Sentence-transformer equivalent (mean pooling + L2 normalization, as in all-MiniLM-L6-v2)
+    over an exported ONNX transformer and a Rust fast tokenizer, without PyTorch. encode()
+    mirrors SentenceTransformer.encode so it can also be loaded into embedding worker processes.
+    """
+
+    def __init__(self, session: Any, tokenizer: Any, max_length: int = 256):
+
+        self._session = session
+        self._tokenizer = tokenizer
+        self._input_names = {i.name for i in session.get_inputs()}
+        tokenizer.enable_truncation(max_length=max_length)
+        tokenizer.enable_padding()
+
+    @classmethod
+    def from_directory(cls, model_dir: str, quantized: bool = False, threads: int = 0) -> "OnnxSentenceEncoder":
+        """
+        Summary: Loads a model exported by app.scripts.export_onnx_embedding_model.
+
+        Args:
+            model_dir (str): Directory holding model.onnx / model.int8.onnx and tokenizer.json.
+            quantized (bool): Load the int8 dynamically quantized model.
+            threads (int): ONNX Runtime intra-op threads; 0 lets the runtime decide.
+
+        Returns:
+            OnnxSentenceEncoder: The loaded encoder.
+        """
+
+        import onnxruntime
+        from tokenizers import Tokenizer
+
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = threads
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        session = onnxruntime.InferenceSession(
+            os.path.join(model_dir, ONNX_QUANTIZED_MODEL_FILE if quantized else ONNX_MODEL_FILE),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+
+        return cls(session, Tokenizer.from_file(os.path.join(model_dir, TOKENIZER_FILE)))
+
+    def encode(self, texts, batch_size: int = 32, convert_to_numpy: bool = True, show_progress_bar: bool = False) -> np.ndarray:
+
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        batches = [self._encode_batch(texts[i : i + batch_size]) for i in range(0, len(texts), batch_size)]
+        embeddings = np.concatenate(batches) if batches else np.zeros((0, 0), dtype=np.float32)
+
+        return embeddings[0] if single else embeddings
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+
+        encodings = self._tokenizer.encode_batch(texts)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+        inputs = {
+            "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": attention_mask,
+            "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+        }
+        token_embeddings = self._session.run(None, {k: v for k, v in inputs.items() if k in self._input_names})[0]
+
+        mask = attention_mask[:, :, None].astype(np.float32)
+        pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+
+        return (pooled / np.clip(norms, 1e-12, None)).astype(np.float32)
+
+
+def load_onnx_encoder(model_dir: str, threads: int, quantized: bool = False) -> OnnxSentenceEncoder:
+
+    return OnnxSentenceEncoder.from_directory(model_dir, quantized=quantized, threads=threads)
+
+
+class OnnxEmbeddingProvider(IEmbeddingProvider):
+    """
+    Embedding provider running the ONNX export of the sentence-transformer model in this process.
+    """
+
+    def __init__(self, encoder: OnnxSentenceEncoder):
+        self._encoder = encoder
+
+    async def generate_embedding(self, text: str) -> List[float]:
+
+        return await asyncio.to_thread(lambda: self._encoder.encode(text).tolist())
+
+    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+
+        return await asyncio.to_thread(lambda: self._encoder.encode(texts).tolist())
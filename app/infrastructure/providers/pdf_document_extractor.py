@@ -1,4 +1,5 @@
 import io
+from typing import Iterator
 
 from pypdf import PdfReader
 
@@ -7,14 +8,13 @@ from app.contracts.providers.i_document_text_extractor import IDocumentTextExtra
 
 class PdfDocumentExtractor(IDocumentTextExtractor):
     def extract_text(self, file_content: bytes) -> str:
+        return "\n".join(self.iter_segments(file_content)).strip()
+
+    def iter_segments(self, file_content: bytes) -> Iterator[str]:
         reader = PdfReader(io.BytesIO(file_content))
-        text = ""
 
         for page in reader.pages:
             page_text = page.extract_text()
             
             if page_text:
-                text += page_text + "\n"
-
-        return text.strip()
-
+                yield page_text
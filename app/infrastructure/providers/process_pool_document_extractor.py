@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from app.contracts.providers.i_async_document_text_extractor import IAsyncDocumentTextExtractor
+from app.contracts.providers.i_document_text_extractor import IDocumentTextExtractor
+from app.domain.exceptions.ingestion_exception import DocumentExtractionException
+
+logger = logging.getLogger(__name__)
+
+_worker_extractors: Dict[str, IDocumentTextExtractor] = {}
+
+
+def _init_worker(extractors: Dict[str, IDocumentTextExtractor]) -> None:
+
+    global _worker_extractors
+    _worker_extractors = extractors
+
+
+def _extract(extension: str, file_content: bytes) -> str:
+
+    return _worker_extractors[extension].extract_text(file_content)
+
+
+def _extract_segments(extension: str, file_content: bytes) -> List[str]:
+
+    return list(_worker_extractors[extension].iter_segments(file_content))
+
+
+@dataclass
+class DocumentExtractionStats:
+    extracted: int
+    failed: int
+    timed_out: int
+    pool_restarts: int
+    workers: int
+
+
+class ProcessPoolDocumentExtractor(IAsyncDocumentTextExtractor):
+    """
+    Runs the synchronous PDF/DOCX/RTF extractors in a pool of worker processes, so parsing neither
+    blocks the event loop nor holds the GIL of the API process, and the files of one archive are
+    extracted on several cores at once.
+
+    At most `workers` documents are submitted at a time, so timeout_seconds bounds the parse itself
+    rather than time spent queued. A parse that runs past it is killed by terminating the pool; the
+    other documents that were running in it are retried once on the fresh pool.
+    """
+
+    def __init__(
+        self,
+        extractors: Dict[str, IDocumentTextExtractor],
+        workers: int = 2,
+        timeout_seconds: float = 120.0,
+    ):
+
+        if workers < 1 or timeout_seconds <= 0:
+
+            raise ValueError("workers must be at least 1 and timeout_seconds positive")
+
+        self._extractors = extractors
+        self._workers = workers
+        self._timeout_seconds = timeout_seconds
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._slots = asyncio.Semaphore(workers)
+        self._extracted = 0
+        self._failed = 0
+        self._timed_out = 0
+        self._pool_restarts = 0
+
+    @property
+    def concurrency(self) -> int:
+
+        return self._workers
+
+    @property
+    def stats(self) -> DocumentExtractionStats:
+
+        return DocumentExtractionStats(
+            extracted=self._extracted,
+            failed=self._failed,
+            timed_out=self._timed_out,
+            pool_restarts=self._pool_restarts,
+            workers=self._workers,
+        )
+
+    def supports(self, extension: str) -> bool:
+
+        return extension in self._extractors
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+
+        if self._pool is None:
+            # spawn keeps the event loop and the parent's threads out of the children
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._extractors,),
+            )
+
+        return self._pool
+
+    def _kill_pool(self, pool: ProcessPoolExecutor) -> None:
+
+        if self._pool is not pool:
+
+            return
+
+        self._pool = None
+        self._pool_restarts += 1
+
+        # A running call cannot be cancelled, so its process is terminated; the executor has no public handle on them
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            process.terminate()
+
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    async def extract_text(self, extension: str, file_content: bytes) -> str:
+
+        return await self._submit(_extract, extension, file_content)
+
+    async def extract_segments(self, extension: str, file_content: bytes) -> List[str]:
+
+        # Segments come back in one piece: a worker's result crosses the process boundary as a whole
+        return await self._submit(_extract_segments, extension, file_content)
+
+    async def _submit(self, function: Callable[[str, bytes], Any], extension: str, file_content: bytes) -> Any:
+
+        if not self.supports(extension):
+
+            raise DocumentExtractionException(f"No extractor for '{extension}' documents")
+
+        async with self._slots:
+
+            for attempt in range(2):
+                pool = self._get_pool()
+
+                try:
+                    result = await asyncio.wait_for(
+                        asyncio.get_running_loop().run_in_executor(pool, function, extension, file_content),
+                        self._timeout_seconds,
+                    )
+                    self._extracted += 1
+
+                    return result
+
+                except asyncio.TimeoutError:
+                    self._timed_out += 1
+                    self._kill_pool(pool)
+                    logger.warning(f"Extraction of a {len(file_content)} byte '{extension}' document timed out, worker processes restarted")
+
+                    raise DocumentExtractionException(
+                        f"Extracting a '{extension}' document took longer than {self._timeout_seconds:g}s"
+                    )
+
+                except BrokenProcessPool as e:
+                    self._kill_pool(pool)
+
+                    # The pool was killed under this document (another parse timed out, or a worker crashed)
+                    if attempt == 0:
+                        logger.warning("Document extraction pool broke, retrying on a fresh pool")
+
+                        continue
+
+                    self._failed += 1
+
+                    raise DocumentExtractionException(f"Document extraction worker process died: {e}") from e
+
+                except Exception as e:
+                    self._failed += 1
+
+                    raise DocumentExtractionException(f"Failed extracting a '{extension}' document: {e}") from e
+
+    async def close(self) -> None:
+
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
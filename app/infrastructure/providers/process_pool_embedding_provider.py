@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Any, Callable, List, Optional
+
+import numpy as np
+
+from app.contracts.providers.i_embedding_provider import IEmbeddingProvider
+from app.domain.exceptions.search_exception import EmbeddingGenerationException
+
+logger = logging.getLogger(__name__)
+
+_worker_model: Any = None
+
+
+def load_sentence_transformer(model_name: str, threads: int) -> Any:
+
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    torch.set_num_threads(threads)
+
+    return SentenceTransformer(model_name, device="cpu")
+
+
+def _init_worker(loader: Callable[[str, int], Any], model_name: str, threads: int) -> None:
+
+    global _worker_model
+    _worker_model = loader(model_name, threads)
+
+
+def _encode_shared(segment_name: str, count: int, text_bytes: int, dimension: int, batch_size: int) -> None:
+    """
+    Worker side of a call: reads UTF-8 texts from the shared segment and writes float32
+    embeddings back into it. Segment layout: [embeddings count x dimension float32]
+    [offsets (count + 1) int64][text bytes].
+    """
+
+    segment = shared_memory.SharedMemory(name=segment_name)
+
+    try:
+        output_bytes = count * dimension * 4
+        offsets = np.ndarray((count + 1,), dtype=np.int64, buffer=segment.buf, offset=output_bytes)
+        data_start = output_bytes + offsets.nbytes
+        raw = bytes(segment.buf[data_start : data_start + text_bytes])
+        texts = [raw[offsets[i] : offsets[i + 1]].decode("utf-8") for i in range(count)]
+        del offsets
+
+        embeddings = _worker_model.encode(texts, batch_size=batch_size, convert_to_numpy=True, show_progress_bar=False)
+
+        if embeddings.shape != (count, dimension):
+
+            raise ValueError(f"Model returned embeddings of shape {embeddings.shape}, expected ({count}, {dimension})")
+
+        output = np.ndarray((count, dimension), dtype=np.float32, buffer=segment.buf)
+        output[:] = embeddings
+        del output
+
+    finally:
+        segment.close()
+
+
+class ProcessPoolEmbeddingProvider(IEmbeddingProvider):
+    """
+    Runs the sentence-transformer model in a pool of worker processes, each with its own model
+    copy and torch thread budget, so encoding neither holds the GIL of the API process nor
+    occupies the default thread pool. Large inputs are split into slices that run on several
+    workers at once. Texts and embeddings cross the process boundary through one shared
+    memory segment per slice instead of pickled lists.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        dimension: int = 384,
+        workers: int = 2,
+        threads_per_worker: int = 1,
+        slice_size: int = 64,
+        model_loader: Callable[[str, int], Any] = load_sentence_transformer,
+    ):
+
+        if workers < 1 or slice_size < 1:
+
+            raise ValueError("workers and slice_size must be at least 1")
+
+        self._model_name = model_name
+        self._dimension = dimension
+        self._workers = workers
+        self._threads_per_worker = threads_per_worker
+        self._slice_size = slice_size
+        self._model_loader = model_loader
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+
+        if self._pool is None:
+            # spawn keeps torch's thread pools and the event loop out of the children
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._model_loader, self._model_name, self._threads_per_worker),
+            )
+
+        return self._pool
+
+    async def start(self) -> None:
+        """
+        Summary: Starts the worker processes and loads their models ahead of the first request.
+        """
+
+        await asyncio.gather(*(self._encode_slice(["warm up"]) for _ in range(self._workers)))
+
+    async def generate_embedding(self, text: str) -> List[float]:
+
+        return (await self.generate_embeddings([text]))[0]
+
+    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+
+        if not texts:
+
+            return []
+
+        slices = [texts[i : i + self._slice_size] for i in range(0, len(texts), self._slice_size)]
+        results = await asyncio.gather(*(self._encode_slice(s) for s in slices))
+
+        return [embedding for result in results for embedding in result.tolist()]
+
+    async def _encode_slice(self, texts: List[str]) -> np.ndarray:
+
+        encoded = [t.encode("utf-8") for t in texts]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+        output_bytes = len(texts) * self._dimension * 4
+        text_bytes = int(offsets[-1])
+        segment = shared_memory.SharedMemory(create=True, size=max(output_bytes + offsets.nbytes + text_bytes, 1))
+
+        try:
+            segment.buf[output_bytes : output_bytes + offsets.nbytes] = offsets.tobytes()
+            segment.buf[output_bytes + offsets.nbytes : output_bytes + offsets.nbytes + text_bytes] = b"".join(encoded)
+
+            await asyncio.get_running_loop().run_in_executor(
+                self._get_pool(),
+                _encode_shared,
+                segment.name,
+                len(texts),
+                text_bytes,
+                self._dimension,
+                len(texts),
+            )
+
+            return np.ndarray((len(texts), self._dimension), dtype=np.float32, buffer=segment.buf).copy()
+
+        except BrokenProcessPool as e:
+            logger.error("Embedding worker process died, restarting the pool", exc_info=True)
+            self._pool = None
+
+            raise EmbeddingGenerationException(f"Embedding worker process died: {e}") from e
+
+        except Exception as e:
+            logger.error("Error generating embeddings in worker process", exc_info=True)
+
+            raise EmbeddingGenerationException(str(e)) from e
+
+        finally:
+            segment.close()
+            segment.unlink()
+
+    async def close(self) -> None:
+
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
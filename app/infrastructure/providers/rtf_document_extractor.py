@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from striprtf.striprtf import rtf_to_text
 from app.contracts.providers.i_document_text_extractor import IDocumentTextExtractor
 
@@ -11,3 +13,10 @@ class RtfDocumentExtractor(IDocumentTextExtractor):
         except Exception:
             return ""
 
+    def iter_segments(self, file_content: bytes) -> Iterator[str]:
+
+        # striprtf converts the whole document at once, so it is a single segment
+        text = self.extract_text(file_content)
+
+        if text:
+            yield text
@@ -1,12 +1,14 @@
 import asyncio
-from typing import List
-from sentence_transformers import SentenceTransformer
+from typing import TYPE_CHECKING, List
 
 from app.contracts.providers.i_embedding_provider import IEmbeddingProvider
 
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
 
 class SentenceTransformerEmbeddingProvider(IEmbeddingProvider):
-    def __init__(self, model: SentenceTransformer):
+    def __init__(self, model: "SentenceTransformer"):
         self._model = model
 
     async def generate_embedding(self, text: str) -> List[float]:
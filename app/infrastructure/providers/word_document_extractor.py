@@ -1,4 +1,5 @@
 import io
+from typing import Iterator
 
 import docx
 
@@ -7,13 +8,15 @@ from app.contracts.providers.i_document_text_extractor import IDocumentTextExtra
 
 class WordDocumentExtractor(IDocumentTextExtractor):
     def extract_text(self, file_content: bytes) -> str:
+        return "\n".join(self.iter_segments(file_content)).strip()
+
+    def iter_segments(self, file_content: bytes) -> Iterator[str]:
         doc = docx.Document(io.BytesIO(file_content))
-        parts = []
 
         for p in doc.paragraphs:
             
             if p.text.strip():
-                parts.append(p.text)
+                yield p.text
 
         for table in doc.tables:
             
@@ -22,7 +25,4 @@ class WordDocumentExtractor(IDocumentTextExtractor):
                 for cell in row.cells:
                     
                     if cell.text.strip():
-                        parts.append(cell.text)
-
-        return "\n".join(parts).strip()
-
+                        yield cell.text
@@ -1,10 +1,245 @@
-import urllib.request
+import asyncio
+import hashlib
+import io
+import logging
+import mmap
+import tempfile
+import zipfile
+from typing import IO, Optional
+
+import httpx
+
+from app.domain.exceptions.ingestion_exception import ArchiveDownloadException
+from app.infrastructure.caching.archive_disk_cache import ArchiveDiskCache
+
+logger = logging.getLogger(__name__)
+
+
+class _MappedArchiveReader(io.RawIOBase):
+    """
+    Read-only file view over a memory map; zipfile needs seekable(), which mmap lacks before Python 3.13.
+    """
+
+    def __init__(self, mapped: mmap.mmap):
+
+        self._map = mapped
+
+    def readable(self) -> bool:
+
+        return True
+
+    def seekable(self) -> bool:
+
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+
+        return self._map.read(size)
+
+    def readinto(self, buffer) -> int:
+
+        data = self._map.read(len(buffer))
+        buffer[: len(data)] = data
+
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+
+        self._map.seek(offset, whence)
+
+        return self._map.tell()
+
+    def tell(self) -> int:
+
+        return self._map.tell()
+
+
+class DownloadedArchive:
+    """
+    A downloaded archive held in a spooled temporary file (in memory while small, on disk beyond
+    the spool size) or in the archive cache. Archives on disk are opened through a read-only
+    memory map, so zipfile reads members straight from the page cache instead of a copy of the
+    whole archive in RAM. content_hash is the SHA-256 of the archive; from_cache is set when the
+    server answered 304 Not Modified.
+    """
+
+    def __init__(
+        self,
+        file: IO[bytes],
+        size: int,
+        on_disk: bool,
+        content_hash: Optional[str] = None,
+        from_cache: bool = False,
+    ):
+
+        self._file = file
+        self._map: Optional[mmap.mmap] = None
+        self.size = size
+        self.on_disk = on_disk
+        self.content_hash = content_hash
+        self.from_cache = from_cache
+
+    def open_zip(self) -> zipfile.ZipFile:
+
+        self._file.seek(0)
+
+        if self.on_disk and self.size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            return zipfile.ZipFile(_MappedArchiveReader(self._map))
+
+        return zipfile.ZipFile(self._file)
+
+    def close(self) -> None:
+
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+        self._file.close()
+
+    def __enter__(self) -> "DownloadedArchive":
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+
+        self.close()
 
 
 class ZipDownloader:
-    def download(self, url: str) -> bytes:
+    """
+    Streams supporting-document archives over a shared HTTP client into spooled temporary files.
+
+    The body is read in chunks, so the event loop keeps serving requests during the download and
+    memory stays at one chunk plus the spool size. Archives larger than max_bytes (by
+    Content-Length, or while streaming when the header is missing) are rejected. With a cache,
+    archives served with an ETag or Last-Modified are kept on disk and later requested
+    conditionally; a 304 reuses the cached copy without transferring the body.
+    """
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        connect_timeout_seconds: float = 10.0,
+        read_timeout_seconds: float = 60.0,
+        max_bytes: int = 4 * 2**30,
+        spool_max_bytes: int = 16 * 2**20,
+        chunk_size: int = 2**20,
+        temp_dir: Optional[str] = None,
+        cache: Optional[ArchiveDiskCache] = None,
+    ):
+
+        self._client = client or httpx.AsyncClient(
+            timeout=httpx.Timeout(read_timeout_seconds, connect=connect_timeout_seconds),
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+            follow_redirects=True,
+        )
+        self._max_bytes = max_bytes
+        self._spool_max_bytes = spool_max_bytes
+        self._chunk_size = chunk_size
+        self._temp_dir = temp_dir
+        self._cache = cache
+
+    async def download(self, url: str) -> DownloadedArchive:
+        """
+        Summary: Downloads an archive into a spooled temporary file, or revalidates the cached copy.
+
+        Args:
+            url (str): Archive URL.
+
+        Returns:
+            DownloadedArchive: The archive; the caller closes it, which deletes a temporary file.
+
+        Raises:
+            ArchiveDownloadException: If the request fails or the archive exceeds the size limit.
+        """
+
+        cached = self._cache.lookup(url) if self._cache is not None else None
+        headers = {}
+
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+
+        if cached is not None and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        file: Optional[IO[bytes]] = None
+        cacheable = False
+        size = 0
+        digest = hashlib.sha256()
+
+        try:
+
+            async with self._client.stream("GET", url, headers=headers) as response:
+
+                if cached is not None and response.status_code == 304:
+                    logger.info(f"Archive at {url} not modified, using the cached copy")
+
+                    return DownloadedArchive(
+                        self._cache.open(cached), cached.size, on_disk=True, content_hash=cached.content_hash, from_cache=True
+                    )
+
+                response.raise_for_status()
+                declared = int(response.headers.get("Content-Length") or 0)
+
+                if declared > self._max_bytes:
+
+                    raise ArchiveDownloadException(f"Archive at {url} is {declared} bytes, above the {self._max_bytes} byte limit")
+
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                # Only archives the server can revalidate are worth keeping
+                cacheable = self._cache is not None and bool(etag or last_modified)
+                file = self._cache.create_partial() if cacheable else tempfile.SpooledTemporaryFile(
+                    max_size=self._spool_max_bytes, dir=self._temp_dir
+                )
+
+                async for chunk in response.aiter_bytes(self._chunk_size):
+                    size += len(chunk)
+
+                    if size > self._max_bytes:
+
+                        raise ArchiveDownloadException(f"Archive at {url} exceeds the {self._max_bytes} byte limit")
+
+                    digest.update(chunk)
+
+                    # Small chunks stay in memory; once spooled to disk, writes leave the event loop
+                    if cacheable or size > self._spool_max_bytes:
+                        await asyncio.to_thread(file.write, chunk)
+                    else:
+                        file.write(chunk)
+
+            if cacheable:
+                await asyncio.to_thread(self._cache.store, url, file, size, digest.hexdigest(), etag, last_modified)
+
+        except (httpx.HTTPError, OSError) as e:
+            self._discard(file, cacheable)
+
+            raise ArchiveDownloadException(f"Failed downloading archive from {url}: {e}") from e
+
+        except BaseException:
+            self._discard(file, cacheable)
+
+            raise
+
+        logger.info(f"Downloaded {size} byte archive from {url}")
+
+        return DownloadedArchive(
+            file, size, on_disk=cacheable or size > self._spool_max_bytes, content_hash=digest.hexdigest()
+        )
+
+    def _discard(self, file: Optional[IO[bytes]], cacheable: bool) -> None:
+
+        if file is None:
+
+            return
+
+        if cacheable:
+            self._cache.discard_partial(file)
+        else:
+            file.close()
 
-        with urllib.request.urlopen(url) as response:
-            
-            return response.read()
+    async def close(self) -> None:
 
+        await self._client.aclose()
@@ -1,10 +1,12 @@
+from datetime import datetime, timedelta
 from typing import List
 
-from sqlalchemy import or_, select
+from sqlalchemy import delete, exists, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.contracts.repositories.i_dataset_supporting_document_queue_repository import IDatasetSupportingDocumentQueueRepository
 from app.domain.entities.dataset_supporting_document_queue import DatasetSupportingDocumentQueue
+from app.domain.entities.ingestion_lease import IngestionLease
 from app.infrastructure.data_access.base_repository import BaseRepository
 
 
@@ -12,18 +14,104 @@ class DatasetSupportingDocumentQueueRepository(BaseRepository[DatasetSupportingD
     def __init__(self, session: AsyncSession):
         super().__init__(DatasetSupportingDocumentQueue, session)
 
-    async def get_pending_queue_items(self) -> List[DatasetSupportingDocumentQueue]:
-        stmt = select(self.model).filter(
-            or_(
-                self.model.processed_title_for_embedding == False,
-                self.model.processed_abstract_for_embedding == False,
-                self.model.processed_supporting_docs_for_embedding == False,
-                (self.model.updated_at != None) & 
-                (or_(self.model.last_updated_at == None, self.model.updated_at > self.model.last_updated_at))
-            )
+    def _pending_condition(self):
+        return or_(
+            self.model.processed_title_for_embedding == False,
+            self.model.processed_abstract_for_embedding == False,
+            self.model.processed_supporting_docs_for_embedding == False,
+            (self.model.updated_at != None) & 
+            (or_(self.model.last_updated_at == None, self.model.updated_at > self.model.last_updated_at))
         )
+
+    async def get_pending_queue_items(self) -> List[DatasetSupportingDocumentQueue]:
+        stmt = select(self.model).filter(self._pending_condition())
         
         result = await self.session.execute(stmt)
         
         return list(result.scalars().all())
 
+    async def claim_pending_queue_items(self, owner: str, limit: int, lease_seconds: float) -> List[DatasetSupportingDocumentQueue]:
+        now = datetime.utcnow()
+        queue_id = self.model.dataset_supporting_document_queue_id
+        candidates = (
+            select(queue_id)
+            .where(self._pending_condition(), self.model.is_processing == False)
+            .order_by(queue_id)
+            .limit(limit)
+        )
+
+        # One conditional UPDATE: a row another worker flagged in the meantime is simply not returned
+        stmt = (
+            update(self.model)
+            .where(queue_id.in_(candidates), self.model.is_processing == False)
+            .values(is_processing=True)
+            .returning(self.model)
+            .execution_options(synchronize_session=False)
+        )
+        claimed = list((await self.session.execute(stmt)).scalars().all())
+
+        self.session.add_all([
+            IngestionLease(
+                dataset_supporting_document_queue_id=item.dataset_supporting_document_queue_id,
+                owner=owner,
+                claimed_at=now,
+                expires_at=now + timedelta(seconds=lease_seconds),
+            )
+            for item in claimed
+        ])
+        await self.session.flush()
+
+        return claimed
+
+    async def renew_leases(self, owner: str, queue_item_ids: List[int], lease_seconds: float) -> int:
+        if not queue_item_ids:
+            return 0
+
+        result = await self.session.execute(
+            update(IngestionLease)
+            .where(
+                IngestionLease.owner == owner,
+                IngestionLease.dataset_supporting_document_queue_id.in_(queue_item_ids),
+            )
+            .values(expires_at=datetime.utcnow() + timedelta(seconds=lease_seconds))
+            .execution_options(synchronize_session=False)
+        )
+
+        return result.rowcount
+
+    async def release_queue_item(self, owner: str, queue_item_id: int) -> bool:
+        held = exists().where(
+            IngestionLease.dataset_supporting_document_queue_id == queue_item_id,
+            IngestionLease.owner == owner,
+        )
+        result = await self.session.execute(
+            update(self.model)
+            .where(self.model.dataset_supporting_document_queue_id == queue_item_id, held)
+            .values(is_processing=False)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(
+            delete(IngestionLease).where(
+                IngestionLease.dataset_supporting_document_queue_id == queue_item_id,
+                IngestionLease.owner == owner,
+            )
+        )
+
+        return result.rowcount == 1
+
+    async def recover_expired_leases(self) -> int:
+        now = datetime.utcnow()
+        queue_id = self.model.dataset_supporting_document_queue_id
+        expired = select(IngestionLease.dataset_supporting_document_queue_id).where(IngestionLease.expires_at < now)
+
+        # Only rows whose lease expired: a row flagged without a lease is being processed outside the worker
+        # (the .NET ETL or a synchronous process-dataset request) and is not ours to hand out again
+        result = await self.session.execute(
+            update(self.model)
+            .where(self.model.is_processing == True, queue_id.in_(expired))
+            .values(is_processing=False)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(delete(IngestionLease).where(IngestionLease.expires_at < now))
+
+        return result.rowcount
@@ -0,0 +1,876 @@
+import asyncio
+import json
+import logging
+import os
+import shutil
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.contracts.repositories.i_vector_store_repository import IVectorStoreRepository
+from app.domain.exceptions.search_exception import VectorStoreException
+from app.domain.value_objects.search_result import SearchResult
+from app.infrastructure.repositories.point_ids import make_point_id
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _StoreState:
+    point_ids: List[int]
+    payloads: List[dict]
+    alive: np.ndarray
+    rows_by_point: Dict[int, int]
+    rows_by_identifier: Dict[str, Set[int]]
+    vectors: Optional[np.memmap]
+
+
+class NumpyVectorStoreRepository(IVectorStoreRepository):
+    """
+    Embedded exact-search vector store for deployments without a Qdrant server.
+
+    Normalized vectors are appended to a raw float16/float32 file that is memory-mapped for
+    search, with a JSONL sidecar holding one payload per row. Re-indexing a point or deleting
+    an identifier only tombstones rows, and payload updates are appended to their own log;
+    compaction rewrites both files once the share of dead rows passes compaction_ratio. The data files live in a
+    generation directory named by the CURRENT file: compaction writes a new generation and switches to it by replacing
+    CURRENT, so a crash leaves either the old files or the new ones, never a mix, and no memory-mapped file is ever
+    replaced or deleted while mapped (which Windows refuses). Writers replace arrays instead of mutating them
+    and publish vectors, liveness, payloads and filter columns as one snapshot tuple, so searches running in worker threads
+    always see a consistent view, including while compaction renumbers every row.
+    """
+
+    VECTORS_FILE = "vectors.bin"
+    PAYLOADS_FILE = "payloads.jsonl"
+    TOMBSTONES_FILE = "tombstones.txt"
+    PAYLOAD_UPDATES_FILE = "payload_updates.jsonl"
+    META_FILE = "meta.json"
+    CURRENT_FILE = "CURRENT"
+    GENERATION_PREFIX = "gen-"
+    SCORE_BLOCK_ROWS = 32768
+
+    def __init__(
+        self,
+        data_dir: str,
+        vector_size: int = 384,
+        dtype: str = "float32",
+        compaction_ratio: float = 0.3,
+    ):
+
+        if dtype not in ("float16", "float32"):
+
+            raise ValueError("dtype must be 'float16' or 'float32'")
+
+        self._dir = data_dir
+        # Empty for a store written before generations: its data files sit in data_dir itself
+        self._generation = ""
+        self._vector_size = vector_size
+        self._dtype = np.dtype(dtype)
+        self._compaction_ratio = compaction_ratio
+        self._lock = asyncio.Lock()
+        self._loaded = False
+        self._vectors: Optional[np.memmap] = None
+        self._point_ids: List[int] = []
+        self._payloads: List[dict] = []
+        self._alive = np.zeros(0, dtype=bool)
+        self._rows_by_point: Dict[int, int] = {}
+        self._rows_by_identifier: Dict[str, Set[int]] = {}
+        self._columns: Dict[str, np.ndarray] = {}
+        self._snapshot: Tuple[Optional[np.memmap], np.ndarray, List[dict], Dict[str, np.ndarray]] = (None, self._alive, [], {})
+
+    @property
+    def row_count(self) -> int:
+
+        return len(self._payloads)
+
+    @property
+    def live_count(self) -> int:
+
+        return int(self._alive.sum())
+
+    async def initialize(self) -> None:
+
+        try:
+            await self._ensure_loaded()
+
+        except Exception as e:
+            logger.error("Error loading numpy vector store", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def close(self) -> None:
+
+        async with self._lock:
+            self._vectors = None
+            self._publish()
+            self._loaded = False
+
+    async def _ensure_loaded(self):
+
+        if self._loaded:
+
+            return
+
+        async with self._lock:
+
+            if not self._loaded:
+                await asyncio.to_thread(self._load)
+                self._loaded = True
+
+    def _path(self, name: str) -> str:
+
+        return os.path.join(self._dir, self._generation, name)
+
+    def _load(self) -> None:
+
+        os.makedirs(self._dir, exist_ok=True)
+        self._generation = self._read_generation()
+        self._install(self._read_state())
+        self._remove_stale_generations()
+
+    def _read_generation(self) -> str:
+
+        current_path = os.path.join(self._dir, self.CURRENT_FILE)
+
+        if os.path.exists(current_path):
+
+            with open(current_path, encoding="utf-8") as f:
+
+                return f.read().strip()
+
+        if os.path.exists(os.path.join(self._dir, self.PAYLOADS_FILE)):
+
+            return ""
+
+        generation = f"{self.GENERATION_PREFIX}{1:06d}"
+        os.makedirs(os.path.join(self._dir, generation), exist_ok=True)
+        self._switch_generation(generation)
+
+        return generation
+
+    def _switch_generation(self, generation: str) -> None:
+
+        # The one atomic step of a compaction: CURRENT is small and never memory-mapped
+        current_path = os.path.join(self._dir, self.CURRENT_FILE)
+        tmp_path = current_path + ".tmp"
+
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(generation)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, current_path)
+
+    def _remove_stale_generations(self) -> None:
+        """
+        Summary: Deletes the files of older generations and of compactions interrupted before their switch.
+
+        A file still mapped by a search (or on Windows, by any open map) cannot be deleted yet; it is
+        left in place and removed by a later compaction or load.
+        """
+
+        for name in os.listdir(self._dir):
+
+            if name.startswith(self.GENERATION_PREFIX) and name != self._generation:
+                shutil.rmtree(os.path.join(self._dir, name), ignore_errors=True)
+
+        if self._generation:
+
+            for name in (self.VECTORS_FILE, self.PAYLOADS_FILE, self.TOMBSTONES_FILE, self.PAYLOAD_UPDATES_FILE):
+
+                try:
+                    os.remove(os.path.join(self._dir, name))
+
+                except OSError:
+                    pass
+
+    def _read_state(self) -> _StoreState:
+
+        meta_path = os.path.join(self._dir, self.META_FILE)
+
+        if os.path.exists(meta_path):
+
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+
+            if meta["vector_size"] != self._vector_size or meta["dtype"] != self._dtype.name:
+
+                raise VectorStoreException(
+                    f"Vector store at {self._dir} holds {meta['vector_size']}-d {meta['dtype']} vectors, "
+                    f"expected {self._vector_size}-d {self._dtype.name}"
+                )
+        else:
+
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump({"vector_size": self._vector_size, "dtype": self._dtype.name}, f)
+
+        point_ids: List[int] = []
+        payloads: List[dict] = []
+
+        if os.path.exists(self._path(self.PAYLOADS_FILE)):
+
+            with open(self._path(self.PAYLOADS_FILE), encoding="utf-8") as f:
+
+                for line in f:
+
+                    try:
+                        record = json.loads(line)
+
+                    except json.JSONDecodeError:
+                        # A torn final line from an interrupted append; rows after it are discarded
+                        break
+
+                    point_ids.append(int(record["id"]))
+                    payloads.append(record["payload"])
+
+        # Vectors are appended before payloads, so extra trailing vector rows belong to an unfinished write
+        row_bytes = self._vector_size * self._dtype.itemsize
+        vectors_path = self._path(self.VECTORS_FILE)
+        stored_rows = os.path.getsize(vectors_path) // row_bytes if os.path.exists(vectors_path) else 0
+        rows = min(stored_rows, len(payloads))
+
+        if os.path.exists(vectors_path) and os.path.getsize(vectors_path) != rows * row_bytes:
+
+            with open(vectors_path, "r+b") as f:
+                f.truncate(rows * row_bytes)
+
+        point_ids, payloads = point_ids[:rows], payloads[:rows]
+
+        if len(payloads) != rows:
+
+            raise VectorStoreException(f"Vector store at {self._dir} is missing payload rows")
+
+        if os.path.exists(self._path(self.PAYLOAD_UPDATES_FILE)):
+
+            with open(self._path(self.PAYLOAD_UPDATES_FILE), encoding="utf-8") as f:
+
+                for line in f:
+
+                    try:
+                        update = json.loads(line)
+
+                    except json.JSONDecodeError:
+
+                        break
+
+                    if update["row"] < rows:
+                        payloads[update["row"]] = {**payloads[update["row"]], **update["set"]}
+
+        alive = np.ones(rows, dtype=bool)
+
+        if os.path.exists(self._path(self.TOMBSTONES_FILE)):
+
+            with open(self._path(self.TOMBSTONES_FILE), encoding="utf-8") as f:
+                dead = [int(line) for line in f if line.strip()]
+
+            alive[[row for row in dead if row < rows]] = False
+
+        rows_by_point: Dict[int, int] = {}
+
+        for row, point_id in enumerate(point_ids):
+
+            # Last write wins if a superseded row was never tombstoned
+            if point_id in rows_by_point:
+                alive[rows_by_point[point_id]] = False
+
+            if alive[row]:
+                rows_by_point[point_id] = row
+
+        rows_by_identifier: Dict[str, Set[int]] = {}
+
+        for row in np.flatnonzero(alive):
+            rows_by_identifier.setdefault(payloads[row].get("identifier", ""), set()).add(int(row))
+
+        return _StoreState(point_ids, payloads, alive, rows_by_point, rows_by_identifier, self._map_vectors(rows))
+
+    def _install(self, state: _StoreState) -> None:
+
+        self._point_ids = state.point_ids
+        self._payloads = state.payloads
+        self._alive = state.alive
+        self._rows_by_point = state.rows_by_point
+        self._rows_by_identifier = state.rows_by_identifier
+        self._vectors = state.vectors
+        self._columns = {}
+        self._publish()
+
+    def _publish(self) -> None:
+
+        # A single attribute write, so a search never pairs vectors with payloads of another layout
+        self._snapshot = (self._vectors, self._alive, self._payloads, self._columns)
+
+    def _map_vectors(self, rows: int) -> Optional[np.memmap]:
+
+        return (
+            np.memmap(self._path(self.VECTORS_FILE), dtype=self._dtype, mode="r", shape=(rows, self._vector_size))
+            if rows
+            else None
+        )
+
+    def _remap(self) -> None:
+
+        self._vectors = self._map_vectors(len(self._payloads))
+        self._columns = {}
+        self._publish()
+
+    def _column(self, payloads: List[dict], columns: Dict[str, np.ndarray], name: str) -> np.ndarray:
+
+        column = columns.get(name)
+
+        if column is None or len(column) != len(payloads):
+            # Keyword filters match case-insensitively, except dataset identifiers
+            column = np.array([self._keyword(name, p.get(name)) for p in payloads], dtype=object)
+            columns[name] = column
+
+        return column
+
+    @staticmethod
+    def _keyword(name: str, value) -> str:
+
+        value = str(value or "")
+
+        return value if name == "identifier" else value.lower()
+
+    def _normalize(self, vectors: np.ndarray) -> np.ndarray:
+
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self._vector_size)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+
+        return vectors / np.where(norms == 0, 1.0, norms)
+
+    def _append(self, point_ids: List[int], vectors: List[List[float]], payloads: List[dict]) -> None:
+
+        normalized = self._normalize(np.asarray(vectors, dtype=np.float32))
+
+        with open(self._path(self.VECTORS_FILE), "ab") as f:
+            f.write(normalized.astype(self._dtype).tobytes())
+
+        with open(self._path(self.PAYLOADS_FILE), "a", encoding="utf-8") as f:
+            f.writelines(
+                json.dumps({"id": point_id, "payload": payload}) + "\n"
+                for point_id, payload in zip(point_ids, payloads)
+            )
+
+        start = len(self._payloads)
+        superseded = [self._rows_by_point[p] for p in point_ids if p in self._rows_by_point]
+
+        # Copy-on-write so concurrent searches keep a consistent view
+        self._payloads = self._payloads + list(payloads)
+        self._point_ids = self._point_ids + list(point_ids)
+        self._alive = np.concatenate([self._alive, np.ones(len(point_ids), dtype=bool)])
+
+        for offset, (point_id, payload) in enumerate(zip(point_ids, payloads)):
+            row = start + offset
+
+            if point_id in self._rows_by_point and self._rows_by_point[point_id] >= start:
+                # Same point twice in one batch: the later row wins
+                superseded.append(self._rows_by_point[point_id])
+
+            self._rows_by_point[point_id] = row
+            self._rows_by_identifier.setdefault(payload.get("identifier", ""), set()).add(row)
+
+        self._tombstone(superseded)
+        self._remap()
+
+    def _tombstone(self, rows: List[int], publish: bool = True) -> None:
+
+        if not rows:
+
+            return
+
+        with open(self._path(self.TOMBSTONES_FILE), "a", encoding="utf-8") as f:
+            f.writelines(f"{row}\n" for row in rows)
+
+        alive = self._alive.copy()
+        alive[rows] = False
+        self._alive = alive
+
+        if publish:
+            self._publish()
+
+        for row in rows:
+            payload = self._payloads[row]
+            identifier_rows = self._rows_by_identifier.get(payload.get("identifier", ""))
+
+            if identifier_rows is not None:
+                identifier_rows.discard(row)
+
+            if self._rows_by_point.get(self._point_ids[row]) == row:
+                del self._rows_by_point[self._point_ids[row]]
+
+    def _set_payloads(self, updates: List[Tuple[int, dict]], publish: bool = True) -> None:
+
+        if not updates:
+
+            return
+
+        with open(self._path(self.PAYLOAD_UPDATES_FILE), "a", encoding="utf-8") as f:
+            f.writelines(json.dumps({"row": row, "set": values}) + "\n" for row, values in updates)
+
+        payloads = list(self._payloads)
+
+        for row, values in updates:
+            payloads[row] = {**payloads[row], **values}
+
+        self._payloads = payloads
+        self._columns = {}
+
+        if publish:
+            self._publish()
+
+    def _commit_version(
+        self,
+        identifier: str,
+        dataset_version: str,
+        retained_payloads: List[dict],
+        retained_archives: List[str]
+    ) -> None:
+
+        updates = []
+
+        for payload in retained_payloads:
+            row = self._rows_by_point.get(make_point_id(identifier, payload.get("content_type", ""), payload))
+
+            if row is not None:
+                updates.append((row, {**payload, "dataset_version": dataset_version, "staged": False}))
+
+        rows = sorted(self._rows_by_identifier.get(identifier, set()))
+        archives = set(retained_archives)
+        updates += [
+            (row, {"dataset_version": dataset_version})
+            for row in rows
+            if self._payloads[row].get("archive_hash") in archives and not self._payloads[row].get("staged")
+        ]
+        updates += [
+            (row, {"staged": False})
+            for row in rows
+            if self._payloads[row].get("dataset_version") == dataset_version and self._payloads[row].get("staged")
+        ]
+        self._set_payloads(updates, publish=False)
+        self._tombstone([row for row in rows if self._payloads[row].get("dataset_version") != dataset_version], publish=False)
+        # One snapshot swap: searches see either the old version or the new one
+        self._publish()
+
+    def _compact(self) -> _StoreState:
+        """
+        Summary: Writes the live rows into a new generation, switches to it and returns its state; the caller installs it.
+
+        The current arrays stay published until then and their files are left untouched, so searches
+        running meanwhile still see the complete pre-compaction view.
+        """
+
+        live_rows = np.flatnonzero(self._alive)
+        number = int(self._generation[len(self.GENERATION_PREFIX):]) if self._generation else 0
+        generation = f"{self.GENERATION_PREFIX}{number + 1:06d}"
+        generation_dir = os.path.join(self._dir, generation)
+
+        # Left over from a compaction interrupted before its switch
+        shutil.rmtree(generation_dir, ignore_errors=True)
+        os.makedirs(generation_dir)
+
+        with open(os.path.join(generation_dir, self.VECTORS_FILE), "wb") as f:
+
+            for start in range(0, len(live_rows), self.SCORE_BLOCK_ROWS):
+                f.write(np.asarray(self._vectors[live_rows[start : start + self.SCORE_BLOCK_ROWS]]).tobytes())
+
+            f.flush()
+            os.fsync(f.fileno())
+
+        with open(os.path.join(generation_dir, self.PAYLOADS_FILE), "w", encoding="utf-8") as f:
+            f.writelines(
+                json.dumps({"id": self._point_ids[row], "payload": self._payloads[row]}) + "\n"
+                for row in live_rows
+            )
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._switch_generation(generation)
+        self._generation = generation
+
+        return self._read_state()
+
+    def _install_compacted(self, state: _StoreState) -> None:
+
+        # The previous map is dropped here; searches still holding the old snapshot keep theirs alive
+        self._install(state)
+        self._remove_stale_generations()
+
+    async def compact(self) -> int:
+
+        await self._ensure_loaded()
+
+        async with self._lock:
+            removed = self.row_count - self.live_count
+
+            if removed:
+                self._install_compacted(await asyncio.to_thread(self._compact))
+
+            return removed
+
+    async def _maybe_compact(self) -> None:
+
+        if self.row_count and (self.row_count - self.live_count) / self.row_count > self._compaction_ratio:
+            removed = self.row_count - self.live_count
+            self._install_compacted(await asyncio.to_thread(self._compact))
+            logger.info(f"Compacted numpy vector store: {removed} dead row(s) removed")
+
+    def _score(self, vectors: np.ndarray, queries: np.ndarray) -> np.ndarray:
+
+        scores = np.empty((len(queries), len(vectors)), dtype=np.float32)
+
+        for start in range(0, len(vectors), self.SCORE_BLOCK_ROWS):
+            block = np.asarray(vectors[start : start + self.SCORE_BLOCK_ROWS], dtype=np.float32)
+            scores[:, start : start + len(block)] = queries @ block.T
+
+        return scores
+
+    def _candidate_mask(
+        self,
+        alive: np.ndarray,
+        payloads: List[dict],
+        columns: Dict[str, np.ndarray],
+        content_types: Optional[List[str]],
+        file_extensions: Optional[List[str]],
+        identifiers: Optional[List[str]],
+    ) -> np.ndarray:
+
+        mask = alive
+
+        for name, values in (
+            ("content_type", content_types),
+            ("file_extension", file_extensions),
+            ("identifier", identifiers),
+        ):
+
+            if values:
+                column = self._column(payloads, columns, name)
+                mask = mask & np.isin(column, [self._keyword(name, v) for v in values])
+
+        # Chunks of an uncommitted dataset version stay hidden
+        return mask & (self._column(payloads, columns, "staged") != "true")
+
+    def _search_rows(
+        self,
+        query_embeddings: List[List[float]],
+        filters: List[dict],
+        grouped: bool,
+    ) -> List[List[SearchResult]]:
+
+        vectors, alive, payloads, columns = self._snapshot
+
+        if vectors is None:
+
+            return [[] for _ in query_embeddings]
+
+        rows = len(vectors)
+        alive, payloads = alive[:rows], payloads[:rows]
+        all_scores = self._score(vectors, self._normalize(np.asarray(query_embeddings, dtype=np.float32)))
+        results: List[List[SearchResult]] = []
+
+        for scores, f in zip(all_scores, filters):
+            mask = self._candidate_mask(
+                alive, payloads, columns, f.get("content_types"), f.get("file_extensions"), f.get("identifiers")
+            )
+
+            if f["min_score"] > 0:
+                mask = mask & (scores >= f["min_score"])
+
+            candidates = np.flatnonzero(mask)
+            wanted = f["offset"] + f["limit"]
+
+            if grouped:
+                ordered = candidates[np.argsort(-scores[candidates], kind="stable")]
+                identifiers = self._column(payloads, columns, "identifier")[ordered]
+                _, first = np.unique(identifiers, return_index=True)
+                selected = ordered[np.sort(first)][:wanted]
+            else:
+
+                if len(candidates) > wanted:
+                    candidates = candidates[np.argpartition(-scores[candidates], wanted - 1)[:wanted]]
+
+                selected = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+            results.append([
+                self._to_search_result(payloads[row], float(scores[row]))
+                for row in selected[f["offset"] : wanted]
+            ])
+
+        return results
+
+    @staticmethod
+    def _to_search_result(payload: dict, score: float) -> SearchResult:
+
+        return SearchResult(
+            identifier=payload.get("identifier", ""),
+            content_type=payload.get("content_type"),
+            text=payload.get("text"),
+            score=score,
+            metadata=payload,
+            title=payload.get("title"),
+            description=payload.get("description")
+        )
+
+    async def search_similar(
+        self,
+        query_embedding: List[float],
+        limit: int = 10,
+        offset: int = 0,
+        min_score: float = 0.0,
+        content_types: Optional[List[str]] = None,
+        file_extensions: Optional[List[str]] = None,
+        identifiers: Optional[List[str]] = None,
+    ) -> List[SearchResult]:
+
+        try:
+            await self._ensure_loaded()
+
+            filters = {
+                "limit": limit,
+                "offset": offset,
+                "min_score": min_score,
+                "content_types": content_types,
+                "file_extensions": file_extensions,
+                "identifiers": identifiers,
+            }
+
+            return (await asyncio.to_thread(self._search_rows, [query_embedding], [filters], False))[0]
+
+        except Exception as e:
+            logger.error("Error searching numpy vectors", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def search_grouped(
+        self,
+        query_embedding: List[float],
+        group_by: str = "identifier",
+        limit: int = 10,
+        min_score: float = 0.0,
+        content_types: Optional[List[str]] = None,
+        file_extensions: Optional[List[str]] = None,
+        identifiers: Optional[List[str]] = None,
+    ) -> List[SearchResult]:
+
+        if group_by != "identifier":
+
+            raise NotImplementedError("The numpy vector store only groups by identifier")
+
+        try:
+            await self._ensure_loaded()
+
+            filters = {
+                "limit": limit,
+                "offset": 0,
+                "min_score": min_score,
+                "content_types": content_types,
+                "file_extensions": file_extensions,
+                "identifiers": identifiers,
+            }
+
+            return (await asyncio.to_thread(self._search_rows, [query_embedding], [filters], True))[0]
+
+        except Exception as e:
+            logger.error("Error running grouped search on numpy vectors", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def index_embedding(
+        self,
+        identifier: str,
+        content_type: str,
+        text: str,
+        embedding: List[float],
+        metadata: Optional[dict] = None,
+    ) -> bool:
+
+        payload = {
+            "identifier": identifier,
+            "content_type": content_type,
+            "text": text,
+        }
+
+        if metadata:
+            payload.update(metadata)
+
+        return await self._index(identifier, content_type, [embedding], [payload])
+
+    async def index_embeddings_batch(
+        self,
+        identifier: str,
+        content_type: str,
+        embeddings: List[List[float]],
+        payloads: List[dict],
+    ) -> bool:
+
+        return await self._index(identifier, content_type, embeddings, payloads)
+
+    async def _index(
+        self,
+        identifier: str,
+        content_type: str,
+        embeddings: List[List[float]],
+        payloads: List[dict],
+    ) -> bool:
+
+        try:
+            await self._ensure_loaded()
+
+            point_ids = [make_point_id(identifier, content_type, payload) for payload in payloads]
+
+            async with self._lock:
+                await asyncio.to_thread(self._append, point_ids, embeddings, payloads)
+                await self._maybe_compact()
+
+            return True
+
+        except Exception as e:
+            logger.error("Error indexing embeddings in numpy vector store", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def find_indexed_chunks(self, identifier: str, content_type: str, payloads: List[dict]) -> List[bool]:
+
+        try:
+            await self._ensure_loaded()
+
+            return [make_point_id(identifier, content_type, payload) in self._rows_by_point for payload in payloads]
+
+        except Exception as e:
+            logger.error("Error looking up indexed chunks in numpy vector store", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def count_archive_chunks(self, identifier: str, archive_hash: str) -> int:
+
+        try:
+            await self._ensure_loaded()
+
+            # Under the lock: commits and deletes update the row sets from a worker thread
+            async with self._lock:
+
+                return sum(
+                    1
+                    for row in self._rows_by_identifier.get(identifier, set())
+                    if self._payloads[row].get("archive_hash") == archive_hash and not self._payloads[row].get("staged")
+                )
+
+        except Exception as e:
+            logger.error("Error counting archive chunks in numpy vector store", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def find_archive_hash(self, identifier: str, archive_url: str) -> Optional[str]:
+
+        try:
+            await self._ensure_loaded()
+
+            async with self._lock:
+
+                for row in self._rows_by_identifier.get(identifier, set()):
+                    payload = self._payloads[row]
+
+                    if payload.get("archive_url") == archive_url and not payload.get("staged"):
+
+                        return payload.get("archive_hash")
+
+            return None
+
+        except Exception as e:
+            logger.error("Error looking up archive of a supporting-document URL in numpy vector store", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def delete_stale_chunks(self, identifier: str, content_type: str, kept_content_hashes: List[str]) -> bool:
+
+        try:
+            await self._ensure_loaded()
+
+            kept = set(kept_content_hashes)
+
+            async with self._lock:
+                rows = [
+                    row
+                    for row in sorted(self._rows_by_identifier.get(identifier, set()))
+                    if self._payloads[row].get("content_type") == content_type
+                    and not self._payloads[row].get("staged")
+                    and self._payloads[row].get("content_hash") not in kept
+                ]
+                await asyncio.to_thread(self._tombstone, rows)
+                await self._maybe_compact()
+
+            return True
+
+        except Exception as e:
+            logger.error("Error deleting stale chunks in numpy vector store", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def commit_dataset_version(
+        self,
+        identifier: str,
+        dataset_version: str,
+        retained_payloads: List[dict],
+        retained_archives: Optional[List[str]] = None
+    ) -> bool:
+
+        try:
+            await self._ensure_loaded()
+
+            async with self._lock:
+                await asyncio.to_thread(
+                    self._commit_version, identifier, dataset_version, retained_payloads, retained_archives or []
+                )
+                await self._maybe_compact()
+
+            return True
+
+        except Exception as e:
+            logger.error("Error committing dataset version in numpy vector store", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def discard_dataset_version(
+        self,
+        identifier: str,
+        dataset_version: str,
+        archive_hashes: Optional[List[str]] = None
+    ) -> bool:
+
+        try:
+            await self._ensure_loaded()
+
+            async with self._lock:
+                rows = [
+                    row
+                    for row in sorted(self._rows_by_identifier.get(identifier, set()))
+                    if self._payloads[row].get("dataset_version") == dataset_version
+                    and self._payloads[row].get("staged")
+                    and (not archive_hashes or self._payloads[row].get("archive_hash") in archive_hashes)
+                ]
+                await asyncio.to_thread(self._tombstone, rows)
+                await self._maybe_compact()
+
+            return True
+
+        except Exception as e:
+            logger.error("Error discarding dataset version in numpy vector store", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def delete_embeddings(self, identifier: str) -> bool:
+
+        try:
+            await self._ensure_loaded()
+
+            async with self._lock:
+                rows = sorted(self._rows_by_identifier.pop(identifier, set()))
+                await asyncio.to_thread(self._tombstone, rows)
+                await self._maybe_compact()
+
+            return True
+
+        except Exception as e:
+            logger.error("Error deleting embeddings in numpy vector store", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
@@ -0,0 +1,32 @@
+import hashlib
+from typing import Optional
+
+
+def make_point_id(identifier: str, content_type: str, payload: Optional[dict] = None) -> int:
+    """
+    Summary: Derives the stable vector point id of a chunk, so re-ingesting it overwrites the old point.
+
+    Chunks carrying a content_hash are content-addressed: the id depends on the source file, the
+    text hash and which repeat of that text in the file it is, so unchanged chunks keep their id
+    when a document is re-indexed and changed chunks never overwrite the points still being served.
+
+    Args:
+        identifier (str): Dataset identifier.
+        content_type (str): Content type of the chunk.
+        payload (Optional[dict]): Chunk payload; its content_hash or chunk_index, if any, is part of the id.
+
+    Returns:
+        int: A non-negative 63-bit point id.
+    """
+
+    if payload and "content_hash" in payload:
+        point_id_str = (
+            f"{identifier}_{content_type}_{payload.get('source_file')}_"
+            f"{payload['content_hash']}_{payload.get('content_occurrence', 0)}"
+        )
+    elif payload and "chunk_index" in payload:
+        point_id_str = f"{identifier}_{content_type}_{payload.get('chunk_index')}"
+    else:
+        point_id_str = f"{identifier}_{content_type}"
+
+    return int(hashlib.md5(point_id_str.encode()).hexdigest(), 16) % (2**63)
@@ -0,0 +1,134 @@
+from dataclasses import dataclass, replace
+from typing import Dict, Optional, Union
+
+from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    Disabled,
+    Distance,
+    HnswConfigDiff,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    VectorParams,
+    VectorParamsDiff,
+)
+
+QUANTIZATION_MODES = ("none", "int8", "binary")
+
+
+@dataclass(frozen=True)
+class QdrantCollectionProfile:
+    """
+    Storage and search settings of the Qdrant embeddings collection.
+
+    With quantization enabled the full float32 vectors can live on disk while the compact
+    quantized copy stays in RAM; searches then traverse the quantized index, fetch
+    `oversampling` times more candidates and rescore them against the original vectors.
+    hnsw_m / hnsw_ef_construct / hnsw_ef left as None keep Qdrant's defaults.
+    """
+
+    quantization: str = "none"
+    on_disk: bool = False
+    hnsw_m: Optional[int] = None
+    hnsw_ef_construct: Optional[int] = None
+    hnsw_ef: Optional[int] = None
+    oversampling: Optional[float] = None
+    rescore: bool = True
+
+    def __post_init__(self):
+
+        if self.quantization not in QUANTIZATION_MODES:
+
+            raise ValueError(f"quantization must be one of {', '.join(QUANTIZATION_MODES)}")
+
+    @classmethod
+    def named(cls, name: str, **overrides) -> "QdrantCollectionProfile":
+        """
+        Summary: Returns a preset profile, with any non-None overrides applied on top.
+
+        Args:
+            name (str): One of PROFILES ("float", "int8", "binary").
+            **overrides: Profile fields to replace.
+
+        Returns:
+            QdrantCollectionProfile: The resulting profile.
+
+        Raises:
+            ValueError: If the preset name is unknown.
+        """
+
+        if name not in PROFILES:
+
+            raise ValueError(f"Unknown Qdrant collection profile '{name}', expected one of {', '.join(PROFILES)}")
+
+        return replace(PROFILES[name], **{k: v for k, v in overrides.items() if v is not None})
+
+    def vector_params(self, vector_size: int) -> VectorParams:
+
+        return VectorParams(size=vector_size, distance=Distance.COSINE, on_disk=self.on_disk)
+
+    def hnsw_config(self) -> Optional[HnswConfigDiff]:
+
+        if self.hnsw_m is None and self.hnsw_ef_construct is None:
+
+            return None
+
+        return HnswConfigDiff(m=self.hnsw_m, ef_construct=self.hnsw_ef_construct)
+
+    def quantization_config(self) -> Optional[Union[ScalarQuantization, BinaryQuantization]]:
+
+        if self.quantization == "int8":
+
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+            )
+
+        if self.quantization == "binary":
+
+            return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+
+        return None
+
+    def search_params(self) -> Optional[SearchParams]:
+
+        quantization = (
+            QuantizationSearchParams(rescore=self.rescore, oversampling=self.oversampling)
+            if self.quantization != "none"
+            else None
+        )
+
+        if quantization is None and self.hnsw_ef is None:
+
+            return None
+
+        return SearchParams(hnsw_ef=self.hnsw_ef, quantization=quantization)
+
+    def collection_update(self) -> dict:
+        """
+        Summary: Builds update_collection arguments that move an existing collection to this profile.
+
+        Qdrant rebuilds the quantized copy and moves vectors in its optimizer from the stored
+        float32 vectors, so no re-embedding is involved.
+
+        Returns:
+            dict: Keyword arguments for AsyncQdrantClient.update_collection.
+        """
+
+        return {
+            "vectors_config": {"": VectorParamsDiff(on_disk=self.on_disk)},
+            "hnsw_config": self.hnsw_config(),
+            "quantization_config": self.quantization_config() or Disabled.DISABLED,
+        }
+
+
+PROFILES: Dict[str, QdrantCollectionProfile] = {
+    # Plain float32 vectors in RAM, the historical layout
+    "float": QdrantCollectionProfile(),
+    # 4x smaller in RAM; rescoring against the on-disk originals recovers most of the int8 error
+    "int8": QdrantCollectionProfile(quantization="int8", on_disk=True, oversampling=2.0),
+    # 32x smaller in RAM; low-dimensional models lose more recall, so oversample harder
+    "binary": QdrantCollectionProfile(quantization="binary", on_disk=True, oversampling=4.0),
+}
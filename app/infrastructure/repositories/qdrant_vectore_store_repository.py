@@ -1,60 +1,211 @@
-import hashlib
+import asyncio
 import logging
 from typing import Optional, List
 
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.models import (
-    Distance,
-    VectorParams,
+    DeleteOperation,
     Filter,
     FieldCondition,
+    FilterSelector,
+    MatchAny,
     MatchValue,
+    PayloadSchemaType,
+    SetPayload,
+    SetPayloadOperation,
 )
 
 from app.contracts.repositories.i_vector_store_repository import IVectorStoreRepository
 from app.domain.exceptions.search_exception import VectorStoreException
 from app.domain.value_objects.search_result import SearchResult
+from app.infrastructure.repositories.point_ids import make_point_id
+from app.infrastructure.repositories.qdrant_collection_profile import QdrantCollectionProfile
 
 logger = logging.getLogger(__name__)
 
 
 class QdrantVectorStoreRepository(IVectorStoreRepository):
+
+    KEYWORD_INDEX_FIELDS = ("identifier", "content_type", "source_file", "file_extension", "dataset_version", "archive_hash", "archive_url")
+    BOOL_INDEX_FIELDS = ("staged",)
+
+    # Chunks of a dataset version that has not been committed yet
+    STAGED_CONDITION = FieldCondition(key="staged", match=MatchValue(value=True))
+
     def __init__(
         self,
         url: str = "http://localhost:6333",
         collection_name: str = "embeddings",
         vector_size: int = 1536,
+        profile: Optional[QdrantCollectionProfile] = None,
+        prefer_grpc: bool = False,
+        grpc_port: int = 6334,
+        pool_size: Optional[int] = None,
     ):
 
         try:
-            self._client = AsyncQdrantClient(url=url)
+            # pool_size sizes the gRPC channel pool, or the HTTP connection pool when prefer_grpc is off
+            self._client = AsyncQdrantClient(url=url, prefer_grpc=prefer_grpc, grpc_port=grpc_port, pool_size=pool_size)
             self._collection = collection_name
             self._vector_size = vector_size
+            self._profile = profile or QdrantCollectionProfile()
+            self._search_params = self._profile.search_params()
             self._collection_ready = False
+            self._bootstrap_lock = asyncio.Lock()
             
         except Exception as e:
             logger.error("Failed to initialize Qdrant client", exc_info=True)
             
             raise VectorStoreException(str(e)) from e
 
+    async def initialize(self) -> None:
+
+        try:
+            await self._ensure_collection()
+
+        except Exception as e:
+            logger.error("Error bootstrapping Qdrant collection", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def close(self) -> None:
+
+        await self._client.close()
+
     async def _ensure_collection(self):
 
         if self._collection_ready:
             
             return
 
-        collections = await self._client.get_collections()
-        
-        if self._collection not in {c.name for c in collections.collections}:
-            await self._client.create_collection(
+        # Concurrent first requests would otherwise all run the bootstrap round trips
+        async with self._bootstrap_lock:
+
+            if self._collection_ready:
+
+                return
+
+            collections = await self._client.get_collections()
+
+            if self._collection not in {c.name for c in collections.collections}:
+                await self._client.create_collection(
+                    collection_name=self._collection,
+                    vectors_config=self._profile.vector_params(self._vector_size),
+                    hnsw_config=self._profile.hnsw_config(),
+                    quantization_config=self._profile.quantization_config(),
+                )
+
+            collection_info = await self._client.get_collection(self._collection)
+            await self._ensure_payload_indexes(collection_info)
+            self._warn_on_profile_mismatch(collection_info)
+
+            self._collection_ready = True
+
+    def _warn_on_profile_mismatch(self, collection_info):
+
+        quantization = getattr(collection_info.config, "quantization_config", None)
+
+        if quantization is None:
+            current = "none"
+        elif getattr(quantization, "scalar", None) is not None:
+            current = "int8"
+        elif getattr(quantization, "binary", None) is not None:
+            current = "binary"
+        else:
+            current = "other"
+
+        if current != self._profile.quantization:
+            logger.warning(
+                f"Qdrant collection '{self._collection}' uses '{current}' quantization but the configured profile expects "
+                f"'{self._profile.quantization}'; run python -m app.scripts.migrate_qdrant_collection to apply it"
+            )
+
+    async def apply_profile(self) -> bool:
+        """
+        Summary: Moves the existing collection to the configured profile in place.
+
+        Vector storage, HNSW and quantization settings are updated from the stored vectors by
+        Qdrant's optimizer in the background, so nothing is re-embedded and search keeps working.
+
+        Returns:
+            bool: True when Qdrant accepted the update.
+
+        Raises:
+            VectorStoreException: If the update fails.
+        """
+
+        try:
+            await self._ensure_collection()
+
+            return await self._client.update_collection(
                 collection_name=self._collection,
-                vectors_config=VectorParams(
-                    size=self._vector_size,
-                    distance=Distance.COSINE,
-                ),
+                **self._profile.collection_update()
             )
+
+        except Exception as e:
+            logger.error("Error applying Qdrant collection profile", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def drop_collection(self) -> bool:
+        """
+        Summary: Deletes the whole collection, e.g. a throwaway one created by a benchmark.
+
+        The next call on this repository bootstraps the collection again.
+
+        Returns:
+            bool: True when Qdrant deleted the collection.
+
+        Raises:
+            VectorStoreException: If the deletion fails.
+        """
+
+        try:
+            dropped = await self._client.delete_collection(collection_name=self._collection)
+            self._collection_ready = False
+
+            return dropped
+
+        except Exception as e:
+            logger.error("Error dropping Qdrant collection", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def _ensure_payload_indexes(self, collection_info):
+
+        existing = set((collection_info.payload_schema or {}).keys())
+
+        fields = [(name, PayloadSchemaType.KEYWORD) for name in self.KEYWORD_INDEX_FIELDS]
+        fields += [(name, PayloadSchemaType.BOOL) for name in self.BOOL_INDEX_FIELDS]
+
+        for field_name, field_schema in fields:
             
-        self._collection_ready = True
+            if field_name not in existing:
+                await self._client.create_payload_index(
+                    collection_name=self._collection,
+                    field_name=field_name,
+                    field_schema=field_schema,
+                )
+
+    @staticmethod
+    def _build_filter(
+        content_types: Optional[List[str]] = None,
+        file_extensions: Optional[List[str]] = None,
+        identifiers: Optional[List[str]] = None,
+    ) -> Filter:
+
+        must = []
+
+        if identifiers:
+            must.append(FieldCondition(key="identifier", match=MatchAny(any=list(identifiers))))
+
+        if content_types:
+            must.append(FieldCondition(key="content_type", match=MatchAny(any=list(content_types))))
+
+        if file_extensions:
+            must.append(FieldCondition(key="file_extension", match=MatchAny(any=list(file_extensions))))
+
+        return Filter(must=must or None, must_not=[QdrantVectorStoreRepository.STAGED_CONDITION])
 
     async def search_similar(
         self,
@@ -62,6 +213,9 @@ class QdrantVectorStoreRepository(IVectorStoreRepository):
         limit: int = 10,
         offset: int = 0,
         min_score: float = 0.0,
+        content_types: Optional[List[str]] = None,
+        file_extensions: Optional[List[str]] = None,
+        identifiers: Optional[List[str]] = None,
     ) -> List[SearchResult]:
 
         try:
@@ -70,30 +224,69 @@ class QdrantVectorStoreRepository(IVectorStoreRepository):
             results = await self._client.query_points(
                 collection_name=self._collection,
                 query=query_embedding,
+                query_filter=self._build_filter(content_types, file_extensions, identifiers),
+                search_params=self._search_params,
                 limit=limit,
                 offset=offset,
                 score_threshold=min_score if min_score > 0 else None,
                 with_payload=True
             )
 
-            return [
-                SearchResult(
-                    identifier=r.payload.get("identifier", ""),
-                    content_type=r.payload.get("content_type"),
-                    text=r.payload.get("text"),
-                    score=float(r.score),
-                    metadata=r.payload or {},
-                    title=r.payload.get("title"),
-                    description=r.payload.get("description")
-                )
-                for r in results.points
-            ]
+            return [self._to_search_result(r) for r in results.points]
             
         except Exception as e:
             logger.error("Error searching Qdrant vectors", exc_info=True)
             
             raise VectorStoreException(str(e)) from e
 
+    async def search_grouped(
+        self,
+        query_embedding: List[float],
+        group_by: str = "identifier",
+        limit: int = 10,
+        min_score: float = 0.0,
+        content_types: Optional[List[str]] = None,
+        file_extensions: Optional[List[str]] = None,
+        identifiers: Optional[List[str]] = None,
+    ) -> List[SearchResult]:
+
+        try:
+            await self._ensure_collection()
+
+            results = await self._client.query_points_groups(
+                collection_name=self._collection,
+                query=query_embedding,
+                group_by=group_by,
+                query_filter=self._build_filter(content_types, file_extensions, identifiers),
+                search_params=self._search_params,
+                limit=limit,
+                group_size=1,
+                score_threshold=min_score if min_score > 0 else None,
+                with_payload=True
+            )
+
+            return [self._to_search_result(g.hits[0]) for g in results.groups if g.hits]
+
+        except Exception as e:
+            logger.error("Error running grouped search on Qdrant vectors", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    @staticmethod
+    def _to_search_result(point) -> SearchResult:
+
+        payload = point.payload or {}
+
+        return SearchResult(
+            identifier=payload.get("identifier", ""),
+            content_type=payload.get("content_type"),
+            text=payload.get("text"),
+            score=float(point.score),
+            metadata=payload,
+            title=payload.get("title"),
+            description=payload.get("description")
+        )
+
     async def index_embedding(
         self,
         identifier: str,
@@ -115,13 +308,7 @@ class QdrantVectorStoreRepository(IVectorStoreRepository):
             if metadata:
                 payload.update(metadata)
 
-            point_id_str = (
-                f"{identifier}_{content_type}_{metadata.get('chunk_index')}"
-                if metadata and "chunk_index" in metadata
-                else f"{identifier}_{content_type}"
-            )
-            
-            point_id = int(hashlib.md5(point_id_str.encode()).hexdigest(), 16) % (2**63)
+            point_id = make_point_id(identifier, content_type, metadata)
 
             await self._client.upsert(
                 collection_name=self._collection,
@@ -149,13 +336,7 @@ class QdrantVectorStoreRepository(IVectorStoreRepository):
             points = []
             
             for emb, payload in zip(embeddings, payloads):
-                point_id_str = (
-                    f"{identifier}_{content_type}_{payload.get('chunk_index')}"
-                    if "chunk_index" in payload 
-                    else f"{identifier}_{content_type}"
-                )
-                
-                point_id = int(hashlib.md5(point_id_str.encode()).hexdigest(), 16) % (2**63)
+                point_id = make_point_id(identifier, content_type, payload)
                 points.append({"id": point_id, "vector": emb, "payload": payload})
 
             await self._client.upsert(collection_name=self._collection, points=points)
@@ -167,6 +348,190 @@ class QdrantVectorStoreRepository(IVectorStoreRepository):
             
             raise VectorStoreException(str(e)) from e
 
+    async def find_indexed_chunks(self, identifier: str, content_type: str, payloads: List[dict]) -> List[bool]:
+
+        if not payloads:
+
+            return []
+
+        try:
+            await self._ensure_collection()
+
+            point_ids = [make_point_id(identifier, content_type, payload) for payload in payloads]
+            records = await self._client.retrieve(
+                collection_name=self._collection,
+                ids=point_ids,
+                with_payload=False,
+                with_vectors=False,
+            )
+            existing = {record.id for record in records}
+
+            return [point_id in existing for point_id in point_ids]
+
+        except Exception as e:
+            logger.error("Error looking up indexed chunks in Qdrant", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def count_archive_chunks(self, identifier: str, archive_hash: str) -> int:
+
+        try:
+            await self._ensure_collection()
+
+            result = await self._client.count(
+                collection_name=self._collection,
+                count_filter=Filter(
+                    must=[
+                        FieldCondition(key="identifier", match=MatchValue(value=identifier)),
+                        FieldCondition(key="archive_hash", match=MatchValue(value=archive_hash)),
+                    ],
+                    must_not=[self.STAGED_CONDITION],
+                ),
+                exact=True,
+            )
+
+            return result.count
+
+        except Exception as e:
+            logger.error("Error counting archive chunks in Qdrant", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def find_archive_hash(self, identifier: str, archive_url: str) -> Optional[str]:
+
+        try:
+            await self._ensure_collection()
+
+            # Committing replaces every older chunk of a URL, so its searchable chunks share one archive
+            records, _ = await self._client.scroll(
+                collection_name=self._collection,
+                scroll_filter=Filter(
+                    must=[
+                        FieldCondition(key="identifier", match=MatchValue(value=identifier)),
+                        FieldCondition(key="archive_url", match=MatchValue(value=archive_url)),
+                    ],
+                    must_not=[self.STAGED_CONDITION],
+                ),
+                limit=1,
+                with_payload=["archive_hash"],
+                with_vectors=False,
+            )
+
+            return records[0].payload.get("archive_hash") if records else None
+
+        except Exception as e:
+            logger.error("Error looking up archive of a supporting-document URL in Qdrant", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def delete_stale_chunks(self, identifier: str, content_type: str, kept_content_hashes: List[str]) -> bool:
+
+        try:
+            await self._ensure_collection()
+
+            await self._client.delete(
+                collection_name=self._collection,
+                points_selector=Filter(
+                    must=[
+                        FieldCondition(key="identifier", match=MatchValue(value=identifier)),
+                        FieldCondition(key="content_type", match=MatchValue(value=content_type)),
+                    ],
+                    must_not=[
+                        self.STAGED_CONDITION,
+                        FieldCondition(key="content_hash", match=MatchAny(any=list(kept_content_hashes))),
+                    ],
+                ),
+            )
+
+            return True
+
+        except Exception as e:
+            logger.error("Error deleting stale chunks in Qdrant", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def commit_dataset_version(
+        self,
+        identifier: str,
+        dataset_version: str,
+        retained_payloads: List[dict],
+        retained_archives: Optional[List[str]] = None
+    ) -> bool:
+
+        try:
+            await self._ensure_collection()
+
+            dataset = FieldCondition(key="identifier", match=MatchValue(value=identifier))
+            version = FieldCondition(key="dataset_version", match=MatchValue(value=dataset_version))
+
+            operations = [
+                SetPayloadOperation(set_payload=SetPayload(
+                    payload={**payload, "dataset_version": dataset_version, "staged": False},
+                    points=[make_point_id(identifier, payload.get("content_type", ""), payload)],
+                ))
+                for payload in retained_payloads
+            ]
+
+            if retained_archives:
+                operations.append(SetPayloadOperation(set_payload=SetPayload(
+                    payload={"dataset_version": dataset_version},
+                    filter=Filter(
+                        must=[dataset, FieldCondition(key="archive_hash", match=MatchAny(any=list(retained_archives)))],
+                        must_not=[self.STAGED_CONDITION],
+                    ),
+                )))
+
+            # Qdrant applies the operations in order but not as one transaction. Dropping the old version
+            # before unstaging the new one means a search in between can miss some of the dataset's
+            # chunks, but never returns a stale chunk or the same text from two versions
+            operations.append(DeleteOperation(delete=FilterSelector(
+                filter=Filter(must=[dataset], must_not=[version]),
+            )))
+            operations.append(SetPayloadOperation(set_payload=SetPayload(
+                payload={"staged": False},
+                filter=Filter(must=[dataset, version]),
+            )))
+
+            await self._client.batch_update_points(collection_name=self._collection, update_operations=operations)
+
+            return True
+
+        except Exception as e:
+            logger.error("Error committing dataset version in Qdrant", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def discard_dataset_version(
+        self,
+        identifier: str,
+        dataset_version: str,
+        archive_hashes: Optional[List[str]] = None
+    ) -> bool:
+
+        try:
+            await self._ensure_collection()
+
+            conditions = [
+                FieldCondition(key="identifier", match=MatchValue(value=identifier)),
+                FieldCondition(key="dataset_version", match=MatchValue(value=dataset_version)),
+                self.STAGED_CONDITION,
+            ]
+
+            if archive_hashes:
+                conditions.append(FieldCondition(key="archive_hash", match=MatchAny(any=list(archive_hashes))))
+
+            await self._client.delete(
+                collection_name=self._collection,
+                points_selector=Filter(must=conditions),
+            )
+
+            return True
+
+        except Exception as e:
+            logger.error("Error discarding dataset version in Qdrant", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
     async def delete_embeddings(self, identifier: str) -> bool:
 
         try:
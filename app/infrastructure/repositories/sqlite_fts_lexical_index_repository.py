@@ -0,0 +1,266 @@
+import asyncio
+import logging
+import os
+import re
+from typing import List, Optional
+
+import aiosqlite
+
+from app.contracts.repositories.i_lexical_index_repository import ILexicalIndexRepository
+from app.domain.exceptions.search_exception import VectorStoreException
+from app.domain.value_objects.search_result import SearchResult
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteFtsLexicalIndexRepository(ILexicalIndexRepository):
+    """
+    Lexical index kept in a local SQLite FTS5 database, separate from the shared ETL database.
+    Chunk rows live in a plain table keyed by (identifier, content_type, source_file, chunk_index)
+    and an external-content FTS5 table is kept in sync through triggers, so re-ingesting a chunk
+    replaces it and deletes by identifier use a B-tree index. Indexing the first chunk of a source
+    file drops that file's earlier chunks, so a document that got shorter leaves no stale tail.
+    """
+
+    _TOKEN = re.compile(r"\w+", re.UNICODE)
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS lexical_chunks (
+            id INTEGER PRIMARY KEY,
+            identifier TEXT NOT NULL,
+            content_type TEXT NOT NULL,
+            source_file TEXT NOT NULL DEFAULT '',
+            chunk_index INTEGER NOT NULL,
+            file_extension TEXT,
+            text TEXT NOT NULL,
+            UNIQUE (identifier, content_type, source_file, chunk_index)
+        )
+        """,
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS lexical_chunks_fts USING fts5(
+            text, content='lexical_chunks', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS lexical_chunks_ai AFTER INSERT ON lexical_chunks BEGIN
+            INSERT INTO lexical_chunks_fts(rowid, text) VALUES (new.id, new.text);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS lexical_chunks_ad AFTER DELETE ON lexical_chunks BEGIN
+            INSERT INTO lexical_chunks_fts(lexical_chunks_fts, rowid, text) VALUES ('delete', old.id, old.text);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS lexical_chunks_au AFTER UPDATE ON lexical_chunks BEGIN
+            INSERT INTO lexical_chunks_fts(lexical_chunks_fts, rowid, text) VALUES ('delete', old.id, old.text);
+            INSERT INTO lexical_chunks_fts(rowid, text) VALUES (new.id, new.text);
+        END
+        """,
+    )
+
+    def __init__(self, db_path: str):
+
+        self._db_path = db_path
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._lock = asyncio.Lock()
+
+    async def _ensure_connection(self) -> aiosqlite.Connection:
+
+        if self._conn is not None:
+
+            return self._conn
+
+        async with self._lock:
+
+            if self._conn is None:
+
+                if self._db_path != ":memory:":
+                    os.makedirs(os.path.dirname(os.path.abspath(self._db_path)), exist_ok=True)
+
+                conn = await aiosqlite.connect(self._db_path)
+                await conn.execute("PRAGMA journal_mode=WAL")
+                await self._migrate_legacy_schema(conn)
+
+                for statement in self._SCHEMA:
+                    await conn.execute(statement)
+
+                await conn.commit()
+                self._conn = conn
+
+        return self._conn
+
+    @classmethod
+    async def _migrate_legacy_schema(cls, conn: aiosqlite.Connection) -> None:
+
+        async with conn.execute("PRAGMA table_info(lexical_chunks)") as cursor:
+            columns = [row[1] for row in await cursor.fetchall()]
+
+        if not columns or "source_file" in columns:
+
+            return
+
+        # The old key had no source file, so document chunks of one dataset overwrote each other;
+        # only titles and descriptions are carried over and documents are re-indexed on reprocessing
+        logger.warning("Rebuilding lexical index without legacy document chunks; reprocess datasets to restore them")
+
+        await conn.execute("ALTER TABLE lexical_chunks RENAME TO lexical_chunks_legacy")
+
+        for statement in (
+            "DROP TRIGGER IF EXISTS lexical_chunks_ai",
+            "DROP TRIGGER IF EXISTS lexical_chunks_ad",
+            "DROP TRIGGER IF EXISTS lexical_chunks_au",
+            "DROP TABLE IF EXISTS lexical_chunks_fts",
+        ):
+            await conn.execute(statement)
+
+        for statement in cls._SCHEMA:
+            await conn.execute(statement)
+
+        await conn.execute(
+            """
+            INSERT INTO lexical_chunks (identifier, content_type, chunk_index, file_extension, text)
+            SELECT identifier, content_type, chunk_index, file_extension, text FROM lexical_chunks_legacy
+            WHERE content_type != 'document'
+            """
+        )
+        await conn.execute("DROP TABLE lexical_chunks_legacy")
+
+    @classmethod
+    def build_match_expression(cls, query_text: str) -> Optional[str]:
+
+        # Quote every token so codes like "ECN-123" or "CS:2007" cannot be read as FTS5 syntax
+        tokens = cls._TOKEN.findall(query_text)
+
+        if not tokens:
+
+            return None
+
+        return " OR ".join(f'"{token}"' for token in dict.fromkeys(t.lower() for t in tokens))
+
+    async def index_texts(
+        self,
+        identifier: str,
+        content_type: str,
+        texts: List[str],
+        start_index: int = 0,
+        file_extension: Optional[str] = None,
+        source_file: Optional[str] = None,
+    ) -> bool:
+
+        source_file = source_file or ""
+
+        try:
+            conn = await self._ensure_connection()
+
+            async with self._lock:
+
+                if start_index == 0:
+                    await conn.execute(
+                        "DELETE FROM lexical_chunks WHERE identifier = ? AND content_type = ? AND source_file = ?",
+                        (identifier, content_type, source_file),
+                    )
+
+                await conn.executemany(
+                    """
+                    INSERT INTO lexical_chunks (identifier, content_type, source_file, chunk_index, file_extension, text)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (identifier, content_type, source_file, chunk_index)
+                    DO UPDATE SET file_extension = excluded.file_extension, text = excluded.text
+                    """,
+                    [
+                        (identifier, content_type, source_file, start_index + idx, file_extension, text)
+                        for idx, text in enumerate(texts)
+                    ],
+                )
+                await conn.commit()
+
+            return True
+
+        except Exception as e:
+            logger.error("Error indexing text in lexical index", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def search(
+        self,
+        query_text: str,
+        limit: int = 10,
+        content_types: Optional[List[str]] = None,
+        file_extensions: Optional[List[str]] = None,
+    ) -> List[SearchResult]:
+
+        match = self.build_match_expression(query_text)
+
+        if match is None:
+
+            return []
+
+        try:
+            conn = await self._ensure_connection()
+
+            sql = (
+                "SELECT c.identifier, c.content_type, c.text, c.source_file, c.chunk_index, c.file_extension, "
+                "bm25(lexical_chunks_fts) AS rank "
+                "FROM lexical_chunks_fts JOIN lexical_chunks c ON c.id = lexical_chunks_fts.rowid "
+                "WHERE lexical_chunks_fts MATCH ?"
+            )
+            params: list = [match]
+
+            if content_types:
+                sql += f" AND lower(c.content_type) IN ({', '.join('?' * len(content_types))})"
+                params.extend(content_types)
+
+            if file_extensions:
+                sql += f" AND c.file_extension IN ({', '.join('?' * len(file_extensions))})"
+                params.extend(file_extensions)
+
+            sql += " ORDER BY rank LIMIT ?"
+            params.append(limit)
+
+            async with conn.execute(sql, params) as cursor:
+                rows = await cursor.fetchall()
+
+            # bm25() is lower-is-better and unbounded; negate it so higher scores rank first
+            return [
+                SearchResult(
+                    identifier=identifier,
+                    content_type=content_type,
+                    text=text,
+                    score=-float(rank),
+                    metadata={
+                        "source_file": source_file or None,
+                        "chunk_index": chunk_index,
+                        "file_extension": file_extension,
+                    },
+                )
+                for identifier, content_type, text, source_file, chunk_index, file_extension, rank in rows
+            ]
+
+        except Exception as e:
+            logger.error("Error searching lexical index", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def delete(self, identifier: str) -> bool:
+
+        try:
+            conn = await self._ensure_connection()
+
+            async with self._lock:
+                await conn.execute("DELETE FROM lexical_chunks WHERE identifier = ?", (identifier,))
+                await conn.commit()
+
+            return True
+
+        except Exception as e:
+            logger.error("Error deleting from lexical index", exc_info=True)
+
+            raise VectorStoreException(str(e)) from e
+
+    async def close(self) -> None:
+
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
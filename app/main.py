@@ -9,7 +9,20 @@ from fastapi.middleware.cors import CORSMiddleware
 
 load_dotenv()
 
+from app.infrastructure.di import (
+    get_dataset_processing_job_service,
+    get_document_extractor,
+    get_dataset_metadata_cache,
+    get_embedding_batcher,
+    get_embedding_disk_cache,
+    get_ingestion_queue_worker,
+    get_lexical_index_repository,
+    get_model_embedding_provider,
+    get_vector_store_repository,
+    get_zip_downloader,
+)
 from app.infrastructure.middleware.api_exception_handlers import register_exception_handlers
+from app.infrastructure.providers.process_pool_embedding_provider import ProcessPoolEmbeddingProvider
 from app.routes.embedding_routes import router as embedding_router
 from app.routes.search_routes import router as search_router
 from app.routes.agent_routes import router as agent_router
@@ -39,13 +52,66 @@ def setup_logging():
 
 
 setup_logging()
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+
+    vector_store = get_vector_store_repository()
+
+    try:
+        await vector_store.initialize()
+        logger.info("Vector store ready")
+
+    except Exception as e:
+        # The repository retries the bootstrap on first use, so the service can start before Qdrant
+        logger.warning(f"Vector store could not be initialized at startup: {e}")
+
+    model_provider = get_model_embedding_provider()
+
+    if isinstance(model_provider, ProcessPoolEmbeddingProvider):
+        await model_provider.start()
+        logger.info("Embedding worker processes started")
+
+    metadata_cache = get_dataset_metadata_cache()
+
+    try:
+        loaded = await metadata_cache.refresh(full=True)
+        logger.info(f"Dataset metadata cache loaded with {loaded} dataset(s)")
+
+    except Exception as e:
+        logger.warning(f"Dataset metadata cache could not be loaded at startup: {e}")
+
+    metadata_cache.start()
+
+    ingestion_worker = get_ingestion_queue_worker() if os.getenv("INGESTION_WORKER_ENABLED", "false").lower() in ("1", "true", "yes") else None
+
+    if ingestion_worker is not None:
+        await ingestion_worker.initialize()
+        ingestion_worker.start()
+        logger.info(f"Ingestion queue worker {ingestion_worker.stats.owner} started")
     
     yield
 
+    if ingestion_worker is not None:
+        await ingestion_worker.stop()
+
+    await get_dataset_processing_job_service().close()
+
+    await metadata_cache.stop()
+    await get_lexical_index_repository().close()
+    await get_zip_downloader().close()
+    await get_document_extractor().close()
+    await vector_store.close()
+    await get_embedding_batcher().close()
+
+    if get_embedding_disk_cache() is not None:
+        await get_embedding_disk_cache().close()
+
+    if isinstance(model_provider, ProcessPoolEmbeddingProvider):
+        await model_provider.close()
+
 
 app = FastAPI(
     title="DSH ETL RAG Discovery Service",
@@ -1,9 +1,22 @@
 from fastapi import APIRouter, Depends
 
 from app.controllers.embedding_controller import EmbeddingController
-from app.contracts.dtos.embedding_dtos import IndexEmbeddingResponse, IngestMetadataRequest, ProcessDatasetRequest
+from app.contracts.dtos.embedding_dtos import (
+    IndexEmbeddingResponse,
+    IngestionPipelineStatsResponse,
+    IngestMetadataRequest,
+    ProcessDatasetRequest,
+    ProcessDatasetsJobRequest,
+    ProcessingJobResponse,
+)
+from app.contracts.services.i_dataset_processing_job_service import IDatasetProcessingJobService
 from app.contracts.services.i_embedding_service import IEmbeddingService
-from app.infrastructure.di import get_embedding_service
+from app.contracts.services.i_ingestion_pipeline_stats_service import IIngestionPipelineStatsService
+from app.infrastructure.di import (
+    get_dataset_processing_job_service,
+    get_embedding_service,
+    get_ingestion_pipeline_stats_service,
+)
 
 router = APIRouter(prefix="/embeddings", tags=["Embeddings"])
 controller = EmbeddingController()
@@ -26,3 +39,38 @@ async def process_dataset(
 
     return await controller.process_dataset(request, service)
 
+
+
+@router.post("/jobs", response_model=ProcessingJobResponse, status_code=202)
+async def submit_processing_job(
+    request: ProcessDatasetsJobRequest,
+    job_service: IDatasetProcessingJobService = Depends(get_dataset_processing_job_service)
+) -> ProcessingJobResponse:
+
+    return await controller.submit_processing_job(request, job_service)
+
+
+@router.get("/jobs/{job_id}", response_model=ProcessingJobResponse)
+async def get_processing_job(
+    job_id: str,
+    job_service: IDatasetProcessingJobService = Depends(get_dataset_processing_job_service)
+) -> ProcessingJobResponse:
+
+    return await controller.get_processing_job(job_id, job_service)
+
+
+@router.post("/jobs/{job_id}/cancel", response_model=ProcessingJobResponse)
+async def cancel_processing_job(
+    job_id: str,
+    job_service: IDatasetProcessingJobService = Depends(get_dataset_processing_job_service)
+) -> ProcessingJobResponse:
+
+    return await controller.cancel_processing_job(job_id, job_service)
+
+
+@router.get("/pipeline/stats", response_model=IngestionPipelineStatsResponse)
+async def get_pipeline_stats(
+    stats_service: IIngestionPipelineStatsService = Depends(get_ingestion_pipeline_stats_service)
+) -> IngestionPipelineStatsResponse:
+
+    return await controller.get_pipeline_stats(stats_service)
@@ -1,9 +1,21 @@
-from fastapi import APIRouter, Depends
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from app.controllers.search_controller import SearchController
-from app.contracts.dtos.search_dtos import SearchRequest, SearchResponse, DeleteEmbeddingsRequest, DeleteEmbeddingsResponse
+from app.contracts.dtos.search_dtos import (
+    BatchSearchRequest,
+    BatchSearchResponse,
+    DeleteEmbeddingsRequest,
+    DeleteEmbeddingsResponse,
+    SearchRequest,
+    SearchResponse,
+    SearchStatsResponse,
+)
+from app.contracts.services.i_search_stats_service import ISearchStatsService
 from app.contracts.services.i_semantic_search_service import ISemanticSearchService
-from app.infrastructure.di import get_semantic_search_service
+from app.infrastructure.di import get_search_stats_service, get_semantic_search_service
 
 router = APIRouter(prefix="/search", tags=["Search"])
 controller = SearchController()
@@ -18,6 +30,25 @@ async def semantic_search(
     return await controller.semantic_search(request, service)
 
 
+@router.post("/semantic/stream", response_class=StreamingResponse)
+async def semantic_search_stream(
+    request: SearchRequest,
+    stream_format: Literal["ndjson", "sse"] = Query(default="ndjson", alias="format"),
+    service: ISemanticSearchService = Depends(get_semantic_search_service)
+) -> StreamingResponse:
+
+    return await controller.semantic_search_stream(request, service, stream_format)
+
+
+@router.post("/semantic/batch", response_model=BatchSearchResponse)
+async def semantic_search_batch(
+    request: BatchSearchRequest,
+    service: ISemanticSearchService = Depends(get_semantic_search_service)
+) -> BatchSearchResponse:
+
+    return await controller.semantic_search_batch(request, service)
+
+
 @router.post("/delete-embeddings", response_model=DeleteEmbeddingsResponse)
 async def delete_embeddings(
     request: DeleteEmbeddingsRequest,
@@ -26,3 +57,11 @@ async def delete_embeddings(
 
     return await controller.delete_embeddings(request, service)
 
+
+
+@router.get("/stats", response_model=SearchStatsResponse)
+async def search_stats(
+    stats_service: ISearchStatsService = Depends(get_search_stats_service)
+) -> SearchStatsResponse:
+
+    return await controller.get_stats(stats_service)
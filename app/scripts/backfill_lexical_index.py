@@ -0,0 +1,61 @@
+"""
+Backfills the hybrid-search lexical index with the title and description of every dataset
+already in the ETL database. Supporting-document chunks are added as datasets are reprocessed.
+
+Usage:
+    python -m app.scripts.backfill_lexical_index
+"""
+import asyncio
+import logging
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from sqlalchemy import select
+
+from app.domain.entities.dataset_metadata import DatasetMetadata
+from app.infrastructure.data_access.session import AsyncSessionLocal
+from app.infrastructure.di import get_lexical_index_repository
+from app.infrastructure.repositories.sqlite_fts_lexical_index_repository import SqliteFtsLexicalIndexRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def backfill(lexical_index: SqliteFtsLexicalIndexRepository) -> int:
+
+    indexed = 0
+
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(
+            select(DatasetMetadata.file_identifier, DatasetMetadata.title, DatasetMetadata.description)
+        )
+
+        async for file_identifier, title, description in result:
+
+            if title:
+                await lexical_index.index_texts(file_identifier, "title", [title])
+
+            if description:
+                await lexical_index.index_texts(file_identifier, "description", [description])
+
+            indexed += 1
+
+    return indexed
+
+
+async def main() -> None:
+
+    lexical_index = get_lexical_index_repository()
+
+    try:
+        indexed = await backfill(lexical_index)
+        logger.info(f"Backfilled lexical index for {indexed} dataset(s)")
+
+    finally:
+        await lexical_index.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    asyncio.run(main())
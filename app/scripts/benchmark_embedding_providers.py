@@ -0,0 +1,124 @@
+"""
+Compares embedding backends on single-query latency (p50/p99), batch throughput and resident
+memory. Each backend runs in its own subprocess so model memory is measured in isolation.
+
+Per --concurrency level, the same query load is also sent by that many concurrent clients
+straight to the provider and through BatchingEmbeddingProvider (default settings), reporting
+queries per second, p50/p99 latency and the batcher's average batch size.
+
+Usage:
+    python -m app.scripts.benchmark_embedding_providers --onnx-model models/all-MiniLM-L6-v2-onnx
+    python -m app.scripts.benchmark_embedding_providers --backends torch onnx-int8 --queries 500
+    python -m app.scripts.benchmark_embedding_providers --backends torch --concurrency 1 8 32 64
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from typing import List
+
+from app.infrastructure.providers.batching_embedding_provider import BatchingEmbeddingProvider
+from app.scripts.benchmark_vector_stores import current_rss_mb, measure, percentile_ms
+from app.scripts.export_onnx_embedding_model import MODEL_NAME, PARITY_TEXTS
+
+BACKENDS = ("torch", "onnx", "onnx-int8")
+CHUNK = PARITY_TEXTS[4]
+
+
+def build_provider(backend: str, onnx_model: str):
+
+    if backend == "torch":
+        from sentence_transformers import SentenceTransformer
+
+        from app.infrastructure.providers.sentence_transformer_embedding_provider import SentenceTransformerEmbeddingProvider
+
+        return SentenceTransformerEmbeddingProvider(SentenceTransformer(MODEL_NAME, device="cpu"))
+
+    from app.infrastructure.providers.onnx_embedding_provider import OnnxEmbeddingProvider, OnnxSentenceEncoder
+
+    return OnnxEmbeddingProvider(OnnxSentenceEncoder.from_directory(onnx_model, quantized=backend == "onnx-int8"))
+
+
+async def measure_concurrent(embed, texts, concurrency: int) -> dict:
+
+    samples = []
+    pending = iter(texts)
+
+    async def client():
+
+        for text in pending:
+            started = time.perf_counter()
+            await embed(text)
+            samples.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {"qps": round(len(samples) / elapsed, 1), "p50_ms": percentile_ms(samples, 50), "p99_ms": percentile_ms(samples, 99)}
+
+
+async def run_backend(backend: str, onnx_model: str, queries: int, chunks: int, concurrency: List[int]) -> dict:
+
+    rss_before = current_rss_mb()
+    provider = build_provider(backend, onnx_model)
+    await provider.generate_embedding("warm up")
+    rss_loaded = current_rss_mb()
+
+    texts = [PARITY_TEXTS[i % 4] + f" {i}" for i in range(queries)]
+    latency = await measure(provider.generate_embedding, texts)
+
+    started = time.perf_counter()
+    await provider.generate_embeddings([CHUNK] * chunks)
+    throughput = chunks / (time.perf_counter() - started)
+
+    concurrent = {}
+
+    for level in concurrency:
+        batcher = BatchingEmbeddingProvider(provider)
+        concurrent[f"direct_c{level}"] = await measure_concurrent(provider.generate_embedding, texts, level)
+        batched = await measure_concurrent(batcher.generate_embedding, texts, level)
+        concurrent[f"batched_c{level}"] = {**batched, "average_batch": round(batcher.stats.average_batch_size, 1)}
+        await batcher.close()
+
+    return {
+        **latency,
+        "chunks_per_second": round(throughput, 1),
+        "model_rss_mb": round(rss_loaded - rss_before, 1),
+        "peak_rss_mb": round(current_rss_mb(), 1),
+        **concurrent,
+    }
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument("--onnx-model", default="models/all-MiniLM-L6-v2-onnx")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--chunks", type=int, default=512)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32], help="concurrent clients for the micro-batching comparison")
+    parser.add_argument("--child", choices=BACKENDS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(asyncio.run(run_backend(args.child, args.onnx_model, args.queries, args.chunks, args.concurrency))))
+
+        return
+
+    for backend in args.backends:
+        completed = subprocess.run(
+            [sys.executable, "-m", "app.scripts.benchmark_embedding_providers", "--child", backend,
+             "--onnx-model", args.onnx_model, "--queries", str(args.queries), "--chunks", str(args.chunks),
+             "--concurrency", *map(str, args.concurrency)],
+            capture_output=True,
+            text=True,
+        )
+        result = completed.stdout.strip().splitlines()[-1] if completed.returncode == 0 else f"failed: {completed.stderr.strip().splitlines()[-1:]}"
+        print(f"{backend}: {result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Measures grouped-search latency against a running Qdrant for three client setups:
+a new repository (and client) per search, as DI used to build per request; one shared
+repository over HTTP; and one shared repository over gRPC with a channel pool.
+
+Usage:
+    python -m app.scripts.benchmark_qdrant_client --chunks 20000 --queries 300
+    python -m app.scripts.benchmark_qdrant_client --qdrant-url http://qdrant:6333 --pool-size 4
+"""
+import argparse
+import asyncio
+import uuid
+
+import numpy as np
+
+from app.domain.exceptions.search_exception import VectorStoreException
+from app.infrastructure.repositories.qdrant_vectore_store_repository import QdrantVectorStoreRepository
+from app.scripts.benchmark_vector_stores import VECTOR_SIZE, measure, populate
+
+
+async def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--qdrant-url", default="http://localhost:6333")
+    parser.add_argument("--grpc-port", type=int, default=6334)
+    parser.add_argument("--pool-size", type=int, default=None)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    vectors = rng.standard_normal((args.chunks, VECTOR_SIZE), dtype=np.float32)
+    queries = rng.standard_normal((args.queries, VECTOR_SIZE), dtype=np.float32)
+    collection = f"benchmark_{uuid.uuid4().hex[:8]}"
+
+    def build(**options) -> QdrantVectorStoreRepository:
+
+        return QdrantVectorStoreRepository(url=args.qdrant_url, collection_name=collection, vector_size=VECTOR_SIZE, **options)
+
+    shared_http = build(pool_size=args.pool_size)
+    shared_grpc = build(prefer_grpc=True, grpc_port=args.grpc_port, pool_size=args.pool_size)
+
+    async def per_request(query):
+
+        repository = build()
+
+        try:
+            return await repository.search_grouped(query, limit=10)
+
+        finally:
+            await repository.close()
+
+    try:
+        await shared_http.initialize()
+
+    except VectorStoreException as e:
+        print(f"cannot reach Qdrant at {args.qdrant_url}: {e}")
+        await shared_http.close()
+        await shared_grpc.close()
+
+        return
+
+    try:
+        await populate(shared_http, vectors)
+        await shared_grpc.initialize()
+
+        print(f"{args.chunks} chunks x {VECTOR_SIZE}d, {args.queries} grouped top-10 queries")
+        print(f"client per request: {await measure(per_request, queries.tolist())}")
+        print(f"shared http client: {await measure(lambda q: shared_http.search_grouped(q, limit=10), queries.tolist())}")
+        print(f"shared grpc client: {await measure(lambda q: shared_grpc.search_grouped(q, limit=10), queries.tolist())}")
+
+    finally:
+        await shared_http.drop_collection()
+        await shared_http.close()
+        await shared_grpc.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
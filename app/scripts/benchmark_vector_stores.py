@@ -0,0 +1,162 @@
+"""
+Compares search latency and memory of the embedded numpy vector store against Qdrant on a
+synthetic catalogue of random vectors.
+
+Usage:
+    python -m app.scripts.benchmark_vector_stores --chunks 50000 --queries 200
+    python -m app.scripts.benchmark_vector_stores --dtype float16 --qdrant-url none
+
+Qdrant memory lives in the server process, so only client-side RSS is reported for it.
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+from typing import Callable, Dict, List, Sequence
+
+import numpy as np
+
+from app.contracts.repositories.i_vector_store_repository import IVectorStoreRepository
+from app.infrastructure.repositories.numpy_vector_store_repository import NumpyVectorStoreRepository
+from app.infrastructure.repositories.qdrant_vectore_store_repository import QdrantVectorStoreRepository
+
+try:
+    import resource
+
+except ImportError:
+    # Unix only; on Windows RSS is reported as nan
+    resource = None
+
+VECTOR_SIZE = 384
+CHUNKS_PER_DATASET = 20
+INGEST_BATCH_SIZE = 500
+
+
+def current_rss_mb() -> float:
+
+    try:
+        with open("/proc/self/status", encoding="utf-8") as f:
+
+            for line in f:
+
+                if line.startswith("VmRSS:"):
+
+                    return int(line.split()[1]) / 1024
+
+    except OSError:
+        pass
+
+    if resource is None:
+
+        return float("nan")
+
+    # Peak RSS is the best portable fallback (kilobytes on Linux, bytes on macOS)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def directory_size_mb(path: str) -> float:
+
+    size = sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+    return round(size / 2**20, 1)
+
+
+def percentile_ms(samples: List[float], percentile: float) -> float:
+
+    return round(float(np.percentile(samples, percentile)) * 1000, 3)
+
+
+async def populate(repository: IVectorStoreRepository, vectors: np.ndarray) -> None:
+
+    for start in range(0, len(vectors), INGEST_BATCH_SIZE):
+        batch = vectors[start : start + INGEST_BATCH_SIZE]
+        rows = range(start, start + len(batch))
+        payloads = [
+            {
+                "identifier": f"ds-{row // CHUNKS_PER_DATASET}",
+                "content_type": "document",
+                "text": f"chunk {row}",
+                "chunk_index": row,
+            }
+            for row in rows
+        ]
+        # One call per batch; identifier only feeds the point id, which chunk_index keeps unique
+        await repository.index_embeddings_batch("benchmark", "document", batch.tolist(), payloads)
+
+
+async def measure(search: Callable, queries: Sequence) -> Dict[str, float]:
+
+    await search(queries[0])
+    samples = []
+
+    for query in queries:
+        started = time.perf_counter()
+        await search(query)
+        samples.append(time.perf_counter() - started)
+
+    return {"p50_ms": percentile_ms(samples, 50), "p99_ms": percentile_ms(samples, 99)}
+
+
+async def benchmark_numpy(vectors: np.ndarray, queries: np.ndarray, dtype: str) -> Dict[str, float]:
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        await populate(NumpyVectorStoreRepository(data_dir, VECTOR_SIZE, dtype), vectors)
+
+        # Measure a cold process view: reopen the files as a restarted service would
+        rss_before = current_rss_mb()
+        repository = NumpyVectorStoreRepository(data_dir, VECTOR_SIZE, dtype)
+        latency = await measure(lambda q: repository.search_grouped(q, limit=100, min_score=0.0), queries.tolist())
+
+        return {
+            **latency,
+            "rss_delta_mb": round(current_rss_mb() - rss_before, 1),
+            # Every store file, whichever generation directory holds it
+            "disk_mb": directory_size_mb(data_dir),
+        }
+
+
+async def benchmark_qdrant(vectors: np.ndarray, queries: np.ndarray, url: str) -> Dict[str, float]:
+
+    collection = f"benchmark_{uuid.uuid4().hex[:8]}"
+    repository = QdrantVectorStoreRepository(url=url, collection_name=collection, vector_size=VECTOR_SIZE)
+
+    try:
+        await populate(repository, vectors)
+        rss_before = current_rss_mb()
+        latency = await measure(lambda q: repository.search_grouped(q, limit=100, min_score=0.0), queries.tolist())
+
+        return {**latency, "client_rss_delta_mb": round(current_rss_mb() - rss_before, 1)}
+
+    finally:
+        await repository.drop_collection()
+
+
+async def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dtype", choices=["float32", "float16"], default="float32")
+    parser.add_argument("--qdrant-url", default="http://localhost:6333", help="'none' skips Qdrant")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    vectors = rng.standard_normal((args.chunks, VECTOR_SIZE), dtype=np.float32)
+    queries = rng.standard_normal((args.queries, VECTOR_SIZE), dtype=np.float32)
+
+    print(f"{args.chunks} chunks x {VECTOR_SIZE}d, {args.queries} grouped top-100 queries")
+    print(f"numpy ({args.dtype}): {await benchmark_numpy(vectors, queries, args.dtype)}")
+
+    if args.qdrant_url.lower() != "none":
+
+        try:
+            print(f"qdrant ({args.qdrant_url}): {await benchmark_qdrant(vectors, queries, args.qdrant_url)}")
+
+        except Exception as e:
+            print(f"qdrant ({args.qdrant_url}): skipped, {e}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
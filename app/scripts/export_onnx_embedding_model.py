@@ -0,0 +1,143 @@
+"""
+Exports the sentence-transformer embedding model to ONNX with its fast tokenizer, optionally
+adds an int8 dynamically quantized copy, and checks that the exported model embeds a sample
+of texts with at least --min-cosine similarity to the PyTorch model. A failing parity check
+exits with status 1 so the export is not deployed.
+
+Usage:
+    python -m app.scripts.export_onnx_embedding_model --output models/all-MiniLM-L6-v2-onnx --quantize
+    python -m app.scripts.export_onnx_embedding_model --output models/all-MiniLM-L6-v2-onnx --check-only --quantize
+
+Then set EMBEDDING_BACKEND=onnx and ONNX_MODEL_PATH (plus ONNX_QUANTIZED=true for the int8 model).
+"""
+import argparse
+import logging
+import os
+import sys
+from typing import List
+
+import numpy as np
+
+from app.infrastructure.providers.onnx_embedding_provider import (
+    ONNX_MODEL_FILE,
+    ONNX_QUANTIZED_MODEL_FILE,
+    OnnxSentenceEncoder,
+)
+
+logger = logging.getLogger(__name__)
+
+MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+PARITY_TEXTS = [
+    "carbon levels in soil",
+    "COSMOS-UK soil moisture at station CHIMN",
+    "river flow measurements in the Thames basin",
+    "long-term monitoring of butterfly populations across the United Kingdom",
+    "Supporting documentation describing sampling methods, instrument calibration and quality control "
+    "procedures applied to the water chemistry dataset collected between 1990 and 2020.",
+    "ECN",
+    "Land Cover Map 2021 25m raster",
+    "Gridded estimates of daily and monthly areal rainfall for the United Kingdom (1890-2019)",
+    "ozone",
+    "Concentrations of nitrate, phosphate and dissolved organic carbon in upland streams " * 8,
+]
+
+
+def export(output_dir: str) -> None:
+
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+
+    os.makedirs(output_dir, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
+    model = AutoModel.from_pretrained(MODEL_NAME).eval()
+    sample = tokenizer(["export sample"], return_tensors="pt")
+    names = ["input_ids", "attention_mask", "token_type_ids"]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in names),
+            os.path.join(output_dir, ONNX_MODEL_FILE),
+            input_names=names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=14,
+        )
+
+    # Writes tokenizer.json, the Rust fast tokenizer the encoder loads
+    tokenizer.save_pretrained(output_dir)
+
+
+def quantize(output_dir: str) -> None:
+
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantize_dynamic(
+        os.path.join(output_dir, ONNX_MODEL_FILE),
+        os.path.join(output_dir, ONNX_QUANTIZED_MODEL_FILE),
+        weight_type=QuantType.QInt8,
+    )
+
+
+def cosine_parity(reference: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+
+    reference = reference / np.linalg.norm(reference, axis=1, keepdims=True)
+    candidate = candidate / np.linalg.norm(candidate, axis=1, keepdims=True)
+
+    return (reference * candidate).sum(axis=1)
+
+
+def check_parity(output_dir: str, quantized: bool, texts: List[str]) -> float:
+
+    from sentence_transformers import SentenceTransformer
+
+    reference = SentenceTransformer(MODEL_NAME, device="cpu").encode(texts, convert_to_numpy=True)
+    candidate = OnnxSentenceEncoder.from_directory(output_dir, quantized=quantized).encode(texts)
+
+    return float(cosine_parity(reference, candidate).min())
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--quantize", action="store_true", help="also write and check the int8 model")
+    parser.add_argument("--check-only", action="store_true", help="skip the export and only run the parity check")
+    parser.add_argument("--min-cosine", type=float, default=0.99, help="minimum per-text cosine to the torch model")
+    parser.add_argument("--min-cosine-int8", type=float, default=0.97)
+    parser.add_argument("--texts-file", help="one parity text per line instead of the built-in sample")
+    args = parser.parse_args()
+
+    texts = PARITY_TEXTS
+
+    if args.texts_file:
+
+        with open(args.texts_file, encoding="utf-8") as f:
+            texts = [line.strip() for line in f if line.strip()]
+
+    if not args.check_only:
+        export(args.output)
+
+        if args.quantize:
+            quantize(args.output)
+
+    checks = [(False, args.min_cosine)] + ([(True, args.min_cosine_int8)] if args.quantize else [])
+    passed = True
+
+    for quantized, threshold in checks:
+        worst = check_parity(args.output, quantized, texts)
+        label = "int8" if quantized else "fp32"
+        logger.info(f"{label} ONNX model: minimum cosine to torch embeddings {worst:.5f} (threshold {threshold})")
+        passed = passed and worst >= threshold
+
+    if not passed:
+        logger.error("Parity check failed; keep EMBEDDING_BACKEND=torch")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    main()
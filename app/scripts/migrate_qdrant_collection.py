@@ -0,0 +1,41 @@
+"""
+Moves the existing Qdrant embeddings collection to a collection profile in place: int8 or
+binary quantization with float32 vectors on disk, or back to plain in-RAM float vectors, plus
+HNSW m / ef_construct. Qdrant rebuilds the index from the stored vectors, so nothing is
+re-embedded and searches keep being served while the optimizer runs.
+
+Usage:
+    python -m app.scripts.migrate_qdrant_collection --profile int8
+    python -m app.scripts.migrate_qdrant_collection --profile float
+
+Set QDRANT_COLLECTION_PROFILE to the same profile so the service sends matching search params.
+"""
+import argparse
+import asyncio
+import logging
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.infrastructure.di import get_qdrant_collection_profile, get_qdrant_vector_store_repository
+
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profile", help="float, int8 or binary (default: QDRANT_COLLECTION_PROFILE)")
+    args = parser.parse_args()
+
+    profile = get_qdrant_collection_profile(args.profile)
+    repository = get_qdrant_vector_store_repository(profile)
+
+    await repository.apply_profile()
+    logger.info(f"Applied Qdrant collection profile {profile}; the optimizer re-indexes in the background")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""
+Runs the ingestion queue worker as its own process, so dataset processing does not compete with
+search for the API process. Several instances can run against the same database; each claims
+its own rows.
+
+Usage:
+    python -m app.scripts.run_ingestion_worker [--concurrency 4]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.infrastructure.di import (
+    get_document_extractor,
+    get_embedding_disk_cache,
+    get_ingestion_queue_worker,
+    get_lexical_index_repository,
+    get_model_embedding_provider,
+    get_vector_store_repository,
+    get_zip_downloader,
+)
+from app.infrastructure.providers.process_pool_embedding_provider import ProcessPoolEmbeddingProvider
+
+logger = logging.getLogger(__name__)
+
+
+async def main(args: argparse.Namespace) -> None:
+
+    if args.concurrency:
+        os.environ["INGESTION_WORKER_CONCURRENCY"] = str(args.concurrency)
+
+    vector_store = get_vector_store_repository()
+    await vector_store.initialize()
+    model_provider = get_model_embedding_provider()
+
+    if isinstance(model_provider, ProcessPoolEmbeddingProvider):
+        await model_provider.start()
+
+    worker = get_ingestion_queue_worker()
+    await worker.initialize()
+    worker.start()
+    logger.info(f"Ingestion worker {worker.stats.owner} started with concurrency {worker.stats.concurrency}")
+
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopping.set)
+
+    try:
+        await stopping.wait()
+
+    finally:
+        await worker.stop()
+        stats = worker.stats
+        logger.info(f"Ingestion worker stopped: {stats.succeeded} succeeded, {stats.failed} failed, {stats.recovered} recovered")
+
+        await get_lexical_index_repository().close()
+        await get_zip_downloader().close()
+        await get_document_extractor().close()
+        await vector_store.close()
+
+        if get_embedding_disk_cache() is not None:
+            await get_embedding_disk_cache().close()
+
+        if isinstance(model_provider, ProcessPoolEmbeddingProvider):
+            await model_provider.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=0, help="Datasets processed at once (default INGESTION_WORKER_CONCURRENCY)")
+    asyncio.run(main(parser.parse_args()))
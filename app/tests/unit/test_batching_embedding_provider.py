@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.domain.exceptions.search_exception import EmbeddingGenerationException
+from app.infrastructure.providers.batching_embedding_provider import BatchingEmbeddingProvider
+
+
+class TestData:
+    """Centralized test data for BatchingEmbeddingProvider tests."""
+    TEXTS = ["soil carbon", "river flow", "bird counts", "ozone", "snow depth"]
+
+    @staticmethod
+    async def encode(texts):
+        return [[float(len(t))] for t in texts]
+
+
+class TestBatchingEmbeddingProvider:
+
+    @pytest.fixture
+    def inner(self):
+        inner = AsyncMock()
+        inner.generate_embeddings = AsyncMock(side_effect=TestData.encode)
+        return inner
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_encode_call(self, inner):
+        batcher = BatchingEmbeddingProvider(inner, max_batch_size=32, max_wait_ms=20)
+
+        results = await asyncio.gather(*(batcher.generate_embedding(t) for t in TestData.TEXTS))
+
+        assert results == [[float(len(t))] for t in TestData.TEXTS]
+        inner.generate_embeddings.assert_awaited_once_with(TestData.TEXTS)
+        assert batcher.stats.average_batch_size == len(TestData.TEXTS)
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_batches_are_capped_at_max_batch_size(self, inner):
+        batcher = BatchingEmbeddingProvider(inner, max_batch_size=2, max_wait_ms=20)
+
+        await asyncio.gather(*(batcher.generate_embedding(t) for t in TestData.TEXTS))
+
+        assert [len(c.args[0]) for c in inner.generate_embeddings.await_args_list] == [2, 2, 1]
+        assert batcher.stats.largest_batch == 2
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_encode_failure_reaches_every_waiting_caller(self, inner):
+        inner.generate_embeddings.side_effect = RuntimeError("model crashed")
+        batcher = BatchingEmbeddingProvider(inner, max_wait_ms=20)
+
+        results = await asyncio.gather(*(batcher.generate_embedding(t) for t in TestData.TEXTS[:3]), return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        # The worker survives and serves later requests
+        inner.generate_embeddings.side_effect = TestData.encode
+        assert await batcher.generate_embedding("ozone") == [5.0]
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_rejects_requests_beyond_queue_depth(self, inner):
+        release = asyncio.Event()
+
+        async def blocked_encode(texts):
+            await release.wait()
+            return await TestData.encode(texts)
+
+        inner.generate_embeddings.side_effect = blocked_encode
+        batcher = BatchingEmbeddingProvider(inner, max_batch_size=1, max_wait_ms=0, max_queue_depth=1)
+
+        in_flight = asyncio.create_task(batcher.generate_embedding("a"))
+        await asyncio.sleep(0.01)
+        queued = asyncio.create_task(batcher.generate_embedding("bb"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(EmbeddingGenerationException) as excinfo:
+            await batcher.generate_embedding("ccc")
+
+        release.set()
+        assert await in_flight == [1.0]
+        assert await queued == [2.0]
+        assert excinfo.value.status_code == 503
+        assert batcher.stats.rejected == 1
+        await batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_calls_bypass_the_queue(self, inner):
+        batcher = BatchingEmbeddingProvider(inner)
+
+        assert await batcher.generate_embeddings(["ab"]) == [[2.0]]
+        assert batcher.stats.batches == 0
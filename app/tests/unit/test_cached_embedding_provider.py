@@ -0,0 +1,74 @@
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from app.contracts.providers.i_embedding_provider import IEmbeddingProvider
+from app.infrastructure.providers.cached_embedding_provider import CachedEmbeddingProvider
+
+
+class TestData:
+    """Centralized test data for CachedEmbeddingProvider tests."""
+    QUERY = "Soil  Moisture "
+    NORMALIZED_QUERY = "soil moisture"
+    EMBEDDING = [0.1, 0.2, 0.3]
+    OTHER_EMBEDDING = [0.4, 0.5, 0.6]
+
+
+class TestCachedEmbeddingProvider:
+
+    @pytest.fixture
+    def inner_provider(self):
+        provider = Mock(spec=IEmbeddingProvider)
+        provider.generate_embedding = AsyncMock(return_value=TestData.EMBEDDING)
+        provider.generate_embeddings = AsyncMock()
+        return provider
+
+    @pytest.fixture
+    def provider(self, inner_provider):
+        return CachedEmbeddingProvider(inner_provider, max_size=2, ttl_seconds=60)
+
+    @pytest.mark.asyncio
+    async def test_generate_embedding_serves_repeated_queries_from_cache(self, provider, inner_provider):
+        first = await provider.generate_embedding(TestData.QUERY)
+        second = await provider.generate_embedding(TestData.NORMALIZED_QUERY)
+
+        assert first == second == TestData.EMBEDDING
+        inner_provider.generate_embedding.assert_awaited_once_with(TestData.QUERY)
+        assert provider.stats.hits == 1
+        assert provider.stats.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_generate_embedding_evicts_least_recently_used(self, provider, inner_provider):
+        await provider.generate_embedding("a")
+        await provider.generate_embedding("b")
+        await provider.generate_embedding("a")
+        await provider.generate_embedding("c")
+
+        await provider.generate_embedding("b")
+
+        assert provider.stats.evictions == 2
+        assert inner_provider.generate_embedding.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_generate_embedding_expires_entries_after_ttl(self, provider, inner_provider):
+        with patch("app.infrastructure.providers.cached_embedding_provider.time.monotonic", side_effect=[0.0, 120.0, 120.0]):
+            await provider.generate_embedding(TestData.QUERY)
+            await provider.generate_embedding(TestData.QUERY)
+
+        assert inner_provider.generate_embedding.await_count == 2
+        assert provider.stats.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_reads_cache_without_populating_it(self, provider, inner_provider):
+        await provider.generate_embedding(TestData.QUERY)
+        inner_provider.generate_embeddings.return_value = [TestData.OTHER_EMBEDDING]
+
+        results = await provider.generate_embeddings([TestData.NORMALIZED_QUERY, "chunk text"])
+
+        assert results == [TestData.EMBEDDING, TestData.OTHER_EMBEDDING]
+        inner_provider.generate_embeddings.assert_awaited_once_with(["chunk text"])
+        assert provider.stats.size == 1
+
+    def test_rejects_non_positive_max_size(self, inner_provider):
+        with pytest.raises(ValueError):
+            CachedEmbeddingProvider(inner_provider, max_size=0)
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from app.infrastructure.providers.cross_encoder_reranker_provider import CrossEncoderRerankerProvider
+
+
+class LengthCrossEncoder:
+
+    def predict(self, pairs, **kwargs):
+        return np.array([float(len(passage)) for _, passage in pairs])
+
+
+class TestCrossEncoderRerankerProvider:
+
+    @pytest.mark.asyncio
+    async def test_model_is_loaded_on_first_score_only(self):
+        loads = []
+        provider = CrossEncoderRerankerProvider(lambda: loads.append(1) or LengthCrossEncoder(), batch_size=2)
+
+        assert loads == []
+
+        first = await provider.score("q", ["a", "bbb", "cc"])
+        second = await provider.score("q", ["dddd"])
+
+        assert (first, second) == ([1.0, 3.0, 2.0], [4.0])
+        assert loads == [1]
+
+    @pytest.mark.asyncio
+    async def test_failed_load_is_not_retried_and_every_call_raises(self):
+        loads = []
+
+        def failing_loader():
+            loads.append(1)
+            raise OSError("model download failed")
+
+        provider = CrossEncoderRerankerProvider(failing_loader)
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="unavailable"):
+                await provider.score("q", ["a", "b"])
+
+        assert loads == [1]
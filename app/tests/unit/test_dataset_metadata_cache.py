@@ -0,0 +1,129 @@
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.domain.entities.dataset_metadata import DatasetMetadata
+from app.infrastructure.caching.dataset_metadata_cache import DatasetMetadataCache
+from app.infrastructure.data_access.session import Base
+
+
+class TestData:
+    """Centralized test data for DatasetMetadataCache tests."""
+    IDENTIFIER_1 = "ds-1"
+    IDENTIFIER_2 = "ds-2"
+    CREATED_AT = datetime(2025, 1, 1, 9, 0, 0)
+    UPDATED_AT = datetime(2025, 1, 2, 9, 0, 0)
+
+    @staticmethod
+    def create_metadata(identifier: str, title: str, created_at: datetime = CREATED_AT, updated_at: datetime = None):
+        return DatasetMetadata(
+            dataset_id=f"dataset-{identifier}",
+            file_identifier=identifier,
+            title=title,
+            description="Long abstract " * 50,
+            publication_date=datetime(2024, 6, 1),
+            metadata_date=datetime(2024, 6, 1),
+            created_at=created_at,
+            updated_at=updated_at
+        )
+
+
+class TestDatasetMetadataCache:
+
+    @pytest_asyncio.fixture
+    async def session_factory(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'etl.db'}")
+
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        yield async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+        await engine.dispose()
+
+    @pytest.fixture
+    def cache(self, session_factory):
+        return DatasetMetadataCache(session_factory, refresh_interval_seconds=60, full_refresh_interval_seconds=3600)
+
+    async def _add(self, session_factory, *rows):
+        async with session_factory() as session:
+            session.add_all(rows)
+            await session.commit()
+
+    @pytest.mark.asyncio
+    async def test_refresh_loads_titles_and_counts_hits_and_misses(self, cache, session_factory):
+        await self._add(session_factory, TestData.create_metadata(TestData.IDENTIFIER_1, "Soil moisture"))
+
+        loaded = await cache.refresh()
+        summaries = cache.get_many([TestData.IDENTIFIER_1, TestData.IDENTIFIER_2])
+
+        assert loaded == 1
+        assert summaries[TestData.IDENTIFIER_1].title == "Soil moisture"
+        assert summaries[TestData.IDENTIFIER_1].publication_date == datetime(2024, 6, 1)
+        assert TestData.IDENTIFIER_2 not in summaries
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_refresh_only_loads_rows_changed_since_watermark(self, cache, session_factory):
+        existing = TestData.create_metadata(TestData.IDENTIFIER_1, "Old title")
+        await self._add(session_factory, existing)
+        await cache.refresh()
+
+        async with session_factory() as session:
+            row = await session.get(DatasetMetadata, existing.dataset_metadata_id)
+            row.title = "New title"
+            row.updated_at = TestData.UPDATED_AT
+            await session.commit()
+        await self._add(session_factory, TestData.create_metadata(TestData.IDENTIFIER_2, "Added", created_at=TestData.UPDATED_AT))
+
+        loaded = await cache.refresh()
+
+        assert loaded == 2
+        assert cache.get_many([TestData.IDENTIFIER_1])[TestData.IDENTIFIER_1].title == "New title"
+        assert cache.stats.watermark.startswith("2025-01-02")
+        assert await cache.refresh() == 2  # rows at the watermark are re-read, nothing older
+
+    @pytest.mark.asyncio
+    async def test_full_refresh_drops_deleted_datasets(self, cache, session_factory):
+        row = TestData.create_metadata(TestData.IDENTIFIER_1, "Soil moisture")
+        await self._add(session_factory, row)
+        await cache.refresh()
+
+        async with session_factory() as session:
+            await session.delete(await session.get(DatasetMetadata, row.dataset_metadata_id))
+            await session.commit()
+
+        await cache.refresh(full=True)
+
+        assert cache.get_many([TestData.IDENTIFIER_1]) == {}
+
+    @pytest.mark.asyncio
+    async def test_stats_report_staleness_and_failures(self, session_factory):
+        def broken_factory():
+            raise RuntimeError("database locked")
+
+        cache = DatasetMetadataCache(broken_factory)
+
+        assert cache.stats.staleness_seconds is None
+
+        with pytest.raises(RuntimeError):
+            await cache.refresh()
+
+        assert cache.stats.refresh_failures == 1
+
+    @pytest.mark.asyncio
+    async def test_load_missing_reads_datasets_written_since_the_last_refresh(self, cache, session_factory):
+        await cache.refresh()
+        await self._add(session_factory, TestData.create_metadata(TestData.IDENTIFIER_1, "Written by the ETL"))
+
+        loaded = await cache.load_missing([TestData.IDENTIFIER_1, TestData.IDENTIFIER_2])
+
+        assert list(loaded) == [TestData.IDENTIFIER_1]
+        assert loaded[TestData.IDENTIFIER_1].title == "Written by the ETL"
+        assert cache.get_many([TestData.IDENTIFIER_1])[TestData.IDENTIFIER_1].title == "Written by the ETL"
+
+    def test_note_title_updates_entry_before_refresh(self, cache):
+        cache.note_title(TestData.IDENTIFIER_1, "Ingested title")
+
+        assert cache.get_many([TestData.IDENTIFIER_1])[TestData.IDENTIFIER_1].title == "Ingested title"
@@ -0,0 +1,85 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.application.services.dataset_processing_job_service import DatasetProcessingJobService
+from app.domain.value_objects.dataset_ingestion_progress import DatasetIngestionProgress
+from app.domain.value_objects.dataset_processing_job import DatasetProcessingJob
+
+
+class FakeEmbeddingService:
+    """Counts concurrent datasets and reports progress like EmbeddingService."""
+
+    def __init__(self, state):
+        self._state = state
+
+    async def process_dataset_heavy_lifting(self, dataset_metadata_id, progress=None):
+        self._state["running"] += 1
+        self._state["peak"] = max(self._state["peak"], self._state["running"])
+
+        try:
+            progress.bytes_downloaded += 100
+            await self._state["gate"].wait()
+            progress.points_upserted += 3
+
+            if dataset_metadata_id == 3:
+
+                raise RuntimeError("extraction failed")
+
+            return True
+
+        finally:
+            self._state["running"] -= 1
+
+
+class TestDatasetProcessingJobService:
+
+    @pytest.fixture
+    def state(self):
+        return {"running": 0, "peak": 0, "gate": asyncio.Event()}
+
+    @pytest.fixture
+    def job_service(self, state):
+
+        @asynccontextmanager
+        async def session_factory():
+            yield None
+
+        async def service_factory(uow):
+            return FakeEmbeddingService(state)
+
+        return DatasetProcessingJobService(session_factory, service_factory, default_parallelism=2, max_parallelism=4)
+
+    @pytest.mark.asyncio
+    async def test_job_runs_with_bounded_parallelism_and_reports_progress(self, job_service, state):
+        job = job_service.submit([1, 2, 3, 2])
+        await asyncio.sleep(0.01)
+
+        assert [d.dataset_metadata_id for d in job.datasets] == [1, 2, 3]
+        assert [d.status for d in job.datasets] == ["running", "running", "pending"]
+        assert job.datasets[0].bytes_downloaded == 100
+
+        state["gate"].set()
+
+        while not job.done:
+            await asyncio.sleep(0.01)
+
+        assert job.status == DatasetProcessingJob.COMPLETED
+        assert state["peak"] == 2
+        assert [d.status for d in job.datasets] == ["succeeded", "succeeded", "failed"]
+        assert job.datasets[2].error == "extraction failed"
+        assert job_service.get(job.job_id) is job
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_running_and_skips_pending_datasets(self, job_service, state):
+        job = job_service.submit([1, 2, 3], parallelism=1)
+        await asyncio.sleep(0.01)
+
+        cancelled = await job_service.cancel(job.job_id)
+
+        assert cancelled.status == DatasetProcessingJob.CANCELLED
+        assert {d.status for d in job.datasets} == {DatasetIngestionProgress.CANCELLED}
+        assert job.datasets[0].finished_at is not None
+        assert state["running"] == 0
+        assert await job_service.cancel("unknown") is None
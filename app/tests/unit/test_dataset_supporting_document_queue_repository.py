@@ -3,8 +3,13 @@ from unittest.mock import AsyncMock, Mock
 from datetime import datetime, timedelta
 
 import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.domain.entities.dataset_metadata import DatasetMetadata
 from app.domain.entities.dataset_supporting_document_queue import DatasetSupportingDocumentQueue
+from app.domain.entities.ingestion_lease import IngestionLease
+from app.infrastructure.data_access.session import Base
 from app.infrastructure.repositories.dataset_supporting_document_queue_repository import (
     DatasetSupportingDocumentQueueRepository,
 )
@@ -50,3 +55,90 @@ class TestDatasetSupportingDocumentQueueRepository:
         assert pending in results
         assert stale in results
 
+
+
+class TestDatasetSupportingDocumentQueueLeases:
+
+    @pytest_asyncio.fixture
+    async def session_factory(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'queue.db'}")
+
+        async with engine.begin() as conn:
+            await conn.run_sync(lambda c: Base.metadata.create_all(
+                c, tables=[DatasetMetadata.__table__, DatasetSupportingDocumentQueue.__table__, IngestionLease.__table__]
+            ))
+
+        factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+        async with factory() as session:
+            session.add_all([
+                DatasetSupportingDocumentQueue(dataset_metadata_id=i, created_at=datetime.utcnow()) for i in range(1, 4)
+            ])
+            session.add(DatasetSupportingDocumentQueue(
+                dataset_metadata_id=4,
+                processed_title_for_embedding=True,
+                processed_abstract_for_embedding=True,
+                processed_supporting_docs_for_embedding=True,
+                created_at=datetime.utcnow(),
+            ))
+            await session.commit()
+
+        yield factory
+
+        await engine.dispose()
+
+    @staticmethod
+    async def _claim(session_factory, owner, limit, lease_seconds=60):
+        async with session_factory() as session:
+            claimed = await DatasetSupportingDocumentQueueRepository(session).claim_pending_queue_items(owner, limit, lease_seconds)
+            await session.commit()
+
+        return [item.dataset_metadata_id for item in claimed]
+
+    @pytest.mark.asyncio
+    async def test_workers_claim_disjoint_pending_rows(self, session_factory):
+        first = await self._claim(session_factory, "worker-a", 2)
+        second = await self._claim(session_factory, "worker-b", 5)
+
+        assert first == [1, 2]
+        assert second == [3]
+        assert await self._claim(session_factory, "worker-c", 5) == []
+
+    @pytest.mark.asyncio
+    async def test_expired_leases_are_recovered_and_stale_owners_cannot_release(self, session_factory):
+        await self._claim(session_factory, "crashed", 1, lease_seconds=-1)
+        await self._claim(session_factory, "alive", 1)
+
+        async with session_factory() as session:
+            repo = DatasetSupportingDocumentQueueRepository(session)
+            recovered = await repo.recover_expired_leases()
+            renewed = await repo.renew_leases("crashed", [1], 60)
+            released = await repo.release_queue_item("crashed", 1)
+            await session.commit()
+
+        assert (recovered, renewed, released) == (1, 0, False)
+        assert await self._claim(session_factory, "worker-b", 5) == [1, 3]
+
+        async with session_factory() as session:
+            repo = DatasetSupportingDocumentQueueRepository(session)
+            assert await repo.release_queue_item("alive", 2) is True
+            await session.commit()
+            queue_item = await repo.get_by_id(2)
+
+        assert queue_item.is_processing is False
+
+    @pytest.mark.asyncio
+    async def test_rows_flagged_outside_the_worker_are_not_recovered(self, session_factory):
+        async with session_factory() as session:
+            repo = DatasetSupportingDocumentQueueRepository(session)
+            # Flagged by another process (e.g. a synchronous process-dataset run) without a lease
+            queue_item = await repo.get_by_id(1)
+            queue_item.is_processing = True
+            await session.commit()
+
+        async with session_factory() as session:
+            recovered = await DatasetSupportingDocumentQueueRepository(session).recover_expired_leases()
+            await session.commit()
+
+        assert recovered == 0
+        assert await self._claim(session_factory, "worker-a", 5) == [2, 3]
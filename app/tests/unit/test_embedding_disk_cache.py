@@ -0,0 +1,115 @@
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock
+
+from app.infrastructure.caching.embedding_disk_cache import EmbeddingDiskCache
+from app.infrastructure.providers.disk_cached_embedding_provider import DiskCachedEmbeddingProvider
+
+
+class TestData:
+    """Centralized test data for EmbeddingDiskCache tests."""
+    MODEL = "sentence-transformers/all-MiniLM-L6-v2:torch"
+    DIMENSION = 4
+    CHUNK_1 = "Soil moisture was sampled weekly."
+    CHUNK_2 = "River flow gauges were calibrated annually."
+    VECTOR_1 = [0.5, -0.25, 0.125, 1.0]
+    VECTOR_2 = [1.0, 0.0, -1.0, 0.5]
+
+
+class TestEmbeddingDiskCache:
+
+    @pytest_asyncio.fixture
+    async def cache(self, tmp_path):
+        cache = EmbeddingDiskCache(str(tmp_path / "embeddings.db"), TestData.MODEL, dimension=TestData.DIMENSION)
+        yield cache
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_round_trips_vectors_and_counts_hits(self, cache):
+        await cache.put_many([TestData.CHUNK_1], [TestData.VECTOR_1])
+
+        results = await cache.get_many([TestData.CHUNK_1, TestData.CHUNK_2, TestData.CHUNK_1])
+
+        # float16 holds these values exactly
+        assert results == [TestData.VECTOR_1, None, TestData.VECTOR_1]
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.size) == (2, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_entries_persist_and_are_scoped_to_the_model(self, tmp_path, cache):
+        await cache.put_many([TestData.CHUNK_1], [TestData.VECTOR_1])
+        await cache.close()
+
+        reopened = EmbeddingDiskCache(str(tmp_path / "embeddings.db"), TestData.MODEL, dimension=TestData.DIMENSION)
+        other_model = EmbeddingDiskCache(str(tmp_path / "embeddings.db"), "onnx-int8", dimension=TestData.DIMENSION)
+
+        try:
+            assert await reopened.get_many([TestData.CHUNK_1]) == [TestData.VECTOR_1]
+            assert await other_model.get_many([TestData.CHUNK_1]) == [None]
+            assert reopened.stats.size == 1
+
+        finally:
+            await reopened.close()
+            await other_model.close()
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_entries_beyond_size_bound(self, tmp_path):
+        row_bytes = TestData.DIMENSION * 2 + EmbeddingDiskCache.ROW_OVERHEAD_BYTES
+        cache = EmbeddingDiskCache(str(tmp_path / "small.db"), TestData.MODEL, dimension=TestData.DIMENSION, max_bytes=10 * row_bytes)
+
+        try:
+            texts = [f"chunk {i}" for i in range(10)]
+            await cache.put_many(texts, [TestData.VECTOR_1] * 10)
+            await cache._conn.execute("UPDATE embeddings SET last_used = 0")
+            await cache.get_many(["chunk 0"])
+
+            await cache.put_many(["chunk 10"], [TestData.VECTOR_2])
+
+            assert cache.stats.size == 9
+            assert cache.stats.evictions == 2
+            assert await cache.get_many(["chunk 0", "chunk 10"]) == [TestData.VECTOR_1, TestData.VECTOR_2]
+
+        finally:
+            await cache.close()
+
+
+class TestDiskCachedEmbeddingProvider:
+
+    @pytest.mark.asyncio
+    async def test_only_encodes_texts_never_seen(self, tmp_path):
+        inner = AsyncMock()
+        inner.generate_embeddings = AsyncMock(side_effect=lambda texts: [TestData.VECTOR_2 for _ in texts])
+        cache = EmbeddingDiskCache(str(tmp_path / "embeddings.db"), TestData.MODEL, dimension=TestData.DIMENSION)
+        await cache.put_many([TestData.CHUNK_1], [TestData.VECTOR_1])
+        provider = DiskCachedEmbeddingProvider(inner, cache)
+
+        try:
+            first = await provider.generate_embeddings([TestData.CHUNK_1, TestData.CHUNK_2, TestData.CHUNK_2])
+            second = await provider.generate_embeddings([TestData.CHUNK_2])
+
+        finally:
+            await cache.close()
+
+        assert first == [TestData.VECTOR_1, TestData.VECTOR_2, TestData.VECTOR_2]
+        assert second == [TestData.VECTOR_2]
+        inner.generate_embeddings.assert_awaited_once_with([TestData.CHUNK_2])
+
+    @pytest.mark.asyncio
+    async def test_queries_bypass_the_disk_cache(self):
+        inner = AsyncMock()
+        inner.generate_embedding = AsyncMock(return_value=TestData.VECTOR_1)
+        cache = AsyncMock()
+        provider = DiskCachedEmbeddingProvider(inner, cache)
+
+        assert await provider.generate_embedding("soil") == TestData.VECTOR_1
+        cache.get_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_failures_fall_back_to_encoding(self):
+        inner = AsyncMock()
+        inner.generate_embeddings = AsyncMock(return_value=[TestData.VECTOR_1])
+        cache = AsyncMock()
+        cache.get_many.side_effect = OSError("disk full")
+        cache.put_many.side_effect = OSError("disk full")
+        provider = DiskCachedEmbeddingProvider(inner, cache)
+
+        assert await provider.generate_embeddings([TestData.CHUNK_1]) == [TestData.VECTOR_1]
@@ -1,19 +1,25 @@
+import asyncio
+import hashlib
 import io
 import zipfile
 from datetime import datetime
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import ANY, AsyncMock, Mock
 
 import pytest
 
 from app.application.services.embedding_service import EmbeddingService
+from app.application.services.ingestion_pipeline import IngestionPipeline
 from app.contracts.services.i_semantic_search_service import ISemanticSearchService
 from app.domain.entities.dataset_metadata import DatasetMetadata
 from app.domain.entities.dataset_supporting_document_queue import (
     DatasetSupportingDocumentQueue,
 )
 from app.domain.entities.supporting_document import SupportingDocument
+from app.domain.value_objects.dataset_ingestion_progress import DatasetIngestionProgress
+from app.domain.value_objects.ingestion_chunk import IngestionChunk
 from app.domain.value_objects.metadata_constants import SupportingDocumentConstants
 from app.infrastructure.data_access.repository_wrapper import RepositoryWrapper
+from app.infrastructure.providers.zip_downloader import DownloadedArchive
 
 
 class TestEmbeddingService:
@@ -52,28 +58,31 @@ class TestEmbeddingService:
 
         self.mock_semantic = Mock(spec=ISemanticSearchService)
         self.mock_semantic.ingest_text = AsyncMock()
+        self.mock_semantic.commit_dataset_version = AsyncMock()
+        self.mock_semantic.discard_dataset_version = AsyncMock()
+        self.mock_semantic.iter_document_chunks = Mock(side_effect=self._iter_document_chunks)
+        self.mock_semantic.embed_chunks = AsyncMock(side_effect=lambda chunks, dataset_version: [[0.1]] * len(chunks))
+        self.mock_semantic.index_chunks = AsyncMock()
+        self.mock_semantic.retain_archive = AsyncMock(return_value=False)
+        self.mock_semantic.fail_archive = AsyncMock(side_effect=self._fail_archive)
 
         self.mock_zip_downloader = Mock()
+        self.mock_zip_downloader.download = AsyncMock()
         self.mock_ro_crate_parser = Mock()
-        self.mock_pdf_extractor = Mock()
-        self.mock_word_extractor = Mock()
-        self.mock_rtf_extractor = Mock()
-
-        self.mock_pdf_extractor.extract_text.return_value = ""
-        self.mock_word_extractor.extract_text.return_value = ""
-        self.mock_rtf_extractor.extract_text.return_value = "extracted rtf text"
+        self.mock_document_extractor = Mock()
+        self.mock_document_extractor.concurrency = 2
+        self.mock_document_extractor.supports.side_effect = lambda extension: extension in (".pdf", ".docx", ".rtf")
+        self.mock_document_extractor.extract_segments = AsyncMock(return_value=["extracted rtf text"])
 
         self.service = EmbeddingService(
             repository_wrapper=self.mock_repo,
             semantic_search_service=self.mock_semantic,
             zip_downloader=self.mock_zip_downloader,
             ro_crate_parser=self.mock_ro_crate_parser,
-            pdf_extractor=self.mock_pdf_extractor,
-            word_extractor=self.mock_word_extractor,
-            rtf_extractor=self.mock_rtf_extractor,
+            document_extractor=self.mock_document_extractor,
         )
 
-        self.mock_zip_downloader.download.return_value = self._build_supporting_zip()
+        self.mock_zip_downloader.download.side_effect = lambda url: self._build_archive()
         self.mock_ro_crate_parser.extract_supported_files.return_value = [
             self.ZIP_ENTRY
         ]
@@ -86,6 +95,28 @@ class TestEmbeddingService:
         buffer.seek(0)
         return buffer.getvalue()
 
+    def _build_archive(self, entries=None) -> DownloadedArchive:
+        if entries is None:
+            zip_bytes = self._build_supporting_zip()
+        else:
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, "w") as z:
+                for name, content in entries.items():
+                    z.writestr(name, content)
+            zip_bytes = buffer.getvalue()
+        return DownloadedArchive(
+            io.BytesIO(zip_bytes), len(zip_bytes), on_disk=False, content_hash=hashlib.sha256(zip_bytes).hexdigest()
+        )
+
+    @staticmethod
+    async def _fail_archive(dataset_version, archive_url, archive_hash=None):
+        dataset_version.failed_archives[archive_url] = archive_hash
+
+    @staticmethod
+    async def _iter_document_chunks(identifier, segments, source_file=None, dataset_version=None, archive_hash=None, archive_url=None):
+        for segment in segments:
+            yield [IngestionChunk(identifier, "document", segment, {"source_file": source_file})]
+
     @pytest.mark.asyncio
     async def test_process_dataset_heavy_lifting_ingests_metadata_and_documents(self):
         result = await self.service.process_dataset_heavy_lifting(self.DATASET_ID)
@@ -95,19 +126,27 @@ class TestEmbeddingService:
             identifier=self.IDENTIFIER,
             content_type="title",
             text="Important Title",
+            dataset_version=ANY,
         )
         self.mock_semantic.ingest_text.assert_any_await(
             identifier=self.IDENTIFIER,
             content_type="description",
             text="Detailed description",
+            dataset_version=ANY,
         )
-        self.mock_semantic.ingest_text.assert_any_await(
+        self.mock_semantic.iter_document_chunks.assert_called_once_with(
             identifier=self.IDENTIFIER,
-            content_type="document",
-            text="extracted rtf text",
+            segments=["extracted rtf text"],
             source_file=self.ZIP_ENTRY,
+            dataset_version=ANY,
+            archive_hash=hashlib.sha256(self._build_supporting_zip()).hexdigest(),
+            archive_url=self.DOWNLOAD_URL,
         )
-        self.mock_zip_downloader.download.assert_called_once_with(self.DOWNLOAD_URL)
+        indexed_chunks = self.mock_semantic.index_chunks.await_args.args[0]
+        assert [c.text for c in indexed_chunks] == ["extracted rtf text"]
+        self.mock_semantic.commit_dataset_version.assert_awaited_once()
+        self.mock_semantic.discard_dataset_version.assert_not_awaited()
+        self.mock_zip_downloader.download.assert_awaited_once_with(self.DOWNLOAD_URL)
         self.mock_ro_crate_parser.extract_supported_files.assert_called_once()
         self.mock_repo.dataset_supporting_document_queues.update.assert_awaited_once()
         assert self.mock_repo.dataset_supporting_document_queues.get_single.await_count == 1
@@ -123,16 +162,42 @@ class TestEmbeddingService:
         self.mock_repo.dataset_supporting_document_queues.update.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_extract_and_ingest_file_skips_unknown_extension(self):
+    async def test_process_zip_packages_skips_unknown_extension(self):
+        self.mock_zip_downloader.download.side_effect = lambda url: self._build_archive({"ignored.txt": "ignored"})
+        self.mock_ro_crate_parser.extract_supported_files.return_value = ["ignored.txt"]
 
-        buffer = io.BytesIO()
-        with zipfile.ZipFile(buffer, "w") as z:
-            z.writestr("ignored.txt", "ignored")
-        buffer.seek(0)
-        with zipfile.ZipFile(buffer) as zf:
-            await self.service._extract_and_ingest_file(zf, "ignored.txt", self.IDENTIFIER)
+        processed = await self.service._process_zip_packages([self.DOWNLOAD_URL], self.IDENTIFIER)
 
-        self.mock_semantic.ingest_text.assert_not_called()
+        assert processed is True
+        self.mock_document_extractor.extract_segments.assert_not_awaited()
+        self.mock_semantic.iter_document_chunks.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_process_zip_packages_embeds_chunks_of_all_archives_in_shared_batches(self):
+        files = {"a.pdf": "a1|a2", "b.docx": "b1|b2|b3", "c.rtf": "c1"}
+        self.service = EmbeddingService(
+            repository_wrapper=self.mock_repo,
+            semantic_search_service=self.mock_semantic,
+            zip_downloader=self.mock_zip_downloader,
+            ro_crate_parser=self.mock_ro_crate_parser,
+            document_extractor=self.mock_document_extractor,
+            ingestion_pipeline=IngestionPipeline.for_supporting_documents(embed_concurrency=1, embed_batch_size=4),
+        )
+        self.mock_zip_downloader.download.side_effect = lambda url: self._build_archive(files)
+        self.mock_ro_crate_parser.extract_supported_files.return_value = list(files)
+        self.mock_document_extractor.extract_segments.side_effect = lambda extension, content: content.decode().split("|")
+
+        processed = await self.service._process_zip_packages(["https://example.com/1.zip", "https://example.com/2.zip"], self.IDENTIFIER)
+
+        assert processed is True
+        batch_sizes = [len(c.args[0]) for c in self.mock_semantic.embed_chunks.await_args_list]
+        assert sum(batch_sizes) == 12 and max(batch_sizes) == 4
+        indexed = sorted(chunk.text for c in self.mock_semantic.index_chunks.await_args_list for chunk in c.args[0])
+        assert indexed == sorted(["a1", "a2", "b1", "b2", "b3", "c1"] * 2)
+        stats = {stage.name: stage for stage in self.service._pipeline.stats.stages}
+        assert stats[IngestionPipeline.FETCH].items_out == 2
+        assert stats[IngestionPipeline.EXTRACT].items_out == 6
+        assert stats[IngestionPipeline.UPSERT].items_in == len(batch_sizes)
 
     @pytest.mark.asyncio
     async def test_process_dataset_heavy_lifting_skips_documents_without_download_url(self):
@@ -142,18 +207,97 @@ class TestEmbeddingService:
         self.mock_repo.supporting_documents.find_supporting_zips_by_dataset_id = AsyncMock(
             return_value=[supporting_doc]
         )
-        self.service._process_zip_package = AsyncMock()
+        self.service._process_zip_packages = AsyncMock()
 
         result = await self.service.process_dataset_heavy_lifting(self.DATASET_ID)
 
         assert result is True
-        self.service._process_zip_package.assert_not_awaited()
+        self.service._process_zip_packages.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_process_zip_package_handles_download_errors(self):
+    async def test_process_dataset_heavy_lifting_keeps_chunks_of_unchanged_archive_without_extracting(self):
+        self.mock_zip_downloader.download.side_effect = None
+        self.mock_zip_downloader.download.return_value = DownloadedArchive(
+            io.BytesIO(self._build_supporting_zip()), 10, on_disk=False, content_hash="abc", from_cache=True
+        )
+        self.mock_semantic.retain_archive.return_value = True
+        progress = DatasetIngestionProgress(dataset_metadata_id=self.DATASET_ID)
+
+        result = await self.service.process_dataset_heavy_lifting(self.DATASET_ID, progress)
+
+        assert result is True
+        dataset_version = self.mock_semantic.retain_archive.await_args.args[0]
+        assert self.mock_semantic.retain_archive.await_args.args[1] == "abc"
+        self.mock_semantic.commit_dataset_version.assert_awaited_once_with(dataset_version)
+        self.mock_ro_crate_parser.extract_supported_files.assert_not_called()
+        self.mock_document_extractor.extract_segments.assert_not_awaited()
+        self.mock_semantic.iter_document_chunks.assert_not_called()
+        assert progress.bytes_downloaded == 0
+
+    @pytest.mark.asyncio
+    async def test_process_zip_packages_handles_download_errors(self):
         self.mock_zip_downloader.download.side_effect = Exception("download failure")
 
-        await self.service._process_zip_package(self.DOWNLOAD_URL, self.IDENTIFIER)
+        processed = await self.service._process_zip_packages([self.DOWNLOAD_URL], self.IDENTIFIER)
 
-        self.mock_semantic.ingest_text.assert_not_called()
+        assert processed is False
+        self.mock_semantic.iter_document_chunks.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_process_dataset_heavy_lifting_commits_other_sources_when_a_zip_fails(self):
+        bad_url = "https://example.com/bad.zip"
+        supporting_docs = []
+        for document_id, url in ((1, self.DOWNLOAD_URL), (2, bad_url)):
+            supporting_doc = Mock(spec=SupportingDocument)
+            supporting_doc.supporting_document_id = document_id
+            supporting_doc.download_url = url
+            supporting_docs.append(supporting_doc)
+        self.mock_repo.supporting_documents.find_supporting_zips_by_dataset_id = AsyncMock(return_value=supporting_docs)
+        bad_archive = DownloadedArchive(io.BytesIO(b"not a zip"), 9, on_disk=False, content_hash="bad")
+        self.mock_zip_downloader.download.side_effect = lambda url: bad_archive if url == bad_url else self._build_archive()
+
+        result = await self.service.process_dataset_heavy_lifting(self.DATASET_ID)
+
+        assert result is False
+        dataset_version = self.mock_semantic.commit_dataset_version.await_args.args[0]
+        self.mock_semantic.fail_archive.assert_awaited_once_with(dataset_version, bad_url, "bad")
+        self.mock_semantic.discard_dataset_version.assert_not_awaited()
+        assert self.mock_semantic.ingest_text.await_count == 2
+        indexed = [chunk.text for c in self.mock_semantic.index_chunks.await_args_list for chunk in c.args[0]]
+        assert indexed == ["extracted rtf text"]
+        queue_item = self.mock_repo.dataset_supporting_document_queues.update.await_args.args[0]
+        assert queue_item.processed_title_for_embedding is True
+        assert queue_item.processed_supporting_docs_for_embedding is False
+
+    @pytest.mark.asyncio
+    async def test_process_dataset_heavy_lifting_keeps_previous_version_when_indexing_fails(self):
+        self.mock_semantic.index_chunks.side_effect = Exception("vector store unavailable")
+
+        result = await self.service.process_dataset_heavy_lifting(self.DATASET_ID)
+
+        assert result is False
+        dataset_version = self.mock_semantic.discard_dataset_version.await_args.args[0]
+        assert dataset_version.identifier == self.IDENTIFIER
+        self.mock_semantic.commit_dataset_version.assert_not_awaited()
+        self.mock_repo.dataset_supporting_document_queues.update.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_process_dataset_heavy_lifting_reports_progress(self):
+        progress = DatasetIngestionProgress(dataset_metadata_id=self.DATASET_ID)
+
+        await self.service.process_dataset_heavy_lifting(self.DATASET_ID, progress)
+
+        assert progress.identifier == self.IDENTIFIER
+        assert progress.bytes_downloaded == len(self._build_supporting_zip())
+        assert progress.files_extracted == 1
+        assert self.mock_semantic.commit_dataset_version.await_args.args[0].progress is progress
+
+    @pytest.mark.asyncio
+    async def test_process_dataset_heavy_lifting_discards_staged_chunks_when_cancelled(self):
+        self.mock_semantic.ingest_text.side_effect = asyncio.CancelledError()
+
+        with pytest.raises(asyncio.CancelledError):
+            await self.service.process_dataset_heavy_lifting(self.DATASET_ID)
 
+        self.mock_semantic.discard_dataset_version.assert_awaited_once()
+        self.mock_semantic.commit_dataset_version.assert_not_awaited()
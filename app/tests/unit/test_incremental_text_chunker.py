@@ -0,0 +1,36 @@
+import pytest
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from app.application.services.incremental_text_chunker import IncrementalTextChunker
+
+
+class TestIncrementalTextChunker:
+
+    def test_chunks_match_splitting_the_full_text(self):
+        words = [f"word{i:04d}" for i in range(3000)]
+        segments = [" ".join(words[i : i + 100]) for i in range(0, len(words), 100)]
+        chunker = IncrementalTextChunker(chunk_size=200, chunk_overlap=40, window_size=1000)
+
+        windows = list(chunker.split(segments))
+        chunks = [chunk for window in windows for chunk in window]
+
+        assert len(windows) > 10
+        assert chunks == RecursiveCharacterTextSplitter(chunk_size=200, chunk_overlap=40).split_text("\n".join(segments))
+        seen = [word for chunk in chunks for word in chunk.split()]
+        assert list(dict.fromkeys(seen)) == words
+
+    def test_buffer_holds_at_most_one_window(self):
+        chunker = IncrementalTextChunker(chunk_size=100, chunk_overlap=10, window_size=400)
+        emitted = []
+
+        for _ in range(50):
+            emitted.extend(chunker.feed("lorem ipsum dolor sit amet " * 3))
+            assert chunker._length < 400 + 100
+
+        emitted.extend(chunker.finish())
+
+        assert emitted and chunker.finish() == []
+
+    def test_window_must_hold_two_chunks(self):
+        with pytest.raises(ValueError):
+            IncrementalTextChunker(chunk_size=500, window_size=600)
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from app.application.services.ingestion_pipeline import IngestionPipeline, PipelineStage
+
+
+class TestIngestionPipeline:
+
+    @pytest.mark.asyncio
+    async def test_items_fan_out_batch_and_reach_the_last_stage(self):
+        pipeline = IngestionPipeline(
+            [PipelineStage("split", 2), PipelineStage("double", 3), PipelineStage("collect", 1, batch_size=4)],
+            queue_size=2,
+        )
+        collected = []
+
+        async def split(text):
+            for word in text.split():
+                yield word
+
+        async def double(word):
+            await asyncio.sleep(0)
+            return None if word == "skip" else word * 2
+
+        async def collect(batch):
+            collected.append(batch)
+
+        await pipeline.run(["a b skip", "c d e", "f"], {"split": split, "double": double, "collect": collect})
+
+        assert sorted(word for batch in collected for word in batch) == ["aa", "bb", "cc", "dd", "ee", "ff"]
+        assert max(len(batch) for batch in collected) == 4
+        stats = pipeline.stats
+        assert (stats.runs, stats.active_runs, stats.failed_runs) == (1, 0, 0)
+        assert [(s.name, s.items_in, s.items_out, s.queue_depth) for s in stats.stages] == [
+            ("split", 3, 7, 0),
+            ("double", 7, 6, 0),
+            ("collect", 6, 0, 0),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_slow_stage_applies_backpressure_to_upstream(self):
+        pipeline = IngestionPipeline([PipelineStage("produce", 1), PipelineStage("consume", 1)], queue_size=1)
+        max_depth = 0
+
+        async def produce(item):
+            return item
+
+        async def consume(item):
+            nonlocal max_depth
+            max_depth = max(max_depth, pipeline.stats.stages[1].queue_depth)
+            await asyncio.sleep(0.01)
+
+        await pipeline.run(range(5), {"produce": produce, "consume": consume})
+
+        produce_stats, consume_stats = pipeline.stats.stages
+        assert max_depth <= 1
+        assert produce_stats.blocked_seconds > 0.02
+        assert consume_stats.items_in == 5
+
+    @pytest.mark.asyncio
+    async def test_failing_stage_cancels_the_run_and_discards_queued_items(self):
+        pipeline = IngestionPipeline([PipelineStage("fetch", 2), PipelineStage("process", 1)], queue_size=8)
+        discarded = []
+
+        async def fetch(item):
+            return item
+
+        async def process(item):
+            await asyncio.sleep(0.01)
+            raise ValueError(f"cannot process {item}")
+
+        with pytest.raises(ValueError, match="cannot process"):
+            await pipeline.run(range(6), {"fetch": fetch, "process": process}, on_discard=lambda stage, item: discarded.append(item))
+
+        stats = pipeline.stats
+        assert (stats.active_runs, stats.failed_runs) == (0, 1)
+        assert discarded and all(stage.queue_depth == 0 for stage in stats.stages)
@@ -0,0 +1,82 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.application.services.ingestion_queue_worker import IngestionQueueWorker
+from app.domain.entities.dataset_metadata import DatasetMetadata
+from app.domain.entities.dataset_supporting_document_queue import DatasetSupportingDocumentQueue
+from app.domain.entities.ingestion_lease import IngestionLease
+from app.infrastructure.data_access.session import Base
+
+
+class FakeEmbeddingService:
+
+    def __init__(self, calls, failing, gate):
+        self._calls = calls
+        self._failing = failing
+        self._gate = gate
+
+    async def process_dataset_heavy_lifting(self, dataset_metadata_id: int) -> bool:
+        self._calls.append(dataset_metadata_id)
+        await self._gate.wait()
+
+        return dataset_metadata_id not in self._failing
+
+
+class TestIngestionQueueWorker:
+
+    @pytest_asyncio.fixture
+    async def session_factory(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'queue.db'}")
+
+        async with engine.begin() as conn:
+            await conn.run_sync(lambda c: Base.metadata.create_all(
+                c, tables=[DatasetMetadata.__table__, DatasetSupportingDocumentQueue.__table__]
+            ))
+
+        factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+        async with factory() as session:
+            session.add_all([
+                DatasetSupportingDocumentQueue(dataset_metadata_id=i, created_at=datetime.utcnow()) for i in range(1, 4)
+            ])
+            await session.commit()
+
+        yield factory
+
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_run_once_bounds_concurrency_and_backs_off_failures(self, session_factory):
+        calls, gate = [], asyncio.Event()
+
+        async def service_factory(uow):
+            return FakeEmbeddingService(calls, failing={2}, gate=gate)
+
+        worker = IngestionQueueWorker(session_factory, service_factory, concurrency=2, lease_seconds=60, owner="worker-a")
+        await worker.initialize()
+
+        assert await worker.run_once() == 2
+        assert await worker.run_once() == 0
+
+        gate.set()
+        await asyncio.gather(*list(worker._in_flight.values()))
+
+        async with session_factory() as session:
+            flags = dict((await session.execute(select(
+                DatasetSupportingDocumentQueue.dataset_metadata_id, DatasetSupportingDocumentQueue.is_processing
+            ))).all())
+            leases = (await session.execute(select(IngestionLease))).scalars().all()
+
+        assert sorted(calls) == [1, 2]
+        assert flags == {1: False, 2: True, 3: False}
+        assert [(l.dataset_supporting_document_queue_id, l.owner) for l in leases] == [(2, "worker-a")]
+        assert (worker.stats.succeeded, worker.stats.failed, worker.stats.in_flight) == (1, 1, 0)
+        # The fake service never marks rows processed, so 1 and 3 are claimable; the failed 2 is still leased
+        assert await worker.run_once() == 2
+        assert sorted(worker._in_flight) == [1, 3]
+        await worker.stop()
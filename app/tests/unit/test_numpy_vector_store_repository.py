@@ -0,0 +1,272 @@
+import os
+import shutil
+
+import pytest
+
+from app.domain.exceptions.search_exception import VectorStoreException
+from app.infrastructure.repositories.numpy_vector_store_repository import NumpyVectorStoreRepository
+
+
+class TestData:
+    """Centralized test data for NumpyVectorStoreRepository tests."""
+    VECTOR_SIZE = 4
+    IDENTIFIER_1 = "ds-1"
+    IDENTIFIER_2 = "ds-2"
+    QUERY = [1.0, 0.0, 0.0, 0.0]
+
+
+class TestNumpyVectorStoreRepository:
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+
+        return NumpyVectorStoreRepository(str(tmp_path), vector_size=TestData.VECTOR_SIZE)
+
+    @staticmethod
+    async def _seed(repository):
+        await repository.index_embeddings_batch(
+            TestData.IDENTIFIER_1,
+            "document",
+            [[1.0, 0.1, 0.0, 0.0], [0.6, 0.8, 0.0, 0.0]],
+            [
+                {"identifier": TestData.IDENTIFIER_1, "content_type": "document", "text": "a", "chunk_index": 0, "file_extension": ".pdf"},
+                {"identifier": TestData.IDENTIFIER_1, "content_type": "document", "text": "b", "chunk_index": 1, "file_extension": ".docx"},
+            ],
+        )
+        await repository.index_embedding(TestData.IDENTIFIER_2, "title", "Soil", [0.9, 0.0, 0.4, 0.0])
+
+    @pytest.mark.asyncio
+    async def test_search_similar_orders_by_cosine_score(self, repository):
+        await self._seed(repository)
+
+        results = await repository.search_similar(TestData.QUERY, limit=3)
+
+        assert [r.text for r in results] == ["a", "Soil", "b"]
+        assert results[0].score == pytest.approx(1 / (1.01 ** 0.5), abs=1e-5)
+        assert [r.text for r in await repository.search_similar(TestData.QUERY, limit=1, offset=1)] == ["Soil"]
+
+    @pytest.mark.asyncio
+    async def test_search_applies_filters_and_min_score(self, repository):
+        await self._seed(repository)
+
+        by_type = await repository.search_similar(TestData.QUERY, content_types=["Title"])
+        by_extension = await repository.search_similar(TestData.QUERY, file_extensions=[".docx"])
+        above_threshold = await repository.search_similar(TestData.QUERY, min_score=0.9)
+
+        assert [r.identifier for r in by_type] == [TestData.IDENTIFIER_2]
+        assert [r.text for r in by_extension] == ["b"]
+        assert [r.text for r in above_threshold] == ["a", "Soil"]
+
+    @pytest.mark.asyncio
+    async def test_search_grouped_keeps_best_chunk_per_identifier(self, repository):
+        await self._seed(repository)
+
+        results = await repository.search_grouped(TestData.QUERY, limit=10)
+
+        assert [(r.identifier, r.text) for r in results] == [(TestData.IDENTIFIER_1, "a"), (TestData.IDENTIFIER_2, "Soil")]
+
+        with pytest.raises(NotImplementedError):
+            await repository.search_grouped(TestData.QUERY, group_by="content_type")
+
+    @pytest.mark.asyncio
+    async def test_reindexing_a_point_replaces_the_old_row(self, repository):
+        await self._seed(repository)
+
+        await repository.index_embedding(TestData.IDENTIFIER_2, "title", "Soil carbon", [0.0, 0.0, 0.0, 1.0])
+
+        results = await repository.search_similar([0.0, 0.0, 0.0, 1.0], content_types=["title"])
+
+        assert [r.text for r in results] == ["Soil carbon"]
+        assert repository.live_count == 3
+
+    @pytest.mark.asyncio
+    async def test_delete_embeddings_compacts_and_survives_reload(self, tmp_path, repository):
+        await self._seed(repository)
+
+        await repository.delete_embeddings(TestData.IDENTIFIER_1)
+
+        # Two of three rows are dead, past the default compaction ratio
+        assert repository.row_count == repository.live_count == 1
+
+        reopened = NumpyVectorStoreRepository(str(tmp_path), vector_size=TestData.VECTOR_SIZE)
+        results = await reopened.search_similar(TestData.QUERY)
+
+        assert [r.identifier for r in results] == [TestData.IDENTIFIER_2]
+
+    @pytest.mark.asyncio
+    async def test_tombstones_persist_without_compaction(self, tmp_path):
+        repository = NumpyVectorStoreRepository(str(tmp_path), vector_size=TestData.VECTOR_SIZE, compaction_ratio=1.0)
+        await self._seed(repository)
+        await repository.delete_embeddings(TestData.IDENTIFIER_2)
+
+        reopened = NumpyVectorStoreRepository(str(tmp_path), vector_size=TestData.VECTOR_SIZE)
+        results = await reopened.search_similar(TestData.QUERY)
+
+        assert {r.identifier for r in results} == {TestData.IDENTIFIER_1}
+        assert await reopened.compact() == 1
+        assert reopened.row_count == 2
+
+    @pytest.mark.asyncio
+    async def test_searches_during_compaction_see_the_previous_rows(self, tmp_path):
+        repository = NumpyVectorStoreRepository(str(tmp_path), vector_size=TestData.VECTOR_SIZE, compaction_ratio=1.0)
+        await self._seed(repository)
+        await repository.delete_embeddings(TestData.IDENTIFIER_2)
+        before = [r.text for r in await repository.search_similar(TestData.QUERY)]
+
+        # Files are rewritten but the new state is not installed yet, as while compaction runs in its thread
+        state = repository._compact()
+        during = [r.text for r in await repository.search_similar(TestData.QUERY)]
+        repository._install(state)
+        after = [r.text for r in await repository.search_similar(TestData.QUERY)]
+
+        assert before == during == after == ["a", "b"]
+        assert repository.row_count == 2
+
+    @pytest.mark.asyncio
+    async def test_compaction_switches_generation_and_ignores_an_interrupted_one(self, tmp_path):
+        repository = NumpyVectorStoreRepository(str(tmp_path), vector_size=TestData.VECTOR_SIZE, compaction_ratio=1.0)
+        await self._seed(repository)
+        await repository.delete_embeddings(TestData.IDENTIFIER_2)
+        await repository.compact()
+
+        # A compaction that crashed before switching CURRENT leaves a partial generation behind
+        os.makedirs(tmp_path / "gen-000003")
+        (tmp_path / "gen-000003" / NumpyVectorStoreRepository.VECTORS_FILE).write_bytes(b"partial")
+
+        reopened = NumpyVectorStoreRepository(str(tmp_path), vector_size=TestData.VECTOR_SIZE)
+        results = await reopened.search_similar(TestData.QUERY)
+
+        assert (tmp_path / NumpyVectorStoreRepository.CURRENT_FILE).read_text() == "gen-000002"
+        assert sorted(p.name for p in tmp_path.iterdir() if p.name.startswith("gen-")) == ["gen-000002"]
+        assert [r.text for r in results] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_store_written_before_generations_moves_into_one_on_compaction(self, tmp_path):
+        repository = NumpyVectorStoreRepository(str(tmp_path), vector_size=TestData.VECTOR_SIZE, compaction_ratio=1.0)
+        await self._seed(repository)
+        await repository.delete_embeddings(TestData.IDENTIFIER_2)
+        await repository.close()
+
+        # Lay the files out as before generations: data files directly in the data directory
+        for path in (tmp_path / "gen-000001").iterdir():
+            shutil.move(str(path), str(tmp_path / path.name))
+        (tmp_path / "gen-000001").rmdir()
+        (tmp_path / NumpyVectorStoreRepository.CURRENT_FILE).unlink()
+
+        legacy = NumpyVectorStoreRepository(str(tmp_path), vector_size=TestData.VECTOR_SIZE)
+
+        assert [r.text for r in await legacy.search_similar(TestData.QUERY)] == ["a", "b"]
+        assert await legacy.compact() == 1
+        assert not (tmp_path / NumpyVectorStoreRepository.VECTORS_FILE).exists()
+        assert [r.text for r in await legacy.search_similar(TestData.QUERY)] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_store_created_with_other_dimensions(self, tmp_path, repository):
+        await self._seed(repository)
+
+        mismatched = NumpyVectorStoreRepository(str(tmp_path), vector_size=8)
+
+        with pytest.raises(VectorStoreException):
+            await mismatched.search_similar([0.0] * 8)
+
+    @staticmethod
+    def _chunk(text: str, version: str, occurrence: int = 0) -> dict:
+
+        return {
+            "identifier": TestData.IDENTIFIER_1,
+            "content_type": "document",
+            "text": text,
+            "source_file": "a.pdf",
+            "content_hash": f"hash-{text}",
+            "content_occurrence": occurrence,
+            "dataset_version": version,
+            "staged": True,
+        }
+
+    @pytest.mark.asyncio
+    async def test_dataset_versions_stay_hidden_until_committed(self, tmp_path):
+        repository = NumpyVectorStoreRepository(str(tmp_path), vector_size=TestData.VECTOR_SIZE, compaction_ratio=1.0)
+        v1 = [self._chunk("a", "v1"), self._chunk("b", "v1")]
+        await repository.index_embeddings_batch(TestData.IDENTIFIER_1, "document", [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]], v1)
+
+        assert await repository.search_similar(TestData.QUERY) == []
+
+        await repository.commit_dataset_version(TestData.IDENTIFIER_1, "v1", [])
+        v2 = [self._chunk("a", "v2"), self._chunk("c", "v2")]
+        assert await repository.find_indexed_chunks(TestData.IDENTIFIER_1, "document", v2) == [True, False]
+
+        await repository.index_embeddings_batch(TestData.IDENTIFIER_1, "document", [[0.0, 0.0, 1.0, 0.0]], v2[1:])
+
+        assert {r.text for r in await repository.search_similar(TestData.QUERY)} == {"a", "b"}
+
+        await repository.commit_dataset_version(TestData.IDENTIFIER_1, "v2", [{**v2[0], "chunk_index": 0}])
+
+        reopened = NumpyVectorStoreRepository(str(tmp_path), vector_size=TestData.VECTOR_SIZE)
+        results = await reopened.search_similar(TestData.QUERY)
+
+        assert {r.text for r in results} == {"a", "c"}
+        assert {r.metadata["dataset_version"] for r in results} == {"v2"}
+        assert reopened.live_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_archive_keeps_chunks_of_its_previous_download(self, repository):
+        url = "https://example.com/a.zip"
+        old = {**self._chunk("a", "v1"), "archive_hash": "old", "archive_url": url}
+        await repository.index_embeddings_batch(TestData.IDENTIFIER_1, "document", [[1.0, 0.0, 0.0, 0.0]], [old])
+        await repository.commit_dataset_version(TestData.IDENTIFIER_1, "v1", [])
+        staged = [
+            {**self._chunk("b", "v2"), "archive_hash": "new", "archive_url": url},
+            {**self._chunk("c", "v2"), "archive_hash": "other"},
+        ]
+        await repository.index_embeddings_batch(TestData.IDENTIFIER_1, "document", [[0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0]], staged)
+
+        assert await repository.find_archive_hash(TestData.IDENTIFIER_1, url) == "old"
+
+        await repository.discard_dataset_version(TestData.IDENTIFIER_1, "v2", ["new"])
+        await repository.commit_dataset_version(TestData.IDENTIFIER_1, "v2", [], ["old"])
+
+        assert {r.text for r in await repository.search_similar(TestData.QUERY)} == {"a", "c"}
+
+    @pytest.mark.asyncio
+    async def test_delete_stale_chunks_keeps_current_and_staged_text(self, repository):
+        old = {**self._chunk("old", None), "content_type": "title", "staged": False}
+        new = {**self._chunk("new", None), "content_type": "title", "staged": False}
+        staged = {**self._chunk("next", "v2"), "content_type": "title"}
+        vectors = [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0]]
+        await repository.index_embeddings_batch(TestData.IDENTIFIER_1, "title", vectors, [old, new, staged])
+
+        await repository.delete_stale_chunks(TestData.IDENTIFIER_1, "title", ["hash-new"])
+
+        assert [r.text for r in await repository.search_similar(TestData.QUERY)] == ["new"]
+        assert repository.live_count == 2
+
+    @pytest.mark.asyncio
+    async def test_commit_dataset_version_publishes_one_snapshot(self, tmp_path):
+        repository = NumpyVectorStoreRepository(str(tmp_path), vector_size=TestData.VECTOR_SIZE, compaction_ratio=1.0)
+        await repository.index_embeddings_batch(TestData.IDENTIFIER_1, "document", [[1.0, 0.0, 0.0, 0.0]], [self._chunk("a", "v1")])
+        await repository.commit_dataset_version(TestData.IDENTIFIER_1, "v1", [])
+        await repository.index_embeddings_batch(TestData.IDENTIFIER_1, "document", [[0.0, 1.0, 0.0, 0.0]], [self._chunk("b", "v2")])
+        published = []
+        publish = repository._publish
+
+        def record():
+            publish()
+            vectors, alive, payloads, columns = repository._snapshot
+            published.append({payloads[row]["text"] for row in range(len(payloads)) if alive[row] and not payloads[row].get("staged")})
+
+        repository._publish = record
+
+        await repository.commit_dataset_version(TestData.IDENTIFIER_1, "v2", [])
+
+        assert published == [{"b"}]
+
+    @pytest.mark.asyncio
+    async def test_discard_dataset_version_keeps_committed_chunks(self, repository):
+        await repository.index_embeddings_batch(TestData.IDENTIFIER_1, "document", [[1.0, 0.0, 0.0, 0.0]], [self._chunk("a", "v1")])
+        await repository.commit_dataset_version(TestData.IDENTIFIER_1, "v1", [])
+        await repository.index_embeddings_batch(TestData.IDENTIFIER_1, "document", [[0.0, 1.0, 0.0, 0.0]], [self._chunk("b", "v2")])
+
+        await repository.discard_dataset_version(TestData.IDENTIFIER_1, "v2")
+
+        assert [r.text for r in await repository.search_similar(TestData.QUERY)] == ["a"]
+        assert repository.live_count == 1
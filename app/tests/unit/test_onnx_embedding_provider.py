@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.infrastructure.providers.onnx_embedding_provider import OnnxEmbeddingProvider, OnnxSentenceEncoder
+
+
+class FakeTokenizer:
+    """Whitespace tokenizer padding each batch to its longest text, like tokenizers.Tokenizer with padding."""
+
+    def enable_truncation(self, max_length):
+        self.max_length = max_length
+
+    def enable_padding(self):
+        pass
+
+    def encode_batch(self, texts):
+        tokens = [t.split()[: self.max_length] for t in texts]
+        width = max(len(t) for t in tokens)
+
+        return [
+            SimpleNamespace(
+                ids=[len(w) for w in t] + [0] * (width - len(t)),
+                attention_mask=[1] * len(t) + [0] * (width - len(t)),
+                type_ids=[0] * width,
+            )
+            for t in tokens
+        ]
+
+
+class FakeSession:
+    """Returns token embeddings [id, 1]; padding positions get a large value that pooling must ignore."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_inputs(self):
+        return [SimpleNamespace(name="input_ids"), SimpleNamespace(name="attention_mask")]
+
+    def run(self, output_names, inputs):
+        self.calls.append(inputs)
+        ids = inputs["input_ids"].astype(np.float32)
+        padding = inputs["attention_mask"] == 0
+
+        return [np.stack([np.where(padding, 1000.0, ids), np.ones_like(ids)], axis=-1)]
+
+
+class TestOnnxSentenceEncoder:
+
+    @pytest.fixture
+    def session(self):
+        return FakeSession()
+
+    @pytest.fixture
+    def encoder(self, session):
+        return OnnxSentenceEncoder(session, FakeTokenizer(), max_length=3)
+
+    def test_mean_pools_over_real_tokens_and_normalizes(self, encoder):
+        embeddings = encoder.encode(["ab abcd", "a bb ccc dddd"])
+
+        # Means: [3, 1] for the first text, [2, 1] for the second (truncated to three tokens)
+        expected = np.array([[3.0, 1.0], [2.0, 1.0]])
+        expected /= np.linalg.norm(expected, axis=1, keepdims=True)
+        np.testing.assert_allclose(embeddings, expected, rtol=1e-6)
+
+    def test_feeds_only_inputs_the_model_declares(self, encoder, session):
+        encoder.encode(["soil carbon"])
+
+        assert set(session.calls[0]) == {"input_ids", "attention_mask"}
+        assert session.calls[0]["input_ids"].dtype == np.int64
+
+    def test_splits_batches_and_keeps_single_text_shape(self, encoder, session):
+        batch = encoder.encode(["a", "bb", "ccc"], batch_size=2)
+        single = encoder.encode("bb")
+
+        assert batch.shape == (3, 2)
+        assert single.shape == (2,)
+        assert len(session.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_provider_returns_lists(self, encoder):
+        provider = OnnxEmbeddingProvider(encoder)
+
+        assert len(await provider.generate_embedding("soil")) == 2
+        assert len(await provider.generate_embeddings(["soil", "water"])) == 2
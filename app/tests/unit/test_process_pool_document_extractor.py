@@ -0,0 +1,69 @@
+import time
+
+import pytest
+
+from app.domain.exceptions.ingestion_exception import DocumentExtractionException
+from app.infrastructure.providers.process_pool_document_extractor import ProcessPoolDocumentExtractor
+
+
+class UpperCaseExtractor:
+    """Picklable stand-in for a document extractor; b"hang" parses forever, b"fail" raises."""
+
+    def extract_text(self, file_content: bytes) -> str:
+
+        if file_content == b"hang":
+            time.sleep(60)
+
+        if file_content == b"fail":
+            raise ValueError("corrupt document")
+
+        return file_content.decode().upper()
+
+    def iter_segments(self, file_content: bytes):
+
+        yield from self.extract_text(file_content).split()
+
+
+class TestProcessPoolDocumentExtractor:
+
+    @pytest.mark.asyncio
+    async def test_extracts_text_in_worker_processes(self):
+        extractor = ProcessPoolDocumentExtractor({".pdf": UpperCaseExtractor()}, workers=2)
+
+        try:
+            texts = [await extractor.extract_text(".pdf", content) for content in (b"soil", b"ozone")]
+            segments = await extractor.extract_segments(".pdf", b"page one page two")
+
+        finally:
+            await extractor.close()
+
+        assert texts == ["SOIL", "OZONE"]
+        assert segments == ["PAGE", "ONE", "PAGE", "TWO"]
+        assert extractor.supports(".pdf") and not extractor.supports(".txt")
+        assert extractor.stats.extracted == 3
+
+    @pytest.mark.asyncio
+    async def test_runaway_parse_is_killed_and_pool_recovers(self):
+        extractor = ProcessPoolDocumentExtractor({".pdf": UpperCaseExtractor()}, workers=1, timeout_seconds=5)
+
+        try:
+            # Warm up the pool so spawning the worker does not count against the short timeout below
+            await extractor.extract_text(".pdf", b"warm")
+            extractor._timeout_seconds = 0.5
+
+            with pytest.raises(DocumentExtractionException, match="longer than 0.5s"):
+                await extractor.extract_text(".pdf", b"hang")
+
+            extractor._timeout_seconds = 5
+            recovered = await extractor.extract_text(".pdf", b"river")
+
+            with pytest.raises(DocumentExtractionException, match="corrupt document"):
+                await extractor.extract_text(".pdf", b"fail")
+
+        finally:
+            await extractor.close()
+
+        assert recovered == "RIVER"
+        assert extractor.stats.timed_out == 1
+        assert extractor.stats.pool_restarts == 1
+        assert extractor.stats.failed == 1
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from app.domain.exceptions.search_exception import EmbeddingGenerationException
+from app.infrastructure.providers.process_pool_embedding_provider import ProcessPoolEmbeddingProvider
+
+
+class FakeModel:
+    """Encodes a text as [length, first code point, 0, ...] so results are checkable across processes."""
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+
+    def encode(self, texts, batch_size, convert_to_numpy, show_progress_bar):
+        embeddings = np.zeros((len(texts), self.dimension), dtype=np.float32)
+
+        for i, text in enumerate(texts):
+            embeddings[i, 0] = len(text)
+            embeddings[i, 1] = ord(text[0]) if text else 0
+
+        return embeddings
+
+
+def load_fake_model(model_name: str, threads: int) -> FakeModel:
+    return FakeModel(int(model_name))
+
+
+class TestData:
+    """Centralized test data for ProcessPoolEmbeddingProvider tests."""
+    DIMENSION = 4
+    TEXTS = ["soil", "rivière", "", "ozone layer", "日本"]
+
+
+class TestProcessPoolEmbeddingProvider:
+
+    @pytest.mark.asyncio
+    async def test_embeddings_round_trip_through_shared_memory_in_order(self):
+        provider = ProcessPoolEmbeddingProvider(
+            str(TestData.DIMENSION), dimension=TestData.DIMENSION, workers=2, slice_size=2, model_loader=load_fake_model
+        )
+
+        try:
+            embeddings = await provider.generate_embeddings(TestData.TEXTS)
+            single = await provider.generate_embedding("x")
+
+        finally:
+            await provider.close()
+
+        assert [e[0] for e in embeddings] == [float(len(t)) for t in TestData.TEXTS]
+        assert [e[1] for e in embeddings] == [float(ord(t[0])) if t else 0.0 for t in TestData.TEXTS]
+        assert all(len(e) == TestData.DIMENSION for e in embeddings)
+        assert single == [1.0, float(ord("x")), 0.0, 0.0]
+
+    @pytest.mark.asyncio
+    async def test_dimension_mismatch_raises_embedding_exception(self):
+        provider = ProcessPoolEmbeddingProvider("8", dimension=TestData.DIMENSION, workers=1, model_loader=load_fake_model)
+
+        try:
+            with pytest.raises(EmbeddingGenerationException):
+                await provider.generate_embeddings(["soil"])
+
+        finally:
+            await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_empty_input_skips_the_pool(self):
+        provider = ProcessPoolEmbeddingProvider("4", workers=1, model_loader=load_fake_model)
+
+        assert await provider.generate_embeddings([]) == []
+        assert provider._pool is None
@@ -0,0 +1,27 @@
+import pytest
+
+from app.infrastructure.repositories.qdrant_collection_profile import QdrantCollectionProfile
+
+
+class TestQdrantCollectionProfile:
+
+    def test_named_applies_only_given_overrides(self):
+        profile = QdrantCollectionProfile.named("binary", oversampling=None, hnsw_ef=128)
+
+        assert profile.quantization == "binary"
+        assert profile.oversampling == 4.0
+        assert profile.search_params().hnsw_ef == 128
+
+    def test_float_profile_leaves_qdrant_defaults(self):
+        profile = QdrantCollectionProfile.named("float")
+
+        assert profile.quantization_config() is None
+        assert profile.hnsw_config() is None
+        assert profile.search_params() is None
+
+    def test_rejects_unknown_profiles(self):
+        with pytest.raises(ValueError):
+            QdrantCollectionProfile.named("pq")
+
+        with pytest.raises(ValueError):
+            QdrantCollectionProfile(quantization="int4")
@@ -1,7 +1,11 @@
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from app.infrastructure.repositories.qdrant_vectore_store_repository import QdrantVectorStoreRepository
 from app.domain.exceptions.search_exception import VectorStoreException
+from app.infrastructure.repositories.qdrant_collection_profile import QdrantCollectionProfile
+from app.infrastructure.repositories.point_ids import make_point_id
 
 class TestData:
     """Centralized test data for Qdrant Repository tests."""
@@ -32,9 +36,17 @@ class TestQdrantVectorStoreRepository:
             client = mock.return_value
             client.get_collections = AsyncMock()
             client.create_collection = AsyncMock()
+            client.get_collection = AsyncMock(return_value=MagicMock(payload_schema={}))
+            client.create_payload_index = AsyncMock()
+            client.update_collection = AsyncMock(return_value=True)
+            client.delete_collection = AsyncMock(return_value=True)
             client.query_points = AsyncMock()
+            client.query_points_groups = AsyncMock()
             client.upsert = AsyncMock()
             client.delete = AsyncMock()
+            client.retrieve = AsyncMock(return_value=[])
+            client.batch_update_points = AsyncMock()
+            client.close = AsyncMock()
             yield client
 
     @pytest.fixture
@@ -65,6 +77,104 @@ class TestQdrantVectorStoreRepository:
         mock_qdrant_client.create_collection.assert_not_called()
         assert repository._collection_ready is True
 
+    @pytest.mark.asyncio
+    async def test_concurrent_first_searches_bootstrap_collection_once(self, repository, mock_qdrant_client):
+        mock_qdrant_client.get_collections.return_value = MagicMock(collections=[])
+        mock_qdrant_client.query_points.return_value = MagicMock(points=[])
+
+        await asyncio.gather(*(repository.search_similar(query_embedding=TestData.EMBEDDING) for _ in range(5)))
+
+        mock_qdrant_client.get_collections.assert_awaited_once()
+        mock_qdrant_client.create_collection.assert_awaited_once()
+        assert mock_qdrant_client.query_points.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_initialize_wraps_bootstrap_errors_and_retries_later(self, repository, mock_qdrant_client):
+        mock_qdrant_client.get_collections.side_effect = [Exception("Connection refused"), MagicMock(collections=[])]
+
+        with pytest.raises(VectorStoreException):
+            await repository.initialize()
+
+        await repository.initialize()
+        await repository.close()
+
+        assert repository._collection_ready is True
+        mock_qdrant_client.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_ensure_collection_creates_missing_keyword_indexes(self, repository, mock_qdrant_client):
+        mock_qdrant_client.get_collections.return_value = MagicMock(collections=[])
+        mock_qdrant_client.get_collection.return_value = MagicMock(payload_schema={"identifier": MagicMock()})
+
+        await repository._ensure_collection()
+
+        indexed = {c.kwargs["field_name"] for c in mock_qdrant_client.create_payload_index.call_args_list}
+        assert indexed == {"content_type", "source_file", "file_extension", "dataset_version", "archive_hash", "archive_url", "staged"}
+
+    @pytest.mark.asyncio
+    async def test_quantized_profile_configures_collection_and_search(self, mock_qdrant_client):
+        repository = QdrantVectorStoreRepository(
+            collection_name=TestData.COLLECTION,
+            vector_size=1536,
+            profile=QdrantCollectionProfile.named("int8", hnsw_m=32)
+        )
+        mock_qdrant_client.get_collections.return_value = MagicMock(collections=[])
+        mock_qdrant_client.query_points_groups.return_value = MagicMock(groups=[])
+
+        await repository.search_grouped(query_embedding=TestData.EMBEDDING)
+
+        create_kwargs = mock_qdrant_client.create_collection.call_args.kwargs
+        assert create_kwargs["vectors_config"].on_disk is True
+        assert create_kwargs["quantization_config"].scalar.always_ram is True
+        assert create_kwargs["hnsw_config"].m == 32
+        search_params = mock_qdrant_client.query_points_groups.call_args.kwargs["search_params"]
+        assert search_params.quantization.rescore is True
+        assert search_params.quantization.oversampling == 2.0
+
+    @pytest.mark.asyncio
+    async def test_default_profile_sends_no_search_params(self, repository, mock_qdrant_client):
+        mock_qdrant_client.query_points.return_value = MagicMock(points=[])
+
+        await repository.search_similar(query_embedding=TestData.EMBEDDING)
+
+        assert mock_qdrant_client.query_points.call_args.kwargs["search_params"] is None
+
+    @pytest.mark.asyncio
+    async def test_apply_profile_updates_existing_collection_in_place(self, repository, mock_qdrant_client):
+        mock_qdrant_client.get_collections.return_value = MagicMock(collections=[])
+
+        assert await repository.apply_profile() is True
+
+        kwargs = mock_qdrant_client.update_collection.call_args.kwargs
+        assert kwargs["collection_name"] == TestData.COLLECTION
+        assert kwargs["vectors_config"][""].on_disk is False
+        assert kwargs["quantization_config"] == "Disabled"
+
+    @pytest.mark.asyncio
+    async def test_drop_collection_deletes_it_and_bootstraps_again_on_next_use(self, repository, mock_qdrant_client):
+        mock_qdrant_client.get_collections.return_value = MagicMock(collections=[])
+        await repository.initialize()
+
+        assert await repository.drop_collection() is True
+        mock_qdrant_client.delete_collection.assert_called_once_with(collection_name=TestData.COLLECTION)
+
+        await repository.initialize()
+        assert mock_qdrant_client.create_collection.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_similar_pushes_content_filters_to_qdrant(self, repository, mock_qdrant_client):
+        mock_qdrant_client.query_points.return_value = MagicMock(points=[])
+
+        await repository.search_similar(
+            query_embedding=TestData.EMBEDDING,
+            content_types=["title"],
+            file_extensions=[".pdf"]
+        )
+
+        _, kwargs = mock_qdrant_client.query_points.call_args
+        conditions = {c.key: c.match.any for c in kwargs["query_filter"].must}
+        assert conditions == {"content_type": ["title"], "file_extension": [".pdf"]}
+
     @pytest.mark.asyncio
     async def test_search_similar_returns_mapped_results(self, repository, mock_qdrant_client):
         mock_point = TestData.create_mock_point(TestData.IDENTIFIER, TestData.SCORE, TestData.TEXT)
@@ -79,6 +189,20 @@ class TestQdrantVectorStoreRepository:
         assert results[0].score == TestData.SCORE
         assert results[0].text == TestData.TEXT
 
+    @pytest.mark.asyncio
+    async def test_search_grouped_returns_best_hit_per_group(self, repository, mock_qdrant_client):
+        mock_group = MagicMock()
+        mock_group.hits = [TestData.create_mock_point(TestData.IDENTIFIER, TestData.SCORE, TestData.TEXT)]
+        mock_qdrant_client.query_points_groups.return_value = MagicMock(groups=[mock_group])
+
+        results = await repository.search_grouped(query_embedding=TestData.EMBEDDING, limit=5, min_score=0.5)
+
+        assert [r.identifier for r in results] == [TestData.IDENTIFIER]
+        _, kwargs = mock_qdrant_client.query_points_groups.call_args
+        assert kwargs["group_by"] == "identifier"
+        assert kwargs["group_size"] == 1
+        assert kwargs["limit"] == 5
+
     @pytest.mark.asyncio
     async def test_index_embedding_calls_upsert_with_payload(self, repository, mock_qdrant_client):
         success = await repository.index_embedding(
@@ -103,6 +227,28 @@ class TestQdrantVectorStoreRepository:
         # Verify the filter is targeting the correct identifier
         assert "identifier" in str(kwargs["points_selector"])
 
+    @pytest.mark.asyncio
+    async def test_commit_dataset_version_deletes_older_versions_then_publishes_in_one_call(self, repository, mock_qdrant_client):
+        retained = {"identifier": TestData.IDENTIFIER, "content_type": "document", "content_hash": "h", "chunk_index": 3}
+
+        await repository.commit_dataset_version(TestData.IDENTIFIER, "v2", [retained])
+
+        mock_qdrant_client.batch_update_points.assert_awaited_once()
+        retag, delete, publish = mock_qdrant_client.batch_update_points.call_args.kwargs["update_operations"]
+        assert retag.set_payload.payload == {**retained, "dataset_version": "v2", "staged": False}
+        assert publish.set_payload.payload == {"staged": False}
+        assert [c.match.value for c in publish.set_payload.filter.must] == [TestData.IDENTIFIER, "v2"]
+        assert [c.match.value for c in delete.delete.filter.must_not] == ["v2"]
+
+    @pytest.mark.asyncio
+    async def test_find_indexed_chunks_maps_existing_points(self, repository, mock_qdrant_client):
+        payloads = [{"content_hash": "a", "source_file": "x"}, {"content_hash": "b", "source_file": "x"}]
+        point_ids = [make_point_id(TestData.IDENTIFIER, "document", p) for p in payloads]
+        mock_qdrant_client.retrieve.return_value = [MagicMock(id=point_ids[1])]
+
+        assert await repository.find_indexed_chunks(TestData.IDENTIFIER, "document", payloads) == [False, True]
+        assert mock_qdrant_client.retrieve.call_args.kwargs["ids"] == point_ids
+
     @pytest.mark.asyncio
     async def test_search_similar_raises_vector_store_exception_on_client_error(self, repository, mock_qdrant_client):
         mock_qdrant_client.query_points.side_effect = Exception("Connection error")
@@ -0,0 +1,27 @@
+import pytest
+
+from app.domain.value_objects.search_cursor import SearchCursor
+from app.domain.value_objects.search_result import SearchResult
+
+
+class TestSearchCursor:
+
+    def test_encode_decode_round_trip(self):
+        cursor = SearchCursor(fingerprint="abc", chunk_offset=120, emitted=40, last_score=0.71, tied_identifiers=["ds-1"])
+
+        assert SearchCursor.decode(cursor.encode()) == cursor
+
+    def test_advance_tracks_identifiers_tied_at_last_score(self):
+        cursor = SearchCursor(fingerprint="abc", last_score=0.8, tied_identifiers=["ds-1"])
+        page = [SearchResult(identifier="ds-2", score=0.8), SearchResult(identifier="ds-3", score=0.8)]
+
+        advanced = cursor.advance(page, chunk_offset=7)
+
+        assert advanced.chunk_offset == 7
+        assert advanced.emitted == 2
+        assert advanced.tied_identifiers == ["ds-1", "ds-2", "ds-3"]
+
+    @pytest.mark.parametrize("token", ["not-base64!", "e30", "eyJmcCI6MX0"])
+    def test_decode_rejects_malformed_tokens(self, token):
+        with pytest.raises(ValueError):
+            SearchCursor.decode(token)
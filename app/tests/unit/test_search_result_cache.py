@@ -0,0 +1,93 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.domain.value_objects.search_result import SearchResult
+from app.infrastructure.caching.search_result_cache import SearchResultCache
+
+
+class TestData:
+    """Centralized test data for SearchResultCache tests."""
+    QUERY = "River Flow  UK"
+    QUERY_EMBEDDING = [1.0, 0.0, 0.0]
+    MATCHING_EMBEDDING = [0.9, 0.1, 0.0]
+    UNRELATED_EMBEDDING = [0.0, 1.0, 0.0]
+    MIN_SCORE = 0.65
+
+    @staticmethod
+    def create_results(*identifiers: str):
+        return [SearchResult(identifier=i, score=0.9 - idx * 0.1) for idx, i in enumerate(identifiers)]
+
+
+class TestSearchResultCache:
+
+    @pytest.fixture
+    def cache(self):
+        return SearchResultCache(max_size=2, ttl_seconds=60)
+
+    def test_make_key_normalizes_query_and_content_types(self, cache):
+        key_a = cache.make_key(TestData.QUERY, 0.65, ["Title", "document"])
+        key_b = cache.make_key("river flow uk", 0.65, ["document", "title"])
+
+        assert key_a == key_b
+        assert key_a != cache.make_key(TestData.QUERY, 0.7, ["document", "title"])
+
+    def test_get_returns_stored_results_and_counts_hits(self, cache):
+        key = cache.make_key(TestData.QUERY, TestData.MIN_SCORE)
+        results = TestData.create_results("ds-1", "ds-2")
+
+        assert cache.get(key) is None
+        cache.put(key, results, TestData.QUERY_EMBEDDING)
+
+        assert cache.get(key) == results
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_put_evicts_least_recently_used(self, cache):
+        keys = [cache.make_key(q, TestData.MIN_SCORE) for q in ("a", "b", "c")]
+
+        for key in keys:
+            cache.put(key, [], TestData.QUERY_EMBEDDING)
+
+        assert cache.get(keys[0]) is None
+        assert cache.stats.size == 2
+
+    def test_get_expires_entries_after_ttl(self, cache):
+        key = cache.make_key(TestData.QUERY, TestData.MIN_SCORE)
+
+        with patch("app.infrastructure.caching.search_result_cache.time.monotonic", side_effect=[0.0, 120.0]):
+            cache.put(key, TestData.create_results("ds-1"), TestData.QUERY_EMBEDDING)
+
+            assert cache.get(key) is None
+
+    def test_invalidate_identifier_drops_entries_containing_identifier(self, cache):
+        key = cache.make_key(TestData.QUERY, TestData.MIN_SCORE)
+        cache.put(key, TestData.create_results("ds-1", "ds-2"), TestData.QUERY_EMBEDDING)
+
+        removed = cache.invalidate_identifier("ds-2")
+
+        assert removed == 1
+        assert cache.get(key) is None
+
+    def test_invalidate_identifier_drops_entries_new_vectors_would_match(self, cache):
+        key = cache.make_key(TestData.QUERY, TestData.MIN_SCORE)
+        cache.put(key, TestData.create_results("ds-1"), TestData.QUERY_EMBEDDING)
+
+        assert cache.invalidate_identifier("ds-new", "document", [TestData.UNRELATED_EMBEDDING]) == 0
+        assert cache.invalidate_identifier("ds-new", "document", [TestData.MATCHING_EMBEDDING]) == 1
+
+    def test_invalidate_identifier_respects_content_type_filter(self, cache):
+        key = cache.make_key(TestData.QUERY, TestData.MIN_SCORE, ["title"])
+        cache.put(key, TestData.create_results("ds-1"), TestData.QUERY_EMBEDDING)
+
+        removed = cache.invalidate_identifier("ds-new", "document", [TestData.MATCHING_EMBEDDING])
+
+        assert removed == 0
+        assert cache.get(key) is not None
+
+    def test_invalidate_identifier_drops_hybrid_entries_on_any_matching_ingest(self, cache):
+        key = cache.make_key(TestData.QUERY, TestData.MIN_SCORE, mode="hybrid")
+        cache.put(key, TestData.create_results("ds-1"), TestData.QUERY_EMBEDDING)
+
+        assert key != cache.make_key(TestData.QUERY, TestData.MIN_SCORE)
+        assert cache.invalidate_identifier("ds-new", "document", [TestData.UNRELATED_EMBEDDING]) == 1
@@ -1,6 +1,10 @@
+import asyncio
+import hashlib
+
 import pytest
 from unittest.mock import AsyncMock, Mock, MagicMock
 from app.application.services.semantic_search_service import SemanticSearchService
+from app.domain.value_objects.dataset_index_version import DatasetIndexVersion
 from app.domain.value_objects.search_result import SearchQuery, SearchResult
 from app.domain.exceptions.search_exception import (
     EmbeddingGenerationException,
@@ -8,9 +12,13 @@ from app.domain.exceptions.search_exception import (
     VectorStoreException
 )
 from app.contracts.providers.i_embedding_provider import IEmbeddingProvider
+from app.contracts.providers.i_reranker_provider import IRerankerProvider
+from app.contracts.repositories.i_lexical_index_repository import ILexicalIndexRepository
 from app.contracts.repositories.i_vector_store_repository import IVectorStoreRepository
 from app.infrastructure.data_access.repository_wrapper import RepositoryWrapper
 from app.domain.entities.dataset_metadata import DatasetMetadata
+from app.infrastructure.caching.dataset_metadata_cache import DatasetMetadataCache
+from app.infrastructure.caching.search_result_cache import SearchResultCache
 
 class TestData:
     """Centralized test data for SemanticSearchService tests."""
@@ -48,9 +56,13 @@ class TestSemanticSearchService:
     def mock_vector_store(self):
         store = Mock(spec=IVectorStoreRepository)
         store.search_similar = AsyncMock()
+        store.search_grouped = AsyncMock(side_effect=NotImplementedError)
         store.index_embedding = AsyncMock()
         store.index_embeddings_batch = AsyncMock()
         store.delete_embeddings = AsyncMock()
+        store.find_indexed_chunks = AsyncMock(side_effect=lambda identifier, content_type, payloads: [False] * len(payloads))
+        store.commit_dataset_version = AsyncMock(return_value=True)
+        store.discard_dataset_version = AsyncMock(return_value=True)
         return store
 
     @pytest.fixture
@@ -71,6 +83,56 @@ class TestSemanticSearchService:
             batch_size=2
         )
 
+    @pytest.fixture
+    def mock_lexical_index(self):
+        index = Mock(spec=ILexicalIndexRepository)
+        index.index_texts = AsyncMock(return_value=True)
+        index.search = AsyncMock(return_value=[])
+        index.delete = AsyncMock(return_value=True)
+        return index
+
+    @pytest.fixture
+    def hybrid_service(self, mock_embedding_provider, mock_vector_store, mock_repository_wrapper, mock_lexical_index):
+        return SemanticSearchService(
+            embedding_provider=mock_embedding_provider,
+            vector_store_repository=mock_vector_store,
+            repository_wrapper=mock_repository_wrapper,
+            batch_size=2,
+            lexical_index=mock_lexical_index
+        )
+
+    @pytest.fixture
+    def mock_reranker(self):
+        reranker = Mock(spec=IRerankerProvider)
+        reranker.score = AsyncMock()
+        return reranker
+
+    @pytest.fixture
+    def rerank_service(self, mock_embedding_provider, mock_vector_store, mock_repository_wrapper, mock_reranker, result_cache):
+        return SemanticSearchService(
+            embedding_provider=mock_embedding_provider,
+            vector_store_repository=mock_vector_store,
+            repository_wrapper=mock_repository_wrapper,
+            result_cache=result_cache,
+            reranker=mock_reranker,
+            rerank_window=2,
+            rerank_budget_seconds=0.05
+        )
+
+    @pytest.fixture
+    def result_cache(self):
+        return SearchResultCache(max_size=10, ttl_seconds=60)
+
+    @pytest.fixture
+    def cached_service(self, mock_embedding_provider, mock_vector_store, mock_repository_wrapper, result_cache):
+        return SemanticSearchService(
+            embedding_provider=mock_embedding_provider,
+            vector_store_repository=mock_vector_store,
+            repository_wrapper=mock_repository_wrapper,
+            batch_size=2,
+            result_cache=result_cache
+        )
+
     @pytest.mark.asyncio
     async def test_perform_semantic_context_with_threshold_filtering(self, service, mock_embedding_provider, mock_vector_store, mock_repository_wrapper):
         # Arrange: User requests a strict threshold of 0.85
@@ -97,7 +159,9 @@ class TestSemanticSearchService:
         mock_vector_store.search_similar.assert_called_once_with(
             TestData.EMBEDDING,
             limit=service.DEFAULT_LIMIT,
-            min_score=0.85
+            min_score=0.85,
+            content_types=None,
+            file_extensions=None
         )
 
     @pytest.mark.asyncio
@@ -114,7 +178,9 @@ class TestSemanticSearchService:
         mock_vector_store.search_similar.assert_called_once_with(
             TestData.EMBEDDING,
             limit=service.DEFAULT_LIMIT,
-            min_score=service.DEFAULT_MIN_SCORE
+            min_score=service.DEFAULT_MIN_SCORE,
+            content_types=None,
+            file_extensions=None
         )
 
     @pytest.mark.asyncio
@@ -133,13 +199,14 @@ class TestSemanticSearchService:
 
     @pytest.mark.asyncio
     async def test_ingest_text_metadata_calls_single_index(self, service, mock_embedding_provider, mock_vector_store):
-        mock_embedding_provider.generate_embedding.return_value = TestData.EMBEDDING
+        mock_embedding_provider.generate_embeddings.return_value = [TestData.EMBEDDING]
         mock_vector_store.index_embedding.return_value = True
 
         success = await service.ingest_text(identifier=TestData.IDENTIFIER_1, content_type="title", text="Test Title")
 
         assert success is True
-        mock_embedding_provider.generate_embedding.assert_called_once_with("Test Title")
+        mock_embedding_provider.generate_embeddings.assert_called_once_with(["Test Title"])
+        mock_embedding_provider.generate_embedding.assert_not_called()
         mock_vector_store.index_embedding.assert_called_once()
 
     @pytest.mark.asyncio
@@ -162,3 +229,445 @@ class TestSemanticSearchService:
 
         assert success is True
         mock_vector_store.delete_embeddings.assert_called_once_with(TestData.IDENTIFIER_1)
+
+    @pytest.mark.asyncio
+    async def test_perform_semantic_context_serves_later_pages_from_result_cache(self, cached_service, mock_embedding_provider, mock_vector_store, mock_repository_wrapper):
+        mock_embedding_provider.generate_embedding.return_value = TestData.EMBEDDING
+        mock_vector_store.search_similar.return_value = [
+            TestData.create_mock_result(TestData.IDENTIFIER_1, 0.9),
+            TestData.create_mock_result(TestData.IDENTIFIER_2, 0.8),
+        ]
+        mock_db_result = MagicMock()
+        mock_db_result.scalars.return_value.all.return_value = []
+        mock_repository_wrapper.dataset_metadata.session.execute.return_value = mock_db_result
+
+        first_page = await cached_service.perform_semantic_context(SearchQuery(query_text=TestData.QUERY_TEXT, limit=1, offset=0))
+        second_page = await cached_service.perform_semantic_context(SearchQuery(query_text=TestData.QUERY_TEXT, limit=1, offset=1))
+
+        assert first_page.results[0].identifier == TestData.IDENTIFIER_1
+        assert second_page.results[0].identifier == TestData.IDENTIFIER_2
+        assert second_page.total_count == 2
+        mock_embedding_provider.generate_embedding.assert_awaited_once()
+        mock_vector_store.search_similar.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_ingest_and_delete_invalidate_cached_results(self, cached_service, result_cache, mock_embedding_provider, mock_vector_store):
+        key = result_cache.make_key(TestData.QUERY_TEXT, cached_service.DEFAULT_MIN_SCORE)
+        result_cache.put(key, [TestData.create_mock_result(TestData.IDENTIFIER_1, 0.9)], TestData.EMBEDDING)
+        mock_embedding_provider.generate_embeddings.return_value = [[-0.1] * 1536]
+        mock_vector_store.delete_embeddings.return_value = True
+
+        await cached_service.ingest_text(identifier=TestData.IDENTIFIER_2, content_type="title", text="Unrelated")
+        assert result_cache.get(key) is not None
+
+        await cached_service.delete_embeddings(TestData.IDENTIFIER_1)
+        assert result_cache.get(key) is None
+
+    @pytest.mark.asyncio
+    async def test_ingest_text_with_dataset_version_embeds_only_changed_chunks(self, service, mock_embedding_provider, mock_vector_store):
+        text = "Unchanged paragraph. " * 30 + "\n\n" + "Edited paragraph. " * 30
+        mock_vector_store.find_indexed_chunks.side_effect = lambda identifier, content_type, payloads: [True] + [False] * (len(payloads) - 1)
+        mock_embedding_provider.generate_embeddings.side_effect = lambda texts: [TestData.EMBEDDING] * len(texts)
+        dataset_version = DatasetIndexVersion.start(TestData.IDENTIFIER_1)
+
+        await service.ingest_text(TestData.IDENTIFIER_1, "document", text, source_file="a.pdf", dataset_version=dataset_version)
+
+        _, payloads = mock_vector_store.find_indexed_chunks.call_args.args[1:]
+        embedded = [t for call in mock_embedding_provider.generate_embeddings.call_args_list for t in call.args[0]]
+        assert embedded == [p["text"] for p in payloads[1:]]
+        assert dataset_version.retained_payloads == payloads[:1]
+        progress = dataset_version.progress
+        assert (progress.chunks_unchanged, progress.chunks_embedded, progress.points_upserted) == (1, len(payloads) - 1, len(payloads) - 1)
+        assert all(p["staged"] and p["dataset_version"] == dataset_version.version for p in payloads)
+        assert payloads[0]["content_hash"] == hashlib.sha256(payloads[0]["text"].encode()).hexdigest()
+
+    @pytest.mark.asyncio
+    async def test_iter_document_chunks_prepares_a_long_document_window_by_window(self, hybrid_service, mock_vector_store, mock_lexical_index):
+        pages = [f"Page {n} of the station handbook. " + "Repeated boilerplate line.\n" * 40 for n in range(10)]
+
+        windows = [
+            pending
+            async for pending in hybrid_service.iter_document_chunks(TestData.IDENTIFIER_1, iter(pages), source_file="a.pdf")
+        ]
+
+        assert len(windows) > 1
+        payloads = [chunk.payload for window in windows for chunk in window]
+        assert [p["chunk_index"] for p in payloads] == list(range(len(payloads)))
+        # A chunk repeated across windows still gets a distinct occurrence, so its points do not collide
+        keys = [(p["content_hash"], p["content_occurrence"]) for p in payloads]
+        assert len(set(keys)) == len(keys)
+        assert mock_vector_store.find_indexed_chunks.await_count == len(windows)
+        starts = [c.args[3] for c in mock_lexical_index.index_texts.await_args_list]
+        assert starts == [sum(len(w) for w in windows[:i]) for i in range(len(windows))]
+
+    @pytest.mark.asyncio
+    async def test_commit_dataset_version_invalidates_cached_results(self, cached_service, result_cache, mock_vector_store):
+        key = result_cache.make_key(TestData.QUERY_TEXT, cached_service.DEFAULT_MIN_SCORE)
+        result_cache.put(key, [TestData.create_mock_result(TestData.IDENTIFIER_1, 0.9)], TestData.EMBEDDING)
+        dataset_version = DatasetIndexVersion.start(TestData.IDENTIFIER_1)
+
+        await cached_service.commit_dataset_version(dataset_version)
+
+        mock_vector_store.commit_dataset_version.assert_awaited_once_with(TestData.IDENTIFIER_1, dataset_version.version, [], [])
+        assert result_cache.get(key) is None
+
+    @pytest.mark.asyncio
+    async def test_commit_dataset_version_invalidates_searches_the_new_chunks_would_match(self, cached_service, result_cache, mock_embedding_provider):
+        # A cached search that did not return the dataset, but whose query the committed chunks now match
+        key = result_cache.make_key(TestData.QUERY_TEXT, cached_service.DEFAULT_MIN_SCORE)
+        result_cache.put(key, [TestData.create_mock_result(TestData.IDENTIFIER_2, 0.9)], TestData.EMBEDDING)
+        mock_embedding_provider.generate_embeddings.return_value = [TestData.EMBEDDING]
+        dataset_version = DatasetIndexVersion.start(TestData.IDENTIFIER_1)
+
+        await cached_service.ingest_text(TestData.IDENTIFIER_1, "document", "Short text", source_file="a.pdf", dataset_version=dataset_version)
+
+        assert result_cache.get(key) is not None
+
+        await cached_service.commit_dataset_version(dataset_version)
+
+        assert result_cache.get(key) is None
+        assert dataset_version.staged_embeddings == {}
+
+    @pytest.mark.asyncio
+    async def test_commit_dataset_version_drops_failed_archive_and_keeps_its_previous_chunks(self, service, mock_vector_store):
+        mock_vector_store.find_archive_hash = AsyncMock(return_value="old")
+        dataset_version = DatasetIndexVersion.start(TestData.IDENTIFIER_1)
+        kept = {"content_type": "document", "archive_hash": "good"}
+        dataset_version.retained_payloads.extend([kept, {"content_type": "document", "archive_hash": "new"}])
+
+        await service.fail_archive(dataset_version, "https://example.com/a.zip", "new")
+        await service.fail_archive(dataset_version, "https://example.com/a.zip", "new")
+        await service.commit_dataset_version(dataset_version)
+
+        assert dataset_version.progress.archives_failed == 1
+        mock_vector_store.find_archive_hash.assert_awaited_once_with(TestData.IDENTIFIER_1, "https://example.com/a.zip")
+        mock_vector_store.discard_dataset_version.assert_awaited_once_with(TestData.IDENTIFIER_1, dataset_version.version, ["new"])
+        mock_vector_store.commit_dataset_version.assert_awaited_once_with(TestData.IDENTIFIER_1, dataset_version.version, [kept], ["old"])
+
+    @pytest.mark.asyncio
+    async def test_ingest_text_deletes_the_replaced_title_outside_a_dataset_version(self, service, mock_embedding_provider, mock_vector_store):
+        mock_embedding_provider.generate_embeddings.return_value = [TestData.EMBEDDING]
+
+        await service.ingest_text(TestData.IDENTIFIER_1, "title", "New title")
+        await service.ingest_text(TestData.IDENTIFIER_1, "title", "New title", dataset_version=DatasetIndexVersion.start(TestData.IDENTIFIER_1))
+
+        mock_vector_store.delete_stale_chunks.assert_awaited_once_with(
+            TestData.IDENTIFIER_1, "title", [hashlib.sha256(b"New title").hexdigest()]
+        )
+
+    @pytest.mark.asyncio
+    async def test_perform_semantic_context_uses_server_side_grouping_when_supported(self, service, mock_embedding_provider, mock_vector_store, mock_repository_wrapper):
+        mock_embedding_provider.generate_embedding.return_value = TestData.EMBEDDING
+        mock_vector_store.search_grouped = AsyncMock(return_value=[
+            TestData.create_mock_result(TestData.IDENTIFIER_1, 0.9),
+            TestData.create_mock_result(TestData.IDENTIFIER_2, 0.8),
+        ])
+        mock_db_result = MagicMock()
+        mock_db_result.scalars.return_value.all.return_value = []
+        mock_repository_wrapper.dataset_metadata.session.execute.return_value = mock_db_result
+
+        response = await service.perform_semantic_context(SearchQuery(query_text=TestData.QUERY_TEXT, limit=1))
+
+        assert response.total_count == 2
+        assert [r.identifier for r in response.results] == [TestData.IDENTIFIER_1]
+        mock_vector_store.search_grouped.assert_awaited_once_with(
+            TestData.EMBEDDING,
+            group_by="identifier",
+            limit=service.DEFAULT_GROUP_LIMIT,
+            min_score=service.DEFAULT_MIN_SCORE,
+            content_types=None,
+            file_extensions=None
+        )
+        mock_vector_store.search_similar.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_perform_semantic_context_passes_normalized_filters_to_store(self, service, mock_embedding_provider, mock_vector_store):
+        mock_embedding_provider.generate_embedding.return_value = TestData.EMBEDDING
+        mock_vector_store.search_grouped = AsyncMock(return_value=[])
+        query = SearchQuery(query_text=TestData.QUERY_TEXT, content_types=["Title", " document"], file_extensions=["PDF", ".docx"])
+
+        await service.perform_semantic_context(query)
+
+        _, kwargs = mock_vector_store.search_grouped.call_args
+        assert kwargs["content_types"] == ["document", "title"]
+        assert kwargs["file_extensions"] == [".docx", ".pdf"]
+
+    @pytest.mark.asyncio
+    async def test_ingest_text_document_stores_file_extension(self, service, mock_embedding_provider, mock_vector_store):
+        mock_embedding_provider.generate_embeddings.return_value = [TestData.EMBEDDING]
+
+        await service.ingest_text(identifier=TestData.IDENTIFIER_1, content_type="document", text="Short text", source_file="docs/Report.PDF")
+
+        _, kwargs = mock_vector_store.index_embeddings_batch.call_args
+        assert kwargs["payloads"][0]["file_extension"] == ".pdf"
+
+    @pytest.mark.asyncio
+    async def test_perform_semantic_context_batch_encodes_once_and_resolves_titles_once(self, service, mock_embedding_provider, mock_vector_store, mock_repository_wrapper):
+        mock_embedding_provider.generate_embeddings.return_value = [TestData.EMBEDDING, [0.2] * 1536]
+        mock_vector_store.search_grouped = AsyncMock(side_effect=[
+            [TestData.create_mock_result(TestData.IDENTIFIER_1, 0.9)],
+            [TestData.create_mock_result(TestData.IDENTIFIER_2, 0.7)],
+        ])
+        mock_db_result = MagicMock()
+        mock_db_result.scalars.return_value.all.return_value = [
+            TestData.create_mock_metadata(TestData.IDENTIFIER_1, "First"),
+            TestData.create_mock_metadata(TestData.IDENTIFIER_2, "Second"),
+        ]
+        mock_repository_wrapper.dataset_metadata.session.execute.return_value = mock_db_result
+        queries = [
+            SearchQuery(query_text=TestData.QUERY_TEXT),
+            SearchQuery(query_text="soil carbon", min_score=0.5),
+            SearchQuery(query_text=TestData.QUERY_TEXT.upper()),
+        ]
+
+        responses = await service.perform_semantic_context_batch(queries)
+
+        assert [[r.title for r in resp.results] for resp in responses] == [["First"], ["Second"], ["First"]]
+        assert responses[0].total_count == 1
+        mock_embedding_provider.generate_embeddings.assert_awaited_once_with([TestData.QUERY_TEXT, "soil carbon"])
+        mock_embedding_provider.generate_embedding.assert_not_called()
+        # Grouped server-side with the same limit as a single search, so both fill the cache alike
+        calls = mock_vector_store.search_grouped.await_args_list
+        assert [c.kwargs["min_score"] for c in calls] == [service.DEFAULT_MIN_SCORE, 0.5]
+        assert {c.kwargs["limit"] for c in calls} == {service.DEFAULT_GROUP_LIMIT}
+        mock_repository_wrapper.dataset_metadata.session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_perform_semantic_context_batch_serves_cached_queries_without_encoding(self, cached_service, result_cache, mock_embedding_provider, mock_vector_store, mock_repository_wrapper):
+        key = result_cache.make_key(TestData.QUERY_TEXT, cached_service.DEFAULT_MIN_SCORE)
+        result_cache.put(key, [TestData.create_mock_result(TestData.IDENTIFIER_1, 0.9)], TestData.EMBEDDING)
+        mock_db_result = MagicMock()
+        mock_db_result.scalars.return_value.all.return_value = []
+        mock_repository_wrapper.dataset_metadata.session.execute.return_value = mock_db_result
+
+        responses = await cached_service.perform_semantic_context_batch([SearchQuery(query_text=TestData.QUERY_TEXT)])
+
+        assert responses[0].results[0].identifier == TestData.IDENTIFIER_1
+        mock_embedding_provider.generate_embeddings.assert_not_called()
+        mock_vector_store.search_grouped.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_perform_semantic_context_batch_rejects_empty_query(self, service):
+        with pytest.raises(InvalidSearchQueryException):
+            await service.perform_semantic_context_batch([SearchQuery(query_text=TestData.QUERY_TEXT), SearchQuery(query_text=" ")])
+
+    @pytest.mark.asyncio
+    async def test_perform_semantic_context_hybrid_fuses_vector_and_lexical_rankings(self, hybrid_service, mock_embedding_provider, mock_vector_store, mock_lexical_index, mock_repository_wrapper):
+        mock_embedding_provider.generate_embedding.return_value = TestData.EMBEDDING
+        mock_vector_store.search_similar.return_value = [
+            TestData.create_mock_result(TestData.IDENTIFIER_1, 0.9),
+            TestData.create_mock_result(TestData.IDENTIFIER_2, 0.7),
+        ]
+        mock_lexical_index.search.return_value = [
+            TestData.create_mock_result(TestData.IDENTIFIER_2, 12.0),
+            TestData.create_mock_result("ds-3", 4.0),
+        ]
+        mock_db_result = MagicMock()
+        mock_db_result.scalars.return_value.all.return_value = []
+        mock_repository_wrapper.dataset_metadata.session.execute.return_value = mock_db_result
+
+        response = await hybrid_service.perform_semantic_context(SearchQuery(query_text=TestData.QUERY_TEXT, mode="hybrid"))
+
+        assert [r.identifier for r in response.results] == [TestData.IDENTIFIER_2, TestData.IDENTIFIER_1, "ds-3"]
+        assert 0.0 < response.results[-1].score < response.results[0].score <= 1.0
+        assert {"embedding", "vector", "lexical", "fusion", "metadata", "total"} <= set(response.timings)
+        mock_lexical_index.search.assert_awaited_once_with(
+            TestData.QUERY_TEXT,
+            limit=hybrid_service.DEFAULT_LEXICAL_LIMIT,
+            content_types=None,
+            file_extensions=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_perform_semantic_context_vector_mode_skips_lexical_index(self, hybrid_service, mock_embedding_provider, mock_vector_store, mock_lexical_index):
+        mock_embedding_provider.generate_embedding.return_value = TestData.EMBEDDING
+        mock_vector_store.search_similar.return_value = []
+
+        response = await hybrid_service.perform_semantic_context(SearchQuery(query_text=TestData.QUERY_TEXT))
+
+        assert response.total_count == 0
+        assert "lexical" not in response.timings
+        mock_lexical_index.search.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_perform_semantic_context_hybrid_requires_lexical_index(self, service):
+        with pytest.raises(InvalidSearchQueryException):
+            await service.perform_semantic_context(SearchQuery(query_text=TestData.QUERY_TEXT, mode="hybrid"))
+
+    @pytest.mark.asyncio
+    async def test_ingest_and_delete_keep_lexical_index_in_sync(self, hybrid_service, mock_embedding_provider, mock_lexical_index):
+        mock_embedding_provider.generate_embedding.return_value = TestData.EMBEDDING
+        mock_embedding_provider.generate_embeddings.return_value = [TestData.EMBEDDING]
+
+        await hybrid_service.ingest_text(identifier=TestData.IDENTIFIER_1, content_type="title", text="Station CHIMN")
+        await hybrid_service.ingest_text(identifier=TestData.IDENTIFIER_1, content_type="document", text="Short text", source_file="a.pdf")
+        await hybrid_service.delete_embeddings(TestData.IDENTIFIER_1)
+
+        mock_lexical_index.index_texts.assert_any_await(TestData.IDENTIFIER_1, "title", ["Station CHIMN"], 0, None, "metadata")
+        mock_lexical_index.index_texts.assert_any_await(TestData.IDENTIFIER_1, "document", ["Short text"], 0, ".pdf", "a.pdf")
+        mock_lexical_index.delete.assert_awaited_once_with(TestData.IDENTIFIER_1)
+
+    @pytest.mark.asyncio
+    async def test_perform_semantic_context_rerank_reorders_top_window_only(self, rerank_service, mock_embedding_provider, mock_vector_store, mock_reranker, mock_repository_wrapper):
+        mock_embedding_provider.generate_embedding.return_value = TestData.EMBEDDING
+        mock_vector_store.search_similar.return_value = [
+            TestData.create_mock_result(TestData.IDENTIFIER_1, 0.9),
+            TestData.create_mock_result(TestData.IDENTIFIER_2, 0.8),
+            TestData.create_mock_result("ds-3", 0.7),
+        ]
+        mock_reranker.score.return_value = [0.1, 0.95]
+        mock_db_result = MagicMock()
+        mock_db_result.scalars.return_value.all.return_value = []
+        mock_repository_wrapper.dataset_metadata.session.execute.return_value = mock_db_result
+
+        response = await rerank_service.perform_semantic_context(SearchQuery(query_text=TestData.QUERY_TEXT, rerank=True))
+
+        assert [r.identifier for r in response.results] == [TestData.IDENTIFIER_2, TestData.IDENTIFIER_1, "ds-3"]
+        assert "rerank" in response.timings
+        mock_reranker.score.assert_awaited_once_with(
+            TestData.QUERY_TEXT,
+            [f"Sample content for {TestData.IDENTIFIER_1}", f"Sample content for {TestData.IDENTIFIER_2}"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_perform_semantic_context_rerank_falls_back_to_vector_order_on_budget(self, rerank_service, result_cache, mock_embedding_provider, mock_vector_store, mock_reranker, mock_repository_wrapper):
+        async def slow_score(query, passages):
+            await asyncio.sleep(1)
+            return [1.0, 0.0]
+
+        mock_embedding_provider.generate_embedding.return_value = TestData.EMBEDDING
+        mock_vector_store.search_similar.return_value = [
+            TestData.create_mock_result(TestData.IDENTIFIER_1, 0.9),
+            TestData.create_mock_result(TestData.IDENTIFIER_2, 0.8),
+        ]
+        mock_reranker.score.side_effect = slow_score
+        mock_db_result = MagicMock()
+        mock_db_result.scalars.return_value.all.return_value = []
+        mock_repository_wrapper.dataset_metadata.session.execute.return_value = mock_db_result
+
+        response = await rerank_service.perform_semantic_context(SearchQuery(query_text=TestData.QUERY_TEXT, rerank=True, limit=1))
+        next_page = await rerank_service.perform_semantic_context(SearchQuery(query_text=TestData.QUERY_TEXT, rerank=True, limit=1, offset=1))
+
+        # The fallback order is cached, so the next page continues it instead of being re-ranked differently
+        assert [r.identifier for r in response.results + next_page.results] == [TestData.IDENTIFIER_1, TestData.IDENTIFIER_2]
+        assert result_cache.stats.size == 1
+        assert mock_reranker.score.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_perform_semantic_context_rerank_requires_reranker(self, service):
+        with pytest.raises(InvalidSearchQueryException):
+            await service.perform_semantic_context(SearchQuery(query_text=TestData.QUERY_TEXT, rerank=True))
+
+    @pytest.mark.asyncio
+    async def test_perform_semantic_context_resolves_titles_from_metadata_cache(self, mock_embedding_provider, mock_vector_store, mock_repository_wrapper):
+        metadata_cache = DatasetMetadataCache(session_factory=Mock())
+        metadata_cache.note_title(TestData.IDENTIFIER_1, "Cached title")
+        service = SemanticSearchService(
+            embedding_provider=mock_embedding_provider,
+            vector_store_repository=mock_vector_store,
+            repository_wrapper=mock_repository_wrapper,
+            metadata_cache=metadata_cache
+        )
+        mock_embedding_provider.generate_embedding.return_value = TestData.EMBEDDING
+        mock_vector_store.search_similar.return_value = [
+            TestData.create_mock_result(TestData.IDENTIFIER_1, 0.9),
+            TestData.create_mock_result(TestData.IDENTIFIER_2, 0.8),
+        ]
+
+        metadata_cache.load_missing = AsyncMock(return_value={})
+
+        response = await service.perform_semantic_context(SearchQuery(query_text=TestData.QUERY_TEXT))
+
+        assert [r.title for r in response.results] == ["Cached title", "Untitled Dataset"]
+        # Only the miss goes to the database, through the cache rather than the request session
+        metadata_cache.load_missing.assert_awaited_once_with({TestData.IDENTIFIER_2})
+        mock_repository_wrapper.dataset_metadata.session.execute.assert_not_called()
+        assert metadata_cache.stats.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_perform_semantic_context_cursor_pages_past_first_window(self, service, mock_embedding_provider, mock_vector_store, mock_repository_wrapper):
+        stream = [
+            TestData.create_mock_result("ds-a", 0.9),
+            TestData.create_mock_result("ds-b", 0.8),
+            TestData.create_mock_result("ds-a", 0.7),
+            TestData.create_mock_result("ds-c", 0.6),
+            TestData.create_mock_result("ds-d", 0.5),
+        ]
+        service.DEFAULT_LIMIT = 3
+        mock_embedding_provider.generate_embedding.return_value = TestData.EMBEDDING
+        mock_vector_store.search_similar.side_effect = lambda *args, limit, offset=0, **kwargs: stream[offset : offset + limit]
+        mock_vector_store.search_grouped = AsyncMock(return_value=[stream[0], stream[3], stream[4]])
+        mock_db_result = MagicMock()
+        mock_db_result.scalars.return_value.all.return_value = []
+        mock_repository_wrapper.dataset_metadata.session.execute.return_value = mock_db_result
+
+        first = await service.perform_semantic_context(SearchQuery(query_text=TestData.QUERY_TEXT, limit=2, cursor=""))
+        second = await service.perform_semantic_context(SearchQuery(query_text=TestData.QUERY_TEXT, limit=2, cursor=first.next_cursor))
+        third = await service.perform_semantic_context(SearchQuery(query_text=TestData.QUERY_TEXT, limit=2, cursor=second.next_cursor))
+
+        assert [r.identifier for r in first.results] == ["ds-a", "ds-b"]
+        assert [r.identifier for r in second.results] == ["ds-c", "ds-d"]
+        assert second.total_count == 4
+        assert third.results == [] and third.next_cursor is None
+        _, kwargs = mock_vector_store.search_grouped.call_args
+        assert kwargs["identifiers"] == ["ds-a", "ds-c", "ds-d"]
+
+    @pytest.mark.asyncio
+    async def test_perform_semantic_context_rejects_cursor_from_other_query(self, service, mock_embedding_provider, mock_vector_store, mock_repository_wrapper):
+        mock_embedding_provider.generate_embedding.return_value = TestData.EMBEDDING
+        mock_vector_store.search_similar.return_value = [TestData.create_mock_result(TestData.IDENTIFIER_1, 0.9)]
+        mock_db_result = MagicMock()
+        mock_db_result.scalars.return_value.all.return_value = []
+        mock_repository_wrapper.dataset_metadata.session.execute.return_value = mock_db_result
+        first = await service.perform_semantic_context(SearchQuery(query_text=TestData.QUERY_TEXT, limit=1, cursor=""))
+
+        with pytest.raises(InvalidSearchQueryException):
+            await service.perform_semantic_context(SearchQuery(query_text="soil carbon", limit=1, cursor=first.next_cursor))
+
+    @pytest.mark.asyncio
+    async def test_open_semantic_stream_resolves_titles_before_the_request_session_closes(self, service, mock_embedding_provider, mock_vector_store, mock_repository_wrapper):
+        mock_embedding_provider.generate_embedding.return_value = TestData.EMBEDDING
+        mock_vector_store.search_similar.return_value = [
+            TestData.create_mock_result(TestData.IDENTIFIER_1, 0.9),
+            TestData.create_mock_result(TestData.IDENTIFIER_2, 0.8),
+        ]
+        mock_db_result = MagicMock()
+        mock_db_result.scalars.return_value.all.return_value = [TestData.create_mock_metadata(TestData.IDENTIFIER_2, "Second")]
+        mock_repository_wrapper.dataset_metadata.session.execute.return_value = mock_db_result
+
+        header, items = await service.open_semantic_stream(SearchQuery(query_text=TestData.QUERY_TEXT, limit=10))
+        # The response body runs after the request-scoped session is closed
+        mock_repository_wrapper.dataset_metadata.session.execute.side_effect = RuntimeError("session closed")
+
+        assert header.total_count == 2
+        assert "retrieval" in header.timings
+        assert [(i.identifier, i.title) async for i in items] == [(TestData.IDENTIFIER_1, "Untitled Dataset"), (TestData.IDENTIFIER_2, "Second")]
+
+    @pytest.mark.asyncio
+    async def test_open_semantic_stream_resolves_titles_lazily_through_metadata_cache(self, mock_embedding_provider, mock_vector_store, mock_repository_wrapper):
+        metadata_cache = DatasetMetadataCache(session_factory=Mock())
+        metadata_cache.note_title(TestData.IDENTIFIER_1, "Cached title")
+        metadata_cache.load_missing = AsyncMock(return_value={})
+        service = SemanticSearchService(
+            embedding_provider=mock_embedding_provider,
+            vector_store_repository=mock_vector_store,
+            repository_wrapper=mock_repository_wrapper,
+            metadata_cache=metadata_cache
+        )
+        mock_embedding_provider.generate_embedding.return_value = TestData.EMBEDDING
+        mock_vector_store.search_similar.return_value = [
+            TestData.create_mock_result(TestData.IDENTIFIER_1, 0.9),
+            TestData.create_mock_result(TestData.IDENTIFIER_2, 0.8),
+        ]
+
+        header, items = await service.open_semantic_stream(SearchQuery(query_text=TestData.QUERY_TEXT, limit=10))
+
+        metadata_cache.load_missing.assert_not_awaited()
+        assert [(i.identifier, i.title) async for i in items] == [(TestData.IDENTIFIER_1, "Cached title"), (TestData.IDENTIFIER_2, "Untitled Dataset")]
+        metadata_cache.load_missing.assert_awaited_once_with({TestData.IDENTIFIER_2})
+        mock_repository_wrapper.dataset_metadata.session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_open_semantic_stream_raises_before_streaming_on_invalid_query(self, service):
+        with pytest.raises(InvalidSearchQueryException):
+            await service.open_semantic_stream(SearchQuery(query_text=" "))
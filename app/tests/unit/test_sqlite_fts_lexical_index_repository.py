@@ -0,0 +1,114 @@
+import aiosqlite
+import pytest
+import pytest_asyncio
+
+from app.infrastructure.repositories.sqlite_fts_lexical_index_repository import SqliteFtsLexicalIndexRepository
+
+
+class TestData:
+    """Centralized test data for SqliteFtsLexicalIndexRepository tests."""
+    IDENTIFIER_1 = "ds-1"
+    IDENTIFIER_2 = "ds-2"
+    TITLE_1 = "COSMOS-UK soil moisture at station CHIMN"
+    TITLE_2 = "River flow measurements in the Thames basin"
+
+
+class TestSqliteFtsLexicalIndexRepository:
+
+    @pytest_asyncio.fixture
+    async def repository(self, tmp_path):
+        repository = SqliteFtsLexicalIndexRepository(db_path=str(tmp_path / "lexical.db"))
+        yield repository
+        await repository.close()
+
+    def test_build_match_expression_quotes_tokens(self):
+        match = SqliteFtsLexicalIndexRepository.build_match_expression('ECN-123 "soil" AND ecn')
+
+        assert match == '"ecn" OR "123" OR "soil" OR "and"'
+        assert SqliteFtsLexicalIndexRepository.build_match_expression("  -- ") is None
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_exact_term_matches(self, repository):
+        await repository.index_texts(TestData.IDENTIFIER_1, "title", [TestData.TITLE_1])
+        await repository.index_texts(TestData.IDENTIFIER_2, "title", [TestData.TITLE_2])
+
+        results = await repository.search("CHIMN station")
+
+        assert [r.identifier for r in results] == [TestData.IDENTIFIER_1]
+        assert results[0].content_type == "title"
+
+    @pytest.mark.asyncio
+    async def test_index_texts_replaces_existing_chunk(self, repository):
+        await repository.index_texts(TestData.IDENTIFIER_1, "title", [TestData.TITLE_1])
+        await repository.index_texts(TestData.IDENTIFIER_1, "title", [TestData.TITLE_2])
+
+        assert await repository.search("CHIMN") == []
+        assert [r.identifier for r in await repository.search("Thames")] == [TestData.IDENTIFIER_1]
+
+    @pytest.mark.asyncio
+    async def test_search_applies_content_type_and_extension_filters(self, repository):
+        await repository.index_texts(TestData.IDENTIFIER_1, "title", [TestData.TITLE_1])
+        await repository.index_texts(TestData.IDENTIFIER_2, "document", ["Soil moisture probe manual"], file_extension=".pdf")
+
+        documents = await repository.search("soil", content_types=["document"])
+        pdfs = await repository.search("soil", file_extensions=[".pdf"])
+        docx = await repository.search("soil", file_extensions=[".docx"])
+
+        assert [r.identifier for r in documents] == [TestData.IDENTIFIER_2]
+        assert [r.identifier for r in pdfs] == [TestData.IDENTIFIER_2]
+        assert docx == []
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_all_chunks_of_identifier(self, repository):
+        await repository.index_texts(TestData.IDENTIFIER_1, "document", ["soil chunk one", "soil chunk two"])
+        await repository.index_texts(TestData.IDENTIFIER_2, "title", [TestData.TITLE_1])
+
+        await repository.delete(TestData.IDENTIFIER_1)
+
+        assert [r.identifier for r in await repository.search("soil")] == [TestData.IDENTIFIER_2]
+
+    @pytest.mark.asyncio
+    async def test_documents_of_one_dataset_do_not_overwrite_each_other(self, repository):
+        await repository.index_texts(TestData.IDENTIFIER_1, "document", ["soil probe manual"], 0, ".pdf", "manual.pdf")
+        await repository.index_texts(TestData.IDENTIFIER_1, "document", ["river gauge notes"], 0, ".docx", "notes.docx")
+
+        soil = await repository.search("soil")
+        river = await repository.search("river")
+
+        assert [r.metadata["source_file"] for r in soil] == ["manual.pdf"]
+        assert [r.metadata["source_file"] for r in river] == ["notes.docx"]
+
+    @pytest.mark.asyncio
+    async def test_reindexing_a_document_drops_its_old_chunks(self, repository):
+        await repository.index_texts(TestData.IDENTIFIER_1, "document", ["soil one", "soil two", "soil three"], 0, ".pdf", "manual.pdf")
+        await repository.index_texts(TestData.IDENTIFIER_1, "document", ["river gauge notes"], 0, ".docx", "notes.docx")
+
+        await repository.index_texts(TestData.IDENTIFIER_1, "document", ["soil revised"], 0, ".pdf", "manual.pdf")
+
+        assert [r.text for r in await repository.search("soil")] == ["soil revised"]
+        assert [r.text for r in await repository.search("river")] == ["river gauge notes"]
+
+    @pytest.mark.asyncio
+    async def test_legacy_index_keeps_metadata_chunks_and_drops_documents(self, tmp_path):
+        db_path = str(tmp_path / "legacy.db")
+
+        async with aiosqlite.connect(db_path) as conn:
+            await conn.execute(
+                "CREATE TABLE lexical_chunks (id INTEGER PRIMARY KEY, identifier TEXT NOT NULL, "
+                "content_type TEXT NOT NULL, chunk_index INTEGER NOT NULL, file_extension TEXT, "
+                "text TEXT NOT NULL, UNIQUE (identifier, content_type, chunk_index))"
+            )
+            await conn.executemany(
+                "INSERT INTO lexical_chunks (identifier, content_type, chunk_index, text) VALUES (?, ?, 0, ?)",
+                [(TestData.IDENTIFIER_1, "title", TestData.TITLE_1), (TestData.IDENTIFIER_1, "document", "soil manual")],
+            )
+            await conn.commit()
+
+        repository = SqliteFtsLexicalIndexRepository(db_path=db_path)
+
+        try:
+            results = await repository.search("soil")
+        finally:
+            await repository.close()
+
+        assert [(r.content_type, r.text) for r in results] == [("title", TestData.TITLE_1)]
@@ -0,0 +1,192 @@
+import hashlib
+import io
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from app.domain.exceptions.ingestion_exception import ArchiveDownloadException
+from app.infrastructure.caching.archive_disk_cache import ArchiveDiskCache
+from app.infrastructure.providers.zip_downloader import ZipDownloader
+
+
+def build_zip(payload_size: int) -> bytes:
+    buffer = io.BytesIO()
+
+    # Stored, not deflated, so the archive is at least payload_size bytes
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as z:
+        z.writestr("ro-crate-metadata.json", "{}")
+        z.writestr("data.bin", b"x" * payload_size)
+
+    return buffer.getvalue()
+
+
+class StubArchiveServer:
+    """Serves archives over real HTTP with ETags and answers If-None-Match with 304."""
+
+    def __init__(self):
+        self.archives = {}
+        self.responses = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                body, etag = server.archives[self.path]
+
+                if self.headers.get("If-None-Match") == etag:
+                    server.responses.append((self.path, 304))
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+
+                server.responses.append((self.path, 200))
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def publish(self, path: str, body: bytes) -> None:
+        self.archives[path] = (body, f'"{hashlib.sha256(body).hexdigest()[:16]}"')
+
+    def shutdown(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def stub_server():
+    server = StubArchiveServer()
+    yield server
+    server.shutdown()
+
+
+class TestZipDownloader:
+
+    def _downloader(self, handler, **kwargs) -> ZipDownloader:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        return ZipDownloader(client=client, chunk_size=1024, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_download_spools_large_archive_to_disk(self, tmp_path):
+        body = build_zip(64 * 1024)
+        downloader = self._downloader(lambda request: httpx.Response(200, content=body), spool_max_bytes=4096, temp_dir=str(tmp_path))
+
+        archive = await downloader.download("https://example.org/package.zip")
+
+        with archive, archive.open_zip() as z:
+            assert archive.on_disk is True
+            assert archive.size == len(body)
+            assert z.read("data.bin") == b"x" * 64 * 1024
+
+        await downloader.close()
+
+    @pytest.mark.asyncio
+    async def test_download_keeps_small_archive_in_memory(self):
+        body = build_zip(100)
+        downloader = self._downloader(lambda request: httpx.Response(200, content=body))
+
+        archive = await downloader.download("https://example.org/package.zip")
+
+        with archive, archive.open_zip() as z:
+            assert archive.on_disk is False
+            assert z.namelist() == ["ro-crate-metadata.json", "data.bin"]
+
+        await downloader.close()
+
+    @pytest.mark.asyncio
+    async def test_download_rejects_archives_over_the_size_limit(self):
+        body = build_zip(8192)
+
+        async def chunked():
+            for i in range(0, len(body), 1024):
+                yield body[i : i + 1024]
+
+        def handler(request):
+            # A chunked body without Content-Length is only caught while streaming
+            return httpx.Response(200, content=chunked())
+
+        declared = self._downloader(lambda request: httpx.Response(200, content=body), max_bytes=4096)
+        streamed = self._downloader(handler, max_bytes=4096)
+
+        with pytest.raises(ArchiveDownloadException, match="above the 4096 byte limit"):
+            await declared.download("https://example.org/package.zip")
+
+        with pytest.raises(ArchiveDownloadException, match="exceeds the 4096 byte limit"):
+            await streamed.download("https://example.org/package.zip")
+
+    @pytest.mark.asyncio
+    async def test_download_wraps_http_errors(self):
+        downloader = self._downloader(lambda request: httpx.Response(404))
+
+        with pytest.raises(ArchiveDownloadException) as error:
+            await downloader.download("https://example.org/missing.zip")
+
+        assert error.value.status_code == 502
+
+    @pytest.mark.asyncio
+    async def test_cached_archive_is_revalidated_with_a_conditional_request(self, stub_server, tmp_path):
+        stub_server.publish("/a.zip", build_zip(1000))
+        cache = ArchiveDiskCache(str(tmp_path / "archives"), max_bytes=2**20)
+        downloader = ZipDownloader(client=httpx.AsyncClient(trust_env=False), cache=cache)
+        url = stub_server.base_url + "/a.zip"
+
+        try:
+            with await downloader.download(url) as first:
+                assert first.from_cache is False
+
+            with await downloader.download(url) as second, second.open_zip() as z:
+                assert second.from_cache is True
+                assert second.content_hash == first.content_hash
+                assert z.read("data.bin") == b"x" * 1000
+
+            stub_server.publish("/a.zip", build_zip(2000))
+
+            with await downloader.download(url) as changed:
+                assert changed.from_cache is False
+                assert changed.content_hash != first.content_hash
+
+        finally:
+            await downloader.close()
+
+        assert stub_server.responses == [("/a.zip", 200), ("/a.zip", 304), ("/a.zip", 200)]
+        assert cache.stats.revalidated == 1
+        assert cache.stats.stores == 2
+        assert cache.stats.entries == 1
+
+    @pytest.mark.asyncio
+    async def test_archive_cache_evicts_least_recently_used_beyond_budget(self, stub_server, tmp_path):
+        for name in ("a", "b", "c"):
+            stub_server.publish(f"/{name}.zip", build_zip(3000))
+
+        size = len(build_zip(3000))
+        cache = ArchiveDiskCache(str(tmp_path / "archives"), max_bytes=2 * size)
+        downloader = ZipDownloader(client=httpx.AsyncClient(trust_env=False), cache=cache)
+
+        try:
+            for name in ("a", "b", "a", "c", "a", "b"):
+                archive = await downloader.download(f"{stub_server.base_url}/{name}.zip")
+                archive.close()
+
+        finally:
+            await downloader.close()
+
+        # "b" was the least recently used when "c" arrived, so only it had to be fetched again
+        assert stub_server.responses == [
+            ("/a.zip", 200), ("/b.zip", 200), ("/a.zip", 304), ("/c.zip", 200), ("/a.zip", 304), ("/b.zip", 200)
+        ]
+        assert cache.stats.evictions == 2
+        assert cache.stats.size_bytes <= 2 * size